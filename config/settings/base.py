@@ -175,6 +175,47 @@ STATICFILES_FINDERS = [
 # disable all caching - this should set Expires and Cache-Control headers to control downstream
 CACHE_MIDDLEWARE_SECONDS = 0
 
+# https://docs.djangoproject.com/en/dev/ref/settings/#caches
+REDIS_URL = env("REDIS_URL", default="")
+DOCUMENT_HTML_CACHE_MAX_ENTRIES = env.int("DOCUMENT_HTML_CACHE_MAX_ENTRIES", default=200)
+CACHES = {
+    # Shared by every process when REDIS_URL is set, so that a change made in one (eg to the editors roster) is seen by
+    # the others. Without Redis, each process keeps its own.
+    "default": (
+        {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": REDIS_URL,
+        }
+        if REDIS_URL
+        else {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "",
+        }
+    ),
+    # Rendered document HTML, see judgments/utils/html_cache.py. Entries never expire. In Redis, every process shares
+    # them (and sees them invalidated), and Redis evicts the least recently used once it's full, which needs its
+    # maxmemory-policy to be allkeys-lru (see docker-compose.yml). Without Redis, each process keeps its own, and once
+    # one is full its least recently used entry is evicted (culling 1/MAX_ENTRIES of the cache removes exactly one).
+    "document_html": (
+        {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": REDIS_URL,
+            "KEY_PREFIX": "document_html",
+            "TIMEOUT": None,
+        }
+        if REDIS_URL
+        else {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "document_html",
+            "TIMEOUT": None,
+            "OPTIONS": {
+                "MAX_ENTRIES": DOCUMENT_HTML_CACHE_MAX_ENTRIES,
+                "CULL_FREQUENCY": DOCUMENT_HTML_CACHE_MAX_ENTRIES,
+            },
+        }
+    ),
+}
+
 # MEDIA
 # ------------------------------------------------------------------------------
 # https://docs.djangoproject.com/en/dev/ref/settings/#media-root
@@ -329,3 +370,51 @@ CRISPY_TEMPLATE_PACK = "gds"
 JIRA_INSTANCE = env("JIRA_INSTANCE")
 
 EDITORS_GROUP_ID = env("EDITORS_GROUP_ID", default=None)
+
+# How long (in seconds) a fetched document is reused for, so that a page and the action which redirected to it can share
+# a single MarkLogic fetch. See judgments/utils/document_cache.py.
+DOCUMENT_CACHE_TIMEOUT = env.int("DOCUMENT_CACHE_TIMEOUT", default=10)
+
+# Size of the thread pool used to run a page's independent MarkLogic calls side by side. See judgments/utils/fan_out.py.
+FAN_OUT_MAX_WORKERS = env.int("FAN_OUT_MAX_WORKERS", default=8)
+
+# How long (in seconds) the editors roster is cached for. Changes to users and groups clear it; without Redis, only in the
+# process which makes them, so this bounds how long other processes can show a stale roster.
+EDITORS_CACHE_TIMEOUT = env.int("EDITORS_CACHE_TIMEOUT", default=60 * 60)
+
+# How long (in seconds) to remember whether a document exists, eg when looking for a judgment's press summary. Creating or
+# deleting a document through the editor clears it in that process; documents created by ingestion show up after this.
+DOCUMENT_EXISTS_CACHE_TIMEOUT = env.int("DOCUMENT_EXISTS_CACHE_TIMEOUT", default=5 * 60)
+
+# Whether document pages and downloads get ETags, so browsers can revalidate them cheaply. See judgments/utils/etags.py.
+# Working out an ETag costs four small MarkLogic queries, made side by side, and the viewer's groups and flags, on every
+# view including the first, so it's off unless revalidated views are common enough to pay for it.
+# Change DOCUMENT_ETAG_SALT to make browsers refetch every page, eg after a release which changes how pages look.
+DOCUMENT_ETAGS = env.bool("DOCUMENT_ETAGS", default=False)
+DOCUMENT_ETAG_SALT = env("DOCUMENT_ETAG_SALT", default="")
+
+# How long (in seconds) document list search results are reused for. Changes made through the editor clear them in the
+# process which made the change; this bounds how stale other processes' lists can be. See judgments/utils/search_cache.py.
+SEARCH_RESULTS_CACHE_TIMEOUT = env.int("SEARCH_RESULTS_CACHE_TIMEOUT", default=30)
+
+# How long (in seconds) the per-court and per-year counts shown beside a document list are reused for. See
+# judgments/utils/search_facets.py.
+SEARCH_FACETS_CACHE_TIMEOUT = env.int("SEARCH_FACETS_CACHE_TIMEOUT", default=10 * 60)
+
+# Whether lists which aren't searches are served from the local copy of document metadata rather than from MarkLogic.
+# Run the reconcile_document_list_mirror management command before turning this on, and periodically afterwards. See
+# judgments/utils/document_mirror.py.
+DOCUMENT_LIST_MIRROR = env.bool("DOCUMENT_LIST_MIRROR", default=False)
+
+# Whether neutral citation numbers are looked up in a local index: to suggest citations as they're typed into the search
+# box, and to go straight to the document when a search is for its NCN. Run the rebuild_ncn_index management command
+# before turning this on, and periodically afterwards. See judgments/utils/ncn_index.py.
+NCN_INDEX = env.bool("NCN_INDEX", default=False)
+
+# How long (in seconds) the highest parser and enrichment versions are reused for before MarkLogic is asked again. See
+# judgments/utils/target_versions.py.
+TARGET_VERSION_CACHE_TIMEOUT = env.int("TARGET_VERSION_CACHE_TIMEOUT", default=60)
+
+# How long (in seconds) the highlighted snippets of a document's text which matched a search are kept. See
+# judgments/utils/search_snippets.py.
+SEARCH_SNIPPETS_CACHE_TIMEOUT = env.int("SEARCH_SNIPPETS_CACHE_TIMEOUT", default=10 * 60)
@@ -15,16 +15,6 @@ ALLOWED_HOSTS = ["*"]
 if env("TEMPLATE_DEBUG", default=None):
     TEMPLATES[0]["OPTIONS"]["string_if_invalid"] = "{{ %s }}"
 
-# CACHES
-# ------------------------------------------------------------------------------
-# https://docs.djangoproject.com/en/dev/ref/settings/#caches
-CACHES = {
-    "default": {
-        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
-        "LOCATION": "",
-    },
-}
-
 # EMAIL
 # ------------------------------------------------------------------------------
 # https://docs.djangoproject.com/en/dev/ref/settings/#email-backend
@@ -3,7 +3,7 @@ With these settings, tests run faster.
 """
 
 from .base import *  # noqa: F403
-from .base import TEMPLATES
+from .base import CACHES, TEMPLATES
 
 # GENERAL
 # ------------------------------------------------------------------------------
@@ -26,3 +26,11 @@ EMAIL_BACKEND = "django.core.mail.backends.locmem.EmailBackend"
 # ------------------------------------------------------------------------------
 
 TEMPLATES[0]["OPTIONS"]["debug"] = True  # type: ignore[index]
+
+# Every test should see the documents and search results it mocks, not ones cached by an earlier test.
+DOCUMENT_CACHE_TIMEOUT = 0
+SEARCH_RESULTS_CACHE_TIMEOUT = 0
+TARGET_VERSION_CACHE_TIMEOUT = 0
+
+# Nothing cached by one test should leak into the next; tests of caching behaviour override this.
+CACHES = {alias: {"BACKEND": "django.core.cache.backends.dummy.DummyCache"} for alias in CACHES}
@@ -4,6 +4,8 @@ import TabSet from "./components/tabSet";
 import "./components/document_navigation_links";
 import "./components/aside";
 import "./components/form_actions";
+import "./components/document_list";
+import "./components/ncn_typeahead";
 
 (function ($) {
   $.fn.manage_filters = function (options) {
@@ -0,0 +1,53 @@
+// Changing page or filter on the document list only reloads the list itself, rather than the whole page. The view
+// renders just the list when asked for it with the fragment header.
+const FRAGMENT_HEADER = "X-Fragment";
+const FRAGMENT_NAME = "document-list-results";
+
+document.addEventListener("DOMContentLoaded", () => {
+  const container = document.querySelector("[data-document-list-results]");
+  if (!container || !window.fetch || !window.history.pushState) return;
+
+  const load = (url, addToHistory) =>
+    fetch(url, {
+      headers: { [FRAGMENT_HEADER]: FRAGMENT_NAME },
+      credentials: "same-origin",
+    })
+      .then((response) => {
+        if (!response.ok) throw new Error(response.statusText);
+        return response.text();
+      })
+      .then((html) => {
+        container.innerHTML = html;
+        if (addToHistory) window.history.pushState({}, "", url);
+      })
+      .catch(() => {
+        window.location.href = url;
+      });
+
+  container.addEventListener("click", (event) => {
+    const link = event.target.closest("a[href]");
+    if (
+      !link ||
+      event.defaultPrevented ||
+      event.button !== 0 ||
+      event.metaKey ||
+      event.ctrlKey ||
+      event.shiftKey ||
+      event.altKey
+    )
+      return;
+
+    // Only links to another view of this same list, so eg documents and downloads still open as normal.
+    const url = new URL(link.href, window.location.href);
+    if (
+      url.origin !== window.location.origin ||
+      url.pathname !== window.location.pathname
+    )
+      return;
+
+    event.preventDefault();
+    load(url.href, true);
+  });
+
+  window.addEventListener("popstate", () => load(window.location.href, false));
+});
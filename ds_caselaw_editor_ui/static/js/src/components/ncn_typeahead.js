@@ -0,0 +1,35 @@
+// While the search box is set to search by NCN, suggest neutral citations which start with what's been typed so far.
+const DEBOUNCE_MILLISECONDS = 200;
+
+document.addEventListener("DOMContentLoaded", () => {
+  const input = document.querySelector("[data-ncn-typeahead-url]");
+  const ncnFilter = document.getElementById("search-ncn");
+  if (!input || !ncnFilter || !input.list || !window.fetch) return;
+
+  const suggestions = input.list;
+  let timeout;
+
+  const suggest = (citations) => {
+    suggestions.replaceChildren(
+      ...citations.map((citation) => new Option(citation.neutral_citation)),
+    );
+  };
+
+  input.addEventListener("input", () => {
+    clearTimeout(timeout);
+    if (!ncnFilter.checked) {
+      suggest([]);
+      return;
+    }
+
+    const url = new URL(input.dataset.ncnTypeaheadUrl, window.location.href);
+    url.searchParams.set("q", input.value);
+
+    timeout = setTimeout(() => {
+      fetch(url, { credentials: "same-origin" })
+        .then((response) => (response.ok ? response.json() : { results: [] }))
+        .then((data) => suggest(data.results))
+        .catch(() => suggest([]));
+    }, DEBOUNCE_MILLISECONDS);
+  });
+});
@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class JudgmentsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "judgments"
+
+    def ready(self):
+        from judgments import signals  # noqa: F401, PLC0415
+        from judgments.utils import court_tables  # noqa: F401, PLC0415
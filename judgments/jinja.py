@@ -25,6 +25,7 @@ from judgments.templatetags.document_utils import (
 )
 from judgments.templatetags.navigation_tags import get_navigation_items
 from judgments.templatetags.user_permissions import is_developer, is_editor, is_superuser
+from judgments.utils.lazy_context import LazyContext
 
 
 def reversed_filter(value):
@@ -83,6 +84,19 @@ def intcomma(value):
         return value
 
 
+def duration(value):
+    """A `timedelta` to the nearest hour, or minute if it's under an hour."""
+    minutes = round(value.total_seconds() / 60)
+    if minutes < 60:
+        return f"{minutes} minute{'' if minutes == 1 else 's'}"
+
+    days, hours = divmod(round(minutes / 60), 24)
+    parts = [f"{days} day{'' if days == 1 else 's'}"] if days else []
+    if hours:
+        parts.append(f"{hours} hour{'' if hours == 1 else 's'}")
+    return ", ".join(parts)
+
+
 def or_no_data_available_label(value):
     return value if value else "No data available"
 
@@ -109,6 +123,7 @@ def environment(**options):
         ),
         **options,
     )
+    env.context_class = LazyContext
     env.globals.update(
         {
             "static": staticfiles_storage.url,
@@ -132,5 +147,6 @@ def environment(**options):
     env.filters["get_dict_key_with_hyphen"] = get_dict_key_with_hyphen
     env.filters["render_json"] = render_json
     env.filters["intcomma"] = intcomma
+    env.filters["duration"] = duration
     env.filters["or_no_data_available_label"] = or_no_data_available_label
     return env
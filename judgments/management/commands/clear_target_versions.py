@@ -0,0 +1,12 @@
+from django.core.management.base import BaseCommand
+
+from judgments.utils.target_versions import clear_target_versions
+
+
+class Command(BaseCommand):
+    help = "Forget the highest parser and enrichment versions, so they're looked up again. Run this after a release"
+
+    def handle(self, *args, **options):
+        clear_target_versions()
+
+        self.stdout.write("Cleared the target parser and enrichment versions.")
@@ -6,6 +6,7 @@ from caselawclient.types import MarkLogicDocumentURIString
 from django.core.management.base import BaseCommand
 
 from judgments.utils import api_client
+from judgments.utils.target_versions import get_target_enrichment_version, get_target_parser_version
 from judgments.views.reports import get_rows_from_result
 
 if TYPE_CHECKING:
@@ -18,8 +19,8 @@ class Command(BaseCommand):
     help = "Sends the next document in the re-enrichment queue to be enriched"
 
     def handle(self, *args, **options):
-        target_enrichment_version = api_client.get_highest_enrichment_version()
-        target_parser_version = api_client.get_highest_parser_version()
+        target_enrichment_version = get_target_enrichment_version()
+        target_parser_version = get_target_parser_version()
 
         document_details_to_enrich = get_rows_from_result(
             api_client.get_pending_enrichment_for_version(
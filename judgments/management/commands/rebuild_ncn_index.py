@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand
+
+from judgments.utils.document_list import PUBLICATION_STATUS_ALL, DocumentListFilters
+from judgments.utils.ncn_index import rebuild_ncn_index
+from judgments.utils.view_helpers import iter_search_results
+
+
+class Command(BaseCommand):
+    help = "Build the neutral citation index again from the NCN of every document"
+
+    def handle(self, *args, **options):
+        results = iter_search_results(DocumentListFilters(publication_status=PUBLICATION_STATUS_ALL))
+        indexed = rebuild_ncn_index(results)
+
+        self.stdout.write(f"Indexed {indexed} neutral citations.")
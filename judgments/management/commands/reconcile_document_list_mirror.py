@@ -0,0 +1,17 @@
+from django.core.management.base import BaseCommand
+
+from judgments.utils.document_list import PUBLICATION_STATUS_ALL, DocumentListFilters
+from judgments.utils.document_mirror import reconcile_document_list_mirror
+from judgments.utils.view_helpers import iter_search_results
+
+
+class Command(BaseCommand):
+    help = (
+        "Copy the list metadata of every document into the document list mirror, and remove deleted documents from it"
+    )
+
+    def handle(self, *args, **options):
+        results = iter_search_results(DocumentListFilters(publication_status=PUBLICATION_STATUS_ALL))
+        mirrored, removed = reconcile_document_list_mirror(results)
+
+        self.stdout.write(f"Mirrored {mirrored} documents, removed {removed}.")
@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand
+
+from judgments.utils.queue_depths import record_queue_depths
+
+
+class Command(BaseCommand):
+    help = "Record how many documents are waiting in each work queue, for the trends on the reports index"
+
+    def handle(self, *args, **options):
+        snapshot = record_queue_depths()
+
+        self.stdout.write(
+            f"Recorded {snapshot.pending_parse} awaiting reparsing, {snapshot.pending_enrichment} awaiting enrichment, "
+            f"{snapshot.locked_documents} locked and {snapshot.missing_fclid} missing an FCLID.",
+        )
@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand
+
+from judgments.utils.report_snapshots import refresh_report
+from judgments.views.reports import SNAPSHOT_REPORTS
+
+
+class Command(BaseCommand):
+    help = "Compute every report which is shown from a snapshot, so that it's up to date when it's next viewed"
+
+    def handle(self, *args, **options):
+        for name, compute in SNAPSHOT_REPORTS.items():
+            if refresh_report(name, compute) is None:
+                self.stdout.write(f"Skipped {name}, which is already being refreshed.")
+            else:
+                self.stdout.write(f"Refreshed {name}.")
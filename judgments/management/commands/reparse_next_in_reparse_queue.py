@@ -10,6 +10,7 @@ from django.core.management.base import BaseCommand, CommandParser
 from judgments.models import BulkReparseRunLog
 from judgments.models.telemetry import RunStatus
 from judgments.utils import api_client
+from judgments.utils.target_versions import get_target_parser_version
 from judgments.views.reports import get_rows_from_result
 
 env = environ.Env()
@@ -59,7 +60,7 @@ class Command(BaseCommand):
 
     def handle(self, *args, **options):
         # Get all the information we need to open a run log
-        target_parser_version = api_client.get_highest_parser_version()
+        target_parser_version = get_target_parser_version()
         total_in_queue = api_client.get_count_pending_parse_for_version(target_parser_version)
 
         start_time = datetime.now(UTC)
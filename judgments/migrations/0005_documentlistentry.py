@@ -0,0 +1,38 @@
+# Generated by Django 5.2.8 on 2026-10-18 13:38
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('judgments', '0004_bulkreparserunlog_detail'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DocumentListEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('uri', models.CharField(max_length=1024, unique=True)),
+                ('name', models.TextField(blank=True)),
+                ('neutral_citation', models.CharField(blank=True, max_length=255)),
+                ('court_code', models.CharField(blank=True, db_index=True, max_length=255)),
+                ('date', models.DateField(null=True)),
+                ('transformation_datetime', models.DateTimeField(null=True)),
+                ('last_modified', models.DateTimeField(null=True)),
+                ('submission_datetime', models.DateTimeField(null=True)),
+                ('author', models.TextField(blank=True)),
+                ('consignment_reference', models.CharField(blank=True, max_length=255)),
+                ('assigned_to', models.CharField(blank=True, max_length=255)),
+                ('published', models.BooleanField(default=False)),
+                ('held', models.BooleanField(default=False)),
+                ('mirrored_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Document List Entry',
+                'verbose_name_plural': 'Document List Entries',
+                'indexes': [models.Index(fields=['published', '-date', 'uri'], name='judgments_d_publish_8cd67a_idx'), models.Index(fields=['published', '-last_modified', 'uri'], name='judgments_d_publish_ed107c_idx'), models.Index(fields=['published', '-transformation_datetime', 'uri'], name='judgments_d_publish_6f1c49_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 5.2.8 on 2026-10-18 13:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('judgments', '0005_documentlistentry'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='NeutralCitationIndexEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('neutral_citation', models.CharField(max_length=255)),
+                ('normalised_citation', models.CharField(db_index=True, max_length=255)),
+                ('uri', models.CharField(db_index=True, max_length=1024)),
+            ],
+            options={
+                'verbose_name': 'Neutral Citation Index Entry',
+                'verbose_name_plural': 'Neutral Citation Index Entries',
+                'constraints': [models.UniqueConstraint(fields=('normalised_citation', 'uri'), name='unique_neutral_citation_per_document')],
+            },
+        ),
+    ]
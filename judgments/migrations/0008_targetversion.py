@@ -0,0 +1,27 @@
+# Generated by Django 5.2.8 on 2026-10-18 14:01
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('judgments', '0007_reportsnapshot'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TargetVersion',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=255, unique=True)),
+                ('major', models.PositiveIntegerField()),
+                ('minor', models.PositiveIntegerField()),
+                ('found_at', models.DateTimeField()),
+            ],
+            options={
+                'verbose_name': 'Target Version',
+                'verbose_name_plural': 'Target Versions',
+            },
+        ),
+    ]
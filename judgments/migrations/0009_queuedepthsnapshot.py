@@ -0,0 +1,31 @@
+# Generated by Django 5.2.8 on 2026-10-18 14:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('judgments', '0008_targetversion'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='QueueDepthSnapshot',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('recorded_at', models.DateTimeField(db_index=True)),
+                ('target_parser_version', models.TextField()),
+                ('target_enrichment_version', models.TextField()),
+                ('pending_parse', models.IntegerField()),
+                ('pending_enrichment', models.IntegerField()),
+                ('locked_documents', models.IntegerField()),
+                ('missing_fclid', models.IntegerField()),
+            ],
+            options={
+                'verbose_name': 'Queue Depth Snapshot',
+                'verbose_name_plural': 'Queue Depth Snapshots',
+                'ordering': ['-recorded_at'],
+            },
+        ),
+    ]
@@ -1 +1,6 @@
+from .document_list_entry import DocumentListEntry as DocumentListEntry
+from .neutral_citation_index_entry import NeutralCitationIndexEntry as NeutralCitationIndexEntry
+from .report_snapshot import ReportSnapshot as ReportSnapshot
+from .target_version import TargetVersion as TargetVersion
 from .telemetry import BulkReparseRunLog as BulkReparseRunLog
+from .telemetry import QueueDepthSnapshot as QueueDepthSnapshot
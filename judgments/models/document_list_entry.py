@@ -0,0 +1,63 @@
+from caselawclient.responses.search_result import EditorStatus
+from django.db import models
+
+from judgments.utils.court_tables import COURT_TABLES
+
+
+class DocumentListEntry(models.Model):
+    """A local copy of the list-level metadata of a document in MarkLogic, so that the document list can be served from
+    the database. See judgments/utils/document_mirror.py."""
+
+    uri = models.CharField(max_length=1024, unique=True)
+    name = models.TextField(blank=True)
+    neutral_citation = models.CharField(max_length=255, blank=True)
+
+    court_code = models.CharField(max_length=255, blank=True, db_index=True)
+    """The code of the document's court, including its jurisdiction if it has one (eg `UKFTT-GRC/Charity`)."""
+
+    date = models.DateField(null=True)
+    transformation_datetime = models.DateTimeField(null=True)
+    last_modified = models.DateTimeField(null=True)
+    submission_datetime = models.DateTimeField(null=True)
+
+    author = models.TextField(blank=True)
+    consignment_reference = models.CharField(max_length=255, blank=True)
+    assigned_to = models.CharField(max_length=255, blank=True)
+
+    published = models.BooleanField(default=False)
+    held = models.BooleanField(default=False)
+
+    mirrored_at = models.DateTimeField(auto_now=True)
+    """When this entry was last copied from MarkLogic."""
+
+    class Meta:
+        verbose_name = "Document List Entry"
+        verbose_name_plural = "Document List Entries"
+        indexes = [
+            models.Index(fields=["published", "-date", "uri"]),
+            models.Index(fields=["published", "-last_modified", "uri"]),
+            models.Index(fields=["published", "-transformation_datetime", "uri"]),
+        ]
+
+    def __str__(self):
+        return self.uri
+
+    # The document list template is written for search results, so entries answer to the same names.
+
+    @property
+    def court(self):
+        return COURT_TABLES.all_by_code.get(self.court_code)
+
+    @property
+    def metadata(self):
+        return self
+
+    @property
+    def editor_status(self) -> str:
+        if self.published:
+            return EditorStatus.PUBLISHED.value
+        if self.held:
+            return EditorStatus.HOLD.value
+        if self.assigned_to:
+            return EditorStatus.IN_PROGRESS.value
+        return EditorStatus.NEW.value
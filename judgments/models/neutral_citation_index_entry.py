@@ -0,0 +1,23 @@
+from django.db import models
+
+
+class NeutralCitationIndexEntry(models.Model):
+    """A neutral citation number and the document it belongs to, so that NCNs can be looked up without a MarkLogic
+    search. See judgments/utils/ncn_index.py."""
+
+    neutral_citation = models.CharField(max_length=255)
+
+    normalised_citation = models.CharField(max_length=255, db_index=True)
+    """The citation as it's matched against: upper case, with runs of whitespace made single spaces."""
+
+    uri = models.CharField(max_length=1024, db_index=True)
+
+    class Meta:
+        verbose_name = "Neutral Citation Index Entry"
+        verbose_name_plural = "Neutral Citation Index Entries"
+        constraints = [
+            models.UniqueConstraint(fields=["normalised_citation", "uri"], name="unique_neutral_citation_per_document"),
+        ]
+
+    def __str__(self):
+        return f"{self.neutral_citation} ({self.uri})"
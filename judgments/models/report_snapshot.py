@@ -0,0 +1,29 @@
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+
+
+class ReportSnapshot(models.Model):
+    """The last computed results of a report, so that the report can be shown without querying MarkLogic. See
+    judgments/utils/report_snapshots.py."""
+
+    name = models.CharField(max_length=255, unique=True)
+
+    data = models.JSONField(default=dict, encoder=DjangoJSONEncoder)
+    """The report's results, as its template context."""
+
+    as_of = models.DateTimeField(null=True)
+    """When `data` was computed, or `None` if it never has been."""
+
+    refreshing_since = models.DateTimeField(null=True)
+    """When the refresh which is under way started, if there is one."""
+
+    class Meta:
+        verbose_name = "Report Snapshot"
+        verbose_name_plural = "Report Snapshots"
+
+    def __str__(self):
+        return f"{self.name} as of {self.as_of}"
+
+    @property
+    def is_refreshing(self) -> bool:
+        return self.refreshing_since is not None
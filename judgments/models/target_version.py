@@ -0,0 +1,22 @@
+from django.db import models
+
+
+class TargetVersion(models.Model):
+    """The highest parser or enrichment version found in MarkLogic, so that processes can share it without each running
+    the aggregate query. See judgments/utils/target_versions.py."""
+
+    name = models.CharField(max_length=255, unique=True)
+    """Which version this is: `parser` or `enrichment`."""
+
+    major = models.PositiveIntegerField()
+    minor = models.PositiveIntegerField()
+
+    found_at = models.DateTimeField()
+    """When the version was looked up."""
+
+    class Meta:
+        verbose_name = "Target Version"
+        verbose_name_plural = "Target Versions"
+
+    def __str__(self):
+        return f"{self.name} {self.major}.{self.minor}"
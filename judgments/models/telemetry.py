@@ -34,3 +34,25 @@ class BulkReparseRunLog(models.Model):
 
     def __str__(self):
         return f"Bulk Reparse Run - {self.start_time}"
+
+
+class QueueDepthSnapshot(models.Model):
+    """How many documents were waiting in each work queue at a point in time. See judgments/utils/queue_depths.py."""
+
+    recorded_at = models.DateTimeField(db_index=True)
+
+    target_parser_version = models.TextField()
+    target_enrichment_version = models.TextField()
+
+    pending_parse = models.IntegerField()
+    pending_enrichment = models.IntegerField()
+    locked_documents = models.IntegerField()
+    missing_fclid = models.IntegerField()
+
+    class Meta:
+        verbose_name = "Queue Depth Snapshot"
+        verbose_name_plural = "Queue Depth Snapshots"
+        ordering = ["-recorded_at"]
+
+    def __str__(self):
+        return f"Queue Depth Snapshot - {self.recorded_at}"
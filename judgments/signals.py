@@ -0,0 +1,23 @@
+"""Signal handlers which keep cached data in step with the database."""
+
+from django.contrib.auth.models import Group, User
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from judgments.utils import invalidate_editors_dict
+
+
+@receiver(post_delete, sender=User)
+@receiver(post_save, sender=Group)
+@receiver(post_delete, sender=Group)
+@receiver(m2m_changed, sender=User.groups.through)
+def invalidate_editors_on_change(**kwargs):
+    invalidate_editors_dict()
+
+
+@receiver(post_save, sender=User)
+def invalidate_editors_on_user_save(update_fields=None, **kwargs):
+    # Every login saves the user's last_login, which isn't part of the roster.
+    if update_fields is not None and set(update_fields) <= {"last_login"}:
+        return
+    invalidate_editors_dict()
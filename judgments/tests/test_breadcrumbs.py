@@ -7,6 +7,7 @@ from django.http import Http404
 from django.test import Client, TestCase
 
 from judgments.tests.factories import User
+from judgments.utils.search_facets import SearchFacets
 
 
 @pytest.mark.django_db
@@ -29,6 +30,7 @@ class TestBreadcrumbs(TestCase):
             "documents": [],
             "order": "",
             "paginator": {},
+            "facets": SearchFacets(),
             "total_count_postfix": "unpublished documents",
         }
         response = self.client.get("/")
@@ -61,6 +63,7 @@ class TestBreadcrumbs(TestCase):
             "documents": [],
             "order": "",
             "paginator": {},
+            "facets": SearchFacets(),
             "total_count_postfix": "documents",
         }
         response = self.client.get("/results?foo")
@@ -3,7 +3,12 @@ from unittest.mock import Mock, call, patch
 from django.core.management import call_command
 from django.test import TestCase
 
+TARGET_VERSIONS_API_CLIENT = Mock(
+    **{"get_highest_parser_version.return_value": (1, 2), "get_highest_enrichment_version.return_value": (3, 4)},
+)
 
+
+@patch("judgments.utils.target_versions.api_client", TARGET_VERSIONS_API_CLIENT)
 class CommandsTestCase(TestCase):
     @patch("judgments.management.commands.enrich_next_in_reenrichment_queue.api_client")
     @patch(
@@ -0,0 +1,170 @@
+from typing import cast
+from unittest.mock import Mock, patch
+
+from caselawclient.factories import JudgmentFactory
+from caselawclient.models.documents import DocumentURIString
+from caselawclient.models.identifiers.neutral_citation import NeutralCitationNumber
+from django.contrib.auth.models import User
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from lxml import etree
+
+from judgments.utils.document_cache import DocumentCache, document_cache, invalidate_document_caches
+from judgments.utils.view_helpers import get_document_by_uri_or_404
+
+
+@override_settings(DOCUMENT_CACHE_TIMEOUT=10)
+class TestDocumentCache(TestCase):
+    def test_returns_cached_document(self):
+        cache = DocumentCache()
+        document = JudgmentFactory.build(uri=DocumentURIString("test/2023/1"))
+        cache.set("test/2023/1", document)
+
+        cached = cache.get("/test/2023/1")
+        assert cached is not None
+        assert cached.uri == document.uri
+        assert cache.get("test/2023/2") is None
+
+    def test_returns_a_fresh_copy_each_time(self):
+        cache = DocumentCache()
+        document = JudgmentFactory.build(
+            uri=DocumentURIString("test/2023/1"),
+            identifiers=[NeutralCitationNumber(value="[2023] UKSC 1")],
+        )
+        cache.set("test/2023/1", document)
+
+        changed = cache.get("test/2023/1")
+        assert changed is not None
+        changed.identifiers.add(NeutralCitationNumber(value="[2023] UKSC 2"))
+
+        cached = cache.get("test/2023/1")
+        assert cached is not None
+        assert cached is not document
+        assert [identifier.value for identifier in cached.identifiers.values()] == ["[2023] UKSC 1"]
+        assert len(document.identifiers) == 1
+
+    def test_versions_are_cached_separately(self):
+        cache = DocumentCache()
+        cache.set("test/2023/1", Mock())
+
+        assert cache.get("test/2023/1_xml_versions/3-1") is None
+
+    @patch("judgments.utils.local_cache.time.monotonic")
+    def test_entries_expire(self, mock_monotonic):
+        cache = DocumentCache()
+        mock_monotonic.return_value = 100.0
+        cache.set("test/2023/1", Mock())
+
+        mock_monotonic.return_value = 109.0
+        assert cache.get("test/2023/1") is not None
+
+        mock_monotonic.return_value = 110.0
+        assert cache.get("test/2023/1") is None
+
+    def test_oldest_entries_are_evicted(self):
+        cache = DocumentCache(max_entries=2)
+        cache.set("test/2023/1", Mock())
+        cache.set("test/2023/2", Mock())
+        cache.get("test/2023/1")
+        cache.set("test/2023/3", Mock())
+
+        assert cache.get("test/2023/1") is not None
+        assert cache.get("test/2023/2") is None
+        assert cache.get("test/2023/3") is not None
+
+    def test_invalidate(self):
+        cache = DocumentCache()
+        cache.set("test/2023/1", Mock())
+        cache.invalidate("test/2023/1")
+
+        assert cache.get("test/2023/1") is None
+
+    @override_settings(DOCUMENT_CACHE_TIMEOUT=0)
+    def test_disabled_when_timeout_is_zero(self):
+        cache = DocumentCache()
+        cache.set("test/2023/1", Mock())
+
+        assert cache.get("test/2023/1") is None
+
+
+@override_settings(DOCUMENT_CACHE_TIMEOUT=10)
+class TestGetDocumentByURIOr404Caching(TestCase):
+    def setUp(self):
+        document_cache.clear()
+
+    def tearDown(self):
+        document_cache.clear()
+
+    @patch("judgments.utils.view_helpers.api_client.get_document_by_uri")
+    def test_document_is_only_fetched_once(self, mock_get_document_by_uri):
+        judgment = JudgmentFactory.build(uri=DocumentURIString("test/2023/1"))
+        mock_get_document_by_uri.return_value = judgment
+
+        assert get_document_by_uri_or_404("test/2023/1") is judgment
+        assert get_document_by_uri_or_404("test/2023/1").uri == judgment.uri
+
+        mock_get_document_by_uri.assert_called_once_with("test/2023/1")
+
+    @patch("judgments.utils.view_helpers.api_client.get_document_by_uri")
+    def test_document_is_refetched_after_invalidation(self, mock_get_document_by_uri):
+        mock_get_document_by_uri.return_value = JudgmentFactory.build(uri=DocumentURIString("test/2023/1"))
+
+        get_document_by_uri_or_404("test/2023/1")
+        invalidate_document_caches("test/2023/1")
+        get_document_by_uri_or_404("test/2023/1")
+
+        assert mock_get_document_by_uri.call_count == 2
+
+    @patch("judgments.views.judgment_hold.invalidate_caches")
+    @patch("judgments.utils.view_helpers.api_client.get_document_by_uri")
+    def test_hold_invalidates_cached_document(self, mock_get_document_by_uri, mock_invalidate_caches):
+        judgment = Mock()
+        judgment.uri = "test/2023/1"
+        mock_get_document_by_uri.return_value = judgment
+
+        self.client.force_login(User.objects.get_or_create(username="testuser")[0])
+        self.client.post(reverse("hold"), data={"judgment_uri": judgment.uri})
+
+        judgment.hold.assert_called_once()
+        assert document_cache.get("test/2023/1") is None
+
+    @patch("judgments.views.document_reparse.get_document_by_uri_or_404")
+    def test_reparse_keeps_cached_document_for_redirect(self, mock_get_document):
+        judgment = Mock()
+        judgment.uri = "test/2023/1"
+        document_cache.set(judgment.uri, judgment)
+        mock_get_document.return_value = judgment
+
+        self.client.force_login(User.objects.get_or_create(username="testuser")[0])
+        self.client.post(reverse("reparse"), data={"document_uri": judgment.uri})
+
+        assert document_cache.get("test/2023/1") is not None
+
+    @patch("judgments.utils.api_client.document_exists", return_value=False)
+    @patch("judgments.utils.view_helpers.api_client.get_document_by_uri")
+    def test_rejected_identifier_is_not_saved_by_a_later_add(self, mock_get_document_by_uri, mock_document_exists):
+        judgment = JudgmentFactory.build(
+            uri=DocumentURIString("test/2023/1"),
+            identifiers=[NeutralCitationNumber(value="[2023] UKSC 1")],
+        )
+        api_client = cast("Mock", judgment.api_client)
+        api_client.resolve_from_identifier_value.return_value = []
+        mock_get_document_by_uri.return_value = judgment
+        add_uri = reverse("document-identifiers-add", kwargs={"document_uri": judgment.uri})
+
+        self.client.force_login(User.objects.get_or_create(username="testuser")[0])
+        rejected = self.client.post(
+            add_uri,
+            data={"type": NeutralCitationNumber.schema.namespace, "value": "[2023] UKSC 2"},
+        )
+        accepted = self.client.post(
+            add_uri,
+            data={"type": NeutralCitationNumber.schema.namespace, "value": "[2023] UKSC 3", "deprecated": "on"},
+        )
+
+        assert rejected.status_code == 200
+        assert accepted.status_code == 302
+        saved_xml = etree.tostring(api_client.set_property_as_node.call_args.args[2])
+        assert b"[2023] UKSC 1" in saved_xml
+        assert b"[2023] UKSC 2" not in saved_xml
+        assert b"[2023] UKSC 3" in saved_xml
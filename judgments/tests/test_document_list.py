@@ -1,8 +1,10 @@
 from unittest.mock import MagicMock, patch
 
 from caselawclient.search_parameters import SearchParameters
+from django.contrib.auth.models import User
 from django.http import QueryDict
-from django.test import SimpleTestCase
+from django.test import SimpleTestCase, TestCase
+from django.urls import reverse
 
 from judgments.utils import api_client
 from judgments.utils.document_list import (
@@ -151,7 +153,7 @@ class TestSearchResultsFromFilters(SimpleTestCase):
             QueryDict("publication_status=all&order=-updated&court=uksc&from_year=2022&to_year=2023"),
         )
         get_search_results_from_filters(filters)
-        mock_search.assert_called_with(
+        mock_search.assert_any_call(
             api_client,
             SearchParameters(
                 query=None,
@@ -198,3 +200,31 @@ class TestSearchResultsFromFilters(SimpleTestCase):
                 page=1,
             ),
         )
+
+
+@patch("judgments.utils.view_helpers.search_and_parse_response")
+class TestDocumentListFragment(TestCase):
+    def setUp(self):
+        self.client.force_login(User.objects.get_or_create(username="testuser")[0])
+
+    def test_fragment_request_renders_only_the_list(self, mock_search):
+        mock_search.return_value = MagicMock(total=3, results=[], facets={})
+
+        response = self.client.get(reverse("home") + "?page=1", headers={"X-Fragment": "document-list-results"})
+        content = response.content.decode()
+
+        assert "3 unpublished documents" in content
+        assert "<html" not in content
+        assert "Search for documents" not in content
+        assert "X-Fragment" in response["Vary"]
+
+    def test_page_request_renders_the_whole_page(self, mock_search):
+        mock_search.return_value = MagicMock(total=3, results=[], facets={})
+
+        response = self.client.get(reverse("results"))
+        content = response.content.decode()
+
+        assert "<html" in content
+        assert "<div data-document-list-results>" in content
+        assert "3 documents" in content
+        assert "X-Fragment" in response["Vary"]
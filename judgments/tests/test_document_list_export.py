@@ -0,0 +1,143 @@
+import json
+from unittest.mock import MagicMock, call, patch
+
+from caselawclient.factories import SearchResultFactory
+from caselawclient.search_parameters import SearchParameters
+from django.contrib.auth.models import User
+from django.test import TestCase
+from django.urls import reverse
+
+from judgments.utils import api_client
+from judgments.utils.court_tables import COURT_TABLES
+from judgments.utils.document_list import DocumentListFilters
+from judgments.utils.view_helpers import iter_search_result_pages, iter_search_results
+
+
+def search_response(results, total):
+    response = MagicMock()
+    response.results = results
+    response.total = total
+    return response
+
+
+class TestIterSearchResults:
+    @patch("judgments.utils.view_helpers.search_and_parse_response")
+    def test_walks_every_page(self, mock_search):
+        mock_search.side_effect = [
+            search_response(["a", "b"], 5),
+            search_response(["c", "d"], 5),
+            search_response(["e"], 5),
+        ]
+
+        assert list(iter_search_results(DocumentListFilters(page=4), page_size=2)) == ["a", "b", "c", "d", "e"]
+        assert mock_search.call_args_list == [
+            call(
+                api_client,
+                SearchParameters(order="-date", only_unpublished=True, show_unpublished=True, page=page, page_size=2),
+            )
+            for page in (1, 2, 3)
+        ]
+
+    @patch("judgments.utils.view_helpers.search_and_parse_response")
+    def test_walks_every_page_a_page_at_a_time(self, mock_search):
+        mock_search.side_effect = [search_response(["a", "b"], 3), search_response(["c"], 3)]
+
+        assert list(iter_search_result_pages(DocumentListFilters(), page_size=2)) == [["a", "b"], ["c"]]
+
+    @patch("judgments.utils.view_helpers.search_and_parse_response")
+    def test_fetches_pages_as_results_are_consumed(self, mock_search):
+        mock_search.side_effect = [search_response(["a"], 2), search_response(["b"], 2)]
+
+        results = iter_search_results(DocumentListFilters(), page_size=1)
+
+        assert next(results) == "a"
+        assert mock_search.call_count == 1
+
+    @patch("judgments.utils.view_helpers.search_and_parse_response")
+    def test_stops_on_an_empty_page(self, mock_search):
+        mock_search.return_value = search_response([], 10)
+
+        assert list(iter_search_results(DocumentListFilters(), page_size=2)) == []
+        mock_search.assert_called_once()
+
+
+PROPERTIES = """<property-results>
+  <property-result uri="/uksc/2025/1.xml">
+    <source-name>Uploader</source-name>
+    <transfer-consignment-reference>TDR-1</transfer-consignment-reference>
+    <transfer-received-at>2025-02-03T09:12:34Z</transfer-received-at>
+  </property-result>
+  <property-result uri="/uksc/2025/2.xml"></property-result>
+</property-results>"""
+
+
+@patch("judgments.utils.document_mirror.api_client")
+@patch("judgments.views.document_list.iter_search_result_pages")
+class TestDocumentListExport(TestCase):
+    def setUp(self):
+        self.client.force_login(User.objects.get_or_create(username="testuser")[0])
+
+    def _pages(self):
+        return [
+            [
+                SearchResultFactory.build(uri="uksc/2025/1", name="A v B", court=COURT_TABLES.by_code["UKSC"]),
+                SearchResultFactory.build(uri="uksc/2025/2", name="C v D", court=COURT_TABLES.by_code["UKSC"]),
+            ],
+        ]
+
+    def test_exports_csv(self, mock_iter_search_result_pages, mock_api_client):
+        mock_iter_search_result_pages.return_value = self._pages()
+        mock_api_client.get_properties_for_search_results.return_value = PROPERTIES
+
+        response = self.client.get(reverse("document-list-export") + "?court=uksc&publication_status=unpublished")
+
+        assert response.status_code == 200
+        assert response["Content-Type"] == "text/csv"
+        assert response["Content-Disposition"] == 'attachment; filename="documents.csv"'
+        lines = response.getvalue().decode().splitlines()
+        assert lines[0] == "uri,name,neutral_citation,court,date,status,submitter,submitted,consignment_reference"
+        assert lines[1].startswith("uksc/2025/1,A v B,[2025] UKSC 123,United Kingdom Supreme Court,2023-02-03,")
+        assert lines[1].endswith(",Uploader,2025-02-03T09:12:34+00:00,TDR-1")
+
+        filters = mock_iter_search_result_pages.call_args.args[0]
+        assert filters.courts == ["uksc"]
+        assert filters.publication_status == "unpublished"
+
+    def test_fetches_properties_once_per_page(self, mock_iter_search_result_pages, mock_api_client):
+        mock_iter_search_result_pages.return_value = self._pages()
+        mock_api_client.get_properties_for_search_results.return_value = PROPERTIES
+
+        self.client.get(reverse("document-list-export")).getvalue()
+
+        mock_api_client.get_properties_for_search_results.assert_called_once_with(["uksc/2025/1", "uksc/2025/2"])
+
+    def test_missing_submission_datetime_is_empty(self, mock_iter_search_result_pages, mock_api_client):
+        mock_iter_search_result_pages.return_value = self._pages()
+        mock_api_client.get_properties_for_search_results.return_value = PROPERTIES
+
+        response = self.client.get(reverse("document-list-export") + "?format=ndjson")
+
+        rows = [json.loads(line) for line in response.getvalue().decode().splitlines()]
+        assert rows[1]["uri"] == "uksc/2025/2"
+        assert rows[1]["submitted"] == ""
+
+    def test_exports_ndjson(self, mock_iter_search_result_pages, mock_api_client):
+        mock_iter_search_result_pages.return_value = self._pages()
+        mock_api_client.get_properties_for_search_results.return_value = PROPERTIES
+
+        response = self.client.get(reverse("document-list-export") + "?format=ndjson")
+
+        assert response["Content-Type"] == "application/x-ndjson"
+        rows = [json.loads(line) for line in response.getvalue().decode().splitlines()]
+        assert rows[0]["uri"] == "uksc/2025/1"
+        assert rows[0]["court"] == "United Kingdom Supreme Court"
+
+    @patch("judgments.utils.view_helpers.search_and_parse_response")
+    def test_list_links_to_export_of_same_filters(self, mock_search, mock_iter_search_result_pages, mock_api_client):
+        mock_search.return_value = search_response([], 0)
+
+        response = self.client.get(reverse("home") + "?court=uksc&page=2")
+
+        assert reverse("document-list-export") + "?court=uksc&amp;publication_status=unpublished" in (
+            response.content.decode()
+        )
@@ -0,0 +1,223 @@
+from unittest.mock import Mock, patch
+
+from caselawclient.errors import MarklogicAPIError
+from caselawclient.factories import JudgmentFactory
+from caselawclient.models.documents import DocumentURIString
+from django.contrib.auth.models import User
+from django.test import RequestFactory, TestCase, override_settings
+
+from judgments.utils.etags import document_page_etag, document_state
+
+
+@override_settings(DOCUMENT_ETAGS=True)
+@patch("judgments.utils.etags.document_state", return_value=["eat/2023/1", "2024-01-01T00:00:00", 3, None])
+@patch("judgments.utils.view_helpers.get_linked_document_uri", return_value=None)
+@patch("judgments.utils.view_helpers.get_document_by_uri_or_404")
+class TestDocumentPageETags(TestCase):
+    def setUp(self):
+        self.client.force_login(User.objects.get_or_create(username="testuser")[0])
+
+    def test_page_has_etag(self, mock_get_document, mock_get_linked_document_uri, mock_document_state):
+        mock_get_document.return_value = JudgmentFactory.build(uri=DocumentURIString("eat/2023/1"))
+
+        response = self.client.get("/eat/2023/1/history")
+
+        assert response.status_code == 200
+        assert response["ETag"]
+        assert "no-cache" in response["Cache-Control"]
+        assert "private" in response["Cache-Control"]
+
+    def test_matching_etag_is_not_modified(self, mock_get_document, mock_get_linked_document_uri, mock_document_state):
+        mock_get_document.return_value = JudgmentFactory.build(uri=DocumentURIString("eat/2023/1"))
+        # The first page view sets the CSRF cookie, which is part of the ETag.
+        self.client.get("/eat/2023/1/history")
+        etag = self.client.get("/eat/2023/1/history")["ETag"]
+        mock_get_document.reset_mock()
+
+        response = self.client.get("/eat/2023/1/history", headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        mock_get_document.assert_not_called()
+
+    def test_etag_changes_with_document(self, mock_get_document, mock_get_linked_document_uri, mock_document_state):
+        mock_get_document.return_value = JudgmentFactory.build(uri=DocumentURIString("eat/2023/1"))
+        etag = self.client.get("/eat/2023/1/history")["ETag"]
+
+        mock_document_state.return_value = ["eat/2023/1", "2024-01-02T00:00:00", 4, None]
+        response = self.client.get("/eat/2023/1/history", headers={"If-None-Match": etag})
+
+        assert response.status_code == 200
+        assert response["ETag"] != etag
+
+    def test_etag_differs_between_users(self, mock_get_document, mock_get_linked_document_uri, mock_document_state):
+        mock_get_document.return_value = JudgmentFactory.build(uri=DocumentURIString("eat/2023/1"))
+        etag = self.client.get("/eat/2023/1/history")["ETag"]
+
+        self.client.force_login(User.objects.create_superuser(username="superuser"))
+
+        assert self.client.get("/eat/2023/1/history")["ETag"] != etag
+
+    def test_etag_differs_between_tabs(self, mock_get_document, mock_get_linked_document_uri, mock_document_state):
+        mock_get_document.return_value = JudgmentFactory.build(uri=DocumentURIString("eat/2023/1"))
+
+        assert self.client.get("/eat/2023/1/history")["ETag"] != self.client.get("/eat/2023/1/downloads")["ETag"]
+
+    def test_no_etag_for_post(self, mock_get_document, mock_get_linked_document_uri, mock_document_state):
+        request = RequestFactory().post("/eat/2023/1/identifiers/add")
+
+        assert document_page_etag(request, "eat/2023/1") is None
+
+
+@override_settings(DOCUMENT_ETAGS=True)
+@patch("judgments.utils.etags.document_state", return_value=["eat/2023/1", "2024-01-01T00:00:00", 3, None])
+@patch("judgments.views.document_full_text.api_client.get_judgment_xml_bytestring", return_value=b"<akomaNtoso/>")
+class TestXMLDownloadETags(TestCase):
+    def setUp(self):
+        self.client.force_login(User.objects.get_or_create(username="testuser")[0])
+
+    def test_matching_etag_is_not_modified(self, mock_get_xml, mock_document_state):
+        etag = self.client.get("/eat/2023/1/xml")["ETag"]
+        mock_get_xml.reset_mock()
+
+        response = self.client.get("/eat/2023/1/xml", headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        mock_get_xml.assert_not_called()
+
+    def test_etag_depends_on_accepted_encoding(self, mock_get_xml, mock_document_state):
+        assert (
+            self.client.get("/eat/2023/1/xml")["ETag"]
+            != self.client.get("/eat/2023/1/xml", headers={"Accept-Encoding": "gzip"})["ETag"]
+        )
+
+
+PROPERTIES = """<property-results>
+  <property-result uri="/eat/2023/1.xml"><published>false</published></property-result>
+</property-results>"""
+
+
+@override_settings(DOCUMENT_ETAGS=True)
+@patch("judgments.utils.etags.document_exists", return_value=False)
+@patch("judgments.utils.etags._latest_version_number", return_value=3)
+@patch("judgments.utils.etags.api_client")
+@patch("judgments.utils.view_helpers.get_linked_document_uri", return_value=None)
+@patch("judgments.utils.view_helpers.get_document_by_uri_or_404")
+class TestDocumentPageETagsFollowDocumentState(TestCase):
+    """Changes which don't write a new version of a document still change the ETag of its pages."""
+
+    def setUp(self):
+        self.client.force_login(User.objects.get_or_create(username="testuser")[0])
+
+    def revalidate_after(self, change, mock_get_document, mock_api_client):
+        mock_get_document.return_value = JudgmentFactory.build(uri=DocumentURIString("eat/2023/1"))
+        mock_api_client.get_last_modified.return_value = "2024-01-01T00:00:00"
+        mock_api_client.get_judgment_checkout_status_message.return_value = None
+        mock_api_client.get_properties_for_search_results.return_value = PROPERTIES
+        self.client.get("/eat/2023/1/history")
+        etag = self.client.get("/eat/2023/1/history")["ETag"]
+        assert self.client.get("/eat/2023/1/history", headers={"If-None-Match": etag}).status_code == 304
+
+        change()
+
+        return self.client.get("/eat/2023/1/history", headers={"If-None-Match": etag})
+
+    def change_property(self, mock_api_client, property_xml):
+        mock_api_client.get_properties_for_search_results.return_value = PROPERTIES.replace(
+            "<published>false</published>",
+            property_xml,
+        )
+
+    def test_publishing(self, mock_get_document, mock_get_linked, mock_api_client, mock_version, mock_exists):
+        response = self.revalidate_after(
+            lambda: self.change_property(mock_api_client, "<published>true</published>"),
+            mock_get_document,
+            mock_api_client,
+        )
+
+        assert response.status_code == 200
+
+    def test_holding(self, mock_get_document, mock_get_linked, mock_api_client, mock_version, mock_exists):
+        response = self.revalidate_after(
+            lambda: self.change_property(
+                mock_api_client,
+                "<published>false</published><editor-hold>true</editor-hold>",
+            ),
+            mock_get_document,
+            mock_api_client,
+        )
+
+        assert response.status_code == 200
+
+    def test_assigning(self, mock_get_document, mock_get_linked, mock_api_client, mock_version, mock_exists):
+        response = self.revalidate_after(
+            lambda: self.change_property(
+                mock_api_client,
+                "<published>false</published><assigned-to>editor</assigned-to>",
+            ),
+            mock_get_document,
+            mock_api_client,
+        )
+
+        assert response.status_code == 200
+
+    def test_creating_linked_document(
+        self,
+        mock_get_document,
+        mock_get_linked,
+        mock_api_client,
+        mock_version,
+        mock_exists,
+    ):
+        def create_press_summary():
+            mock_exists.return_value = True
+
+        response = self.revalidate_after(create_press_summary, mock_get_document, mock_api_client)
+
+        assert response.status_code == 200
+        mock_exists.assert_called_with("eat/2023/1/press-summary/1")
+
+
+class TestDocumentState:
+    @patch("judgments.utils.etags.api_client")
+    def test_versions_are_not_probed(self, mock_api_client):
+        assert document_state("/eat/2023/1/xml_versions/3-1") == ["eat/2023/1/xml_versions/3-1"]
+        assert not mock_api_client.mock_calls
+
+    @patch("judgments.utils.etags.document_exists", return_value=True)
+    @patch("judgments.utils.etags.api_client")
+    @patch("judgments.utils.etags._latest_version_number", return_value=3)
+    def test_probes_document(self, mock_latest_version_number, mock_api_client, mock_document_exists):
+        mock_api_client.get_last_modified.return_value = "2024-01-01T00:00:00"
+        mock_api_client.get_judgment_checkout_status_message.return_value = "Locked by an editor"
+        mock_api_client.get_properties_for_search_results.return_value = PROPERTIES
+
+        assert document_state("eat/2023/1") == [
+            "eat/2023/1",
+            "2024-01-01T00:00:00",
+            3,
+            "Locked by an editor",
+            PROPERTIES,
+            "eat/2023/1/press-summary/1",
+        ]
+        mock_api_client.get_properties_for_search_results.assert_called_once_with(["eat/2023/1"])
+        mock_document_exists.assert_called_once_with("eat/2023/1/press-summary/1")
+
+    @patch("judgments.utils.etags.document_exists", return_value=False)
+    @patch("judgments.utils.etags.api_client")
+    @patch("judgments.utils.etags._latest_version_number", return_value=3)
+    def test_press_summary_is_linked_to_its_judgment(
+        self,
+        mock_latest_version_number,
+        mock_api_client,
+        mock_document_exists,
+    ):
+        assert document_state("eat/2023/1/press-summary/1")[-1] is None  # type: ignore[index]
+
+        mock_document_exists.assert_called_once_with("eat/2023/1")
+
+    @patch("judgments.utils.etags.api_client")
+    def test_unprobeable_document_has_no_state(self, mock_api_client):
+        mock_api_client.get_last_modified.side_effect = MarklogicAPIError
+        mock_api_client.list_judgment_versions.return_value = Mock()
+
+        assert document_state("eat/2023/1") is None
@@ -1,15 +1,23 @@
-from datetime import UTC, datetime
-from unittest.mock import patch
+from datetime import UTC, datetime, timedelta
+from unittest.mock import Mock, patch
 
+import pytest
 from caselawclient.types import DocumentLock, DocumentURIString
 from django.contrib.auth.models import User
+from django.core.management import call_command
 from django.test import TestCase
 from django.urls import reverse
+from django.utils import timezone
 
-from judgments.models import BulkReparseRunLog
+from judgments.models import BulkReparseRunLog, QueueDepthSnapshot, ReportSnapshot
 from judgments.models.telemetry import RunStatus
+from judgments.utils.report_snapshots import get_report, refresh_report
 from judgments.views.reports import get_rows_from_result
 
+TARGET_VERSIONS_API_CLIENT = Mock(
+    **{"get_highest_parser_version.return_value": (1, 2), "get_highest_enrichment_version.return_value": (3, 4)},
+)
+
 
 class TestReportsHelpers(TestCase):
     def test_get_rows_from_result(self):
@@ -29,8 +37,29 @@ class TestReportsIndex(TestCase):
         decoded_response = response.content.decode("utf-8")
         assert "Reports" in decoded_response
         assert response.status_code == 200
+        assert "No queue depths have been recorded yet." in decoded_response
+
+    def test_index_shows_queue_trends(self):
+        self.client.force_login(User.objects.get_or_create(username="testuser")[0])
+        for hours_ago, pending_parse in [(10, 300), (0, 200)]:
+            QueueDepthSnapshot.objects.create(
+                recorded_at=datetime(2026, 4, 2, 12, 0, 0, tzinfo=UTC) - timedelta(hours=hours_ago),
+                target_parser_version="1.2",
+                target_enrichment_version="3.4",
+                pending_parse=pending_parse,
+                pending_enrichment=0,
+                locked_documents=0,
+                missing_fclid=0,
+            )
 
+        response = self.client.get(reverse("reports"))
 
+        self.assertContains(response, "02 Apr 2026 12:00")
+        self.assertContains(response, "<td>Awaiting reparsing</td>")
+        self.assertContains(response, "20 hours")
+
+
+@patch("judgments.utils.target_versions.api_client", TARGET_VERSIONS_API_CLIENT)
 class TestEnrichmentReports(TestCase):
     @patch("judgments.views.reports.api_client")
     def test_awaiting_enrichment_view(self, mock_api_client):
@@ -55,11 +84,13 @@ class TestEnrichmentReports(TestCase):
         assert response.status_code == 200
 
 
+@patch("judgments.utils.target_versions.api_client", TARGET_VERSIONS_API_CLIENT)
 class TestReparseReports(TestCase):
     @patch("judgments.views.reports.api_client")
     def test_awaiting_parse_view(self, mock_api_client):
         self.client.force_login(User.objects.get_or_create(username="testuser")[0])
 
+        mock_api_client.get_count_pending_parse_for_version.return_value = 1
         mock_api_client.get_documents_pending_parse_for_version.return_value = [
             ["uri", "parser_version_string", "minutes_since_parse_request"],
             ["/test/123", "1.2.3", 45],
@@ -79,6 +110,172 @@ class TestReparseReports(TestCase):
         assert response.status_code == 200
 
 
+@patch("judgments.utils.target_versions.api_client", TARGET_VERSIONS_API_CLIENT)
+@patch("judgments.views.reports.REPORT_MAX_PAGE", 3)
+@patch("judgments.views.reports.REPORT_PAGE_SIZE", 2)
+@patch("judgments.views.reports.api_client")
+class TestPaginatedReports(TestCase):
+    def setUp(self):
+        self.client.force_login(User.objects.get_or_create(username="testuser")[0])
+
+    def rows(self, count):
+        return [["uri", "version", "minutes"]] + [[f"/test/{n}", "1.1", n] for n in range(1, count + 1)]
+
+    def test_first_page_asks_for_one_more_row_than_it_shows(self, mock_api_client):
+        mock_api_client.get_count_pending_parse_for_version.return_value = 5
+        mock_api_client.get_documents_pending_parse_for_version.return_value = self.rows(3)
+
+        response = self.client.get(reverse("report_awaiting_parse"))
+
+        mock_api_client.get_documents_pending_parse_for_version.assert_called_once_with((1, 2), 3)
+        self.assertContains(response, "/test/2")
+        self.assertNotContains(response, "/test/3")
+        self.assertContains(response, "?page=3")
+
+    def test_later_pages_skip_the_rows_before_them(self, mock_api_client):
+        mock_api_client.get_count_pending_parse_for_version.return_value = 5
+        mock_api_client.get_documents_pending_parse_for_version.return_value = self.rows(5)
+
+        response = self.client.get(reverse("report_awaiting_parse") + "?page=3")
+
+        mock_api_client.get_documents_pending_parse_for_version.assert_called_with((1, 2), 7)
+        self.assertContains(response, "<td>5</td>\n            <td>/test/5</td>")
+        self.assertNotContains(response, "/test/4")
+
+    def test_pages_past_the_last_show_the_last(self, mock_api_client):
+        mock_api_client.get_count_pending_parse_for_version.return_value = 5
+        mock_api_client.get_documents_pending_parse_for_version.return_value = self.rows(5)
+
+        response = self.client.get(reverse("report_awaiting_parse") + "?page=100000")
+
+        mock_api_client.get_documents_pending_parse_for_version.assert_called_with((1, 2), 7)
+        self.assertContains(response, "/test/5")
+
+    def test_pages_past_the_deepest_are_not_found(self, mock_api_client):
+        mock_api_client.get_pending_enrichment_for_version.return_value = self.rows(3)
+
+        response = self.client.get(reverse("report_awaiting_enrichment") + "?page=4")
+
+        assert response.status_code == 404
+        assert mock_api_client.get_pending_enrichment_for_version.call_count == 1  # Only for the snapshot.
+
+    def test_deepest_page_has_no_next_page(self, mock_api_client):
+        mock_api_client.get_pending_enrichment_for_version.side_effect = [self.rows(3), self.rows(7)]
+
+        response = self.client.get(reverse("report_awaiting_enrichment") + "?page=3")
+
+        self.assertContains(response, "/test/6")
+        self.assertNotContains(response, "?page=4")
+
+    def test_enrichment_pages_link_to_the_next_page_while_there_are_more(self, mock_api_client):
+        mock_api_client.get_pending_enrichment_for_version.side_effect = [self.rows(3), self.rows(4)]
+
+        first_page = self.client.get(reverse("report_awaiting_enrichment"))
+        second_page = self.client.get(reverse("report_awaiting_enrichment") + "?page=2")
+
+        assert mock_api_client.get_pending_enrichment_for_version.call_args.kwargs["maximum_records"] == 5
+        self.assertContains(first_page, "more than")
+        self.assertContains(first_page, "?page=2")
+        self.assertContains(second_page, "/test/4")
+        self.assertNotContains(second_page, "more than")
+        self.assertNotContains(second_page, "?page=3")
+
+
+@patch("judgments.utils.target_versions.api_client", TARGET_VERSIONS_API_CLIENT)
+class TestReportSnapshots(TestCase):
+    def test_first_view_computes_the_report(self):
+        compute = Mock(return_value={"total": 3})
+
+        snapshot = get_report("test", compute)
+
+        assert snapshot.data == {"total": 3}
+        assert get_report("test", compute).as_of == snapshot.as_of
+        compute.assert_called_once()
+
+    def test_refresh_replaces_the_snapshot(self):
+        get_report("test", lambda: {"total": 3})
+
+        snapshot = refresh_report("test", lambda: {"total": 4})
+
+        assert snapshot is not None
+        assert get_report("test", Mock()).data == {"total": 4}
+        assert not snapshot.is_refreshing
+
+    def test_refreshes_are_not_run_side_by_side(self):
+        ReportSnapshot.objects.create(name="test", refreshing_since=timezone.now())
+        compute = Mock(return_value={})
+
+        assert refresh_report("test", compute) is None
+        compute.assert_not_called()
+
+    def test_abandoned_refreshes_are_taken_over(self):
+        ReportSnapshot.objects.create(name="test", refreshing_since=timezone.now() - timedelta(hours=1))
+
+        assert refresh_report("test", lambda: {"total": 4}) is not None
+
+    def test_failed_refreshes_can_be_tried_again(self):
+        with pytest.raises(ConnectionError):
+            refresh_report("test", Mock(side_effect=ConnectionError))
+
+        assert refresh_report("test", lambda: {"total": 4}) is not None
+
+    @patch("judgments.views.reports.api_client")
+    def test_page_shows_the_snapshot(self, mock_api_client):
+        self.client.force_login(User.objects.get_or_create(username="testuser")[0])
+        ReportSnapshot.objects.create(
+            name="awaiting_parse",
+            data={
+                "target_parser_version": "1.2",
+                "report_limit": 200,
+                "total": 1,
+                "documents": [["/test/9", "1.1", 5]],
+            },
+            as_of=datetime(2026, 4, 2, 7, 31, 0, tzinfo=UTC),
+        )
+
+        response = self.client.get(reverse("report_awaiting_parse"))
+
+        self.assertContains(response, "/test/9")
+        self.assertContains(response, "02 Apr 2026 07:31")
+        mock_api_client.get_documents_pending_parse_for_version.assert_not_called()
+
+    @patch("judgments.views.reports.api_client")
+    def test_refresh_now(self, mock_api_client):
+        self.client.force_login(User.objects.get_or_create(username="testuser")[0])
+        mock_api_client.get_pending_enrichment_for_version.return_value = [["uri"], ["/test/123"]]
+
+        response = self.client.post(reverse("report_awaiting_enrichment"))
+
+        assert response["Location"] == reverse("report_awaiting_enrichment")
+        assert ReportSnapshot.objects.get(name="awaiting_enrichment").data["documents"] == [["/test/123"]]
+
+    @patch("judgments.views.reports.api_client")
+    def test_refresh_now_while_refreshing(self, mock_api_client):
+        self.client.force_login(User.objects.get_or_create(username="testuser")[0])
+        ReportSnapshot.objects.create(
+            name="awaiting_enrichment",
+            data={"documents": []},
+            as_of=timezone.now(),
+            refreshing_since=timezone.now(),
+        )
+
+        response = self.client.post(reverse("report_awaiting_enrichment"), follow=True)
+
+        self.assertContains(response, "already being refreshed")
+        self.assertContains(response, "They are being refreshed now.")
+        mock_api_client.get_pending_enrichment_for_version.assert_not_called()
+
+    @patch("judgments.views.reports.api_client")
+    def test_command_refreshes_every_report(self, mock_api_client):
+        mock_api_client.get_count_pending_parse_for_version.return_value = 0
+        mock_api_client.get_documents_pending_parse_for_version.return_value = [["uri"]]
+        mock_api_client.get_pending_enrichment_for_version.return_value = [["uri"]]
+
+        call_command("refresh_reports")
+
+        assert set(ReportSnapshot.objects.values_list("name", flat=True)) == {"awaiting_parse", "awaiting_enrichment"}
+
+
 class TestLockedDocumentsReports(TestCase):
     @patch("judgments.views.reports.api_client")
     def test_awaiting_parse_view(self, mock_api_client):
@@ -133,3 +330,104 @@ class TestBulkReparseRunLogReports(TestCase):
         assert response.status_code == 200
         self.assertContains(response, "Finished")
         self.assertNotContains(response, "functools.partial")
+
+
+@patch("judgments.utils.target_versions.api_client", TARGET_VERSIONS_API_CLIENT)
+@patch("judgments.views.reports.api_client")
+class TestReportExports(TestCase):
+    def setUp(self):
+        self.client.force_login(User.objects.get_or_create(username="testuser")[0])
+
+    def export(self, url_name, query=""):
+        response = self.client.get(reverse(url_name) + query)
+        return response, response.getvalue().decode()
+
+    def test_awaiting_parse_export(self, mock_api_client):
+        mock_api_client.get_documents_pending_parse_for_version.return_value = [
+            ["uri", "parser_version_string", "minutes_since_parse_request"],
+            ["/test/123", "1.2.3", 45],
+        ]
+
+        response, content = self.export("report_awaiting_parse_export")
+
+        mock_api_client.get_documents_pending_parse_for_version.assert_called_once_with((1, 2), 1000)
+        assert response["Content-Disposition"] == 'attachment; filename="awaiting-parse.csv"'
+        assert content == "uri,parser_version_string,minutes_since_parse_request\r\n/test/123,1.2.3,45\r\n"
+
+    @patch("judgments.views.reports.REPORT_EXPORT_FIRST_FETCH", 2)
+    def test_export_fetches_pages_of_growing_size(self, mock_api_client):
+        rows = [["uri"]] + [[f"/test/{number}"] for number in range(5)]
+        mock_api_client.get_documents_pending_parse_for_version.side_effect = lambda version, maximum: rows[
+            : maximum + 1
+        ]
+
+        _, content = self.export("report_awaiting_parse_export")
+
+        assert content.splitlines() == ["uri", "/test/0", "/test/1", "/test/2", "/test/3", "/test/4"]
+        assert [call.args[1] for call in mock_api_client.get_documents_pending_parse_for_version.call_args_list] == [
+            2,
+            4,
+            8,
+        ]
+
+    @patch("judgments.views.reports.REPORT_EXPORT_LIMIT", 3)
+    @patch("judgments.views.reports.REPORT_EXPORT_FIRST_FETCH", 2)
+    def test_export_says_when_it_stops_at_the_limit(self, mock_api_client):
+        rows = [["uri", "enrich_version_string"]] + [[f"/test/{number}", "1.0"] for number in range(10)]
+        mock_api_client.get_pending_enrichment_for_version.side_effect = lambda **kwargs: rows[
+            : kwargs["maximum_records"] + 1
+        ]
+
+        _, content = self.export("report_awaiting_enrichment_export")
+
+        assert content.splitlines()[1:] == [
+            "/test/0,1.0",
+            "/test/1,1.0",
+            "/test/2,1.0",
+            "Export stopped at 3 rows; there are more,",
+        ]
+        assert mock_api_client.get_pending_enrichment_for_version.call_args.kwargs["maximum_records"] == 4
+
+    def test_export_under_the_limit_is_not_marked(self, mock_api_client):
+        mock_api_client.get_locked_documents.return_value = []
+
+        _, content = self.export("report_locked_documents_export")
+
+        assert content == "document_uri,owner,timestamp,timeout\r\n"
+
+    def test_awaiting_enrichment_export_with_no_rows(self, mock_api_client):
+        mock_api_client.get_pending_enrichment_for_version.return_value = ["uri", "enrich_version_string"]
+
+        _, content = self.export("report_awaiting_enrichment_export")
+
+        assert content == "uri,enrich_version_string\r\n"
+
+    def test_locked_documents_export_as_ndjson(self, mock_api_client):
+        mock_api_client.get_locked_documents.return_value = [
+            DocumentLock(
+                document_uri=DocumentURIString("test/1234"),
+                owner="Owner string",
+                timestamp=datetime(2025, 12, 9, 13, 0, 0, tzinfo=UTC),
+                timeout=0,
+            ),
+        ]
+
+        response, content = self.export("report_locked_documents_export", "?format=ndjson")
+
+        assert response["Content-Type"] == "application/x-ndjson"
+        assert content == (
+            '{"document_uri": "test/1234", "owner": "Owner string", "timestamp": "2025-12-09T13:00:00+00:00", '
+            '"timeout": 0}\n'
+        )
+
+    def test_bulk_reparse_run_log_export(self, mock_api_client):
+        BulkReparseRunLog.objects.create(
+            start_time=datetime(2026, 4, 2, 7, 31, 0, tzinfo=UTC),
+            documents_in_queue=10,
+            target_parser_version="1.2.3",
+            status=RunStatus.STARTED,
+        )
+
+        _, content = self.export("report_bulk_reparse_run_logs_export")
+
+        assert content.splitlines()[1] == "2026-04-02T07:31:00+00:00,,Started,1.2.3,10,,,,"
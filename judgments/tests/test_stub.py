@@ -1,4 +1,4 @@
-from unittest.mock import ANY, MagicMock, call, patch
+from unittest.mock import ANY, call, patch
 
 from caselawclient.models.judgments import Judgment
 from django.contrib.auth.models import User
@@ -50,13 +50,6 @@ formatted_data = {
 }
 
 
-def make_mock_court(code="UKSC", name="UK Supreme Court"):
-    court = MagicMock()
-    court.code = code
-    court.name = name
-    return court
-
-
 class TestStubView(TestCase):
     def test_judgment_stub_view(self):
         self.client.force_login(User.objects.get_or_create(username="testuser")[0])
@@ -66,20 +59,18 @@ class TestStubView(TestCase):
         assert "Case number(s)" in decoded_response
         assert response.status_code == 200
 
-    @patch("judgments.views.stub.courts.get_all", return_value=[make_mock_court()])
     @patch("judgments.views.stub.uuid4", return_value="uuid")
     @patch("judgments.views.stub.render_stub_xml")
     @patch("judgments.views.stub.api_client.insert_document_xml")
     @patch("judgments.views.stub.api_client.set_property")
     @patch("judgments.views.stub.api_client.get_document_by_uri")
-    def test_judgment_stub_post(  # noqa: PLR0913 -- too many args
+    def test_judgment_stub_post(
         self,
         mock_get_doc,
         mock_set_property,
         mock_insert_xml,
         mock_render_stub,
         mock_uuid,
-        mock_courts,
     ):
         # judgment_template_path = Path(ROOT_DIR) / "models" / "documents" / "templates" / "judgment.xml"
         # with (judgment_template_path).open("rb") as f:
@@ -122,11 +113,10 @@ class TestStubView(TestCase):
         assert b"<uk:" in document_xml_bytes
         assert b"<akomaNtoso " in document_xml_bytes
 
-    @patch("judgments.views.stub.courts.get_all", return_value=[make_mock_court()])
     @patch("judgments.views.stub.uuid4", return_value="uuid")
     @patch("judgments.views.stub.render_stub_xml", return_value=b"<xml />")
     @patch("judgments.views.stub.api_client.insert_document_xml")
-    def test_judgment_stub_post_invalid_court(self, mock_insert_xml, mock_render_stub, mock_uuid, mock_courts):
+    def test_judgment_stub_post_invalid_court(self, mock_insert_xml, mock_render_stub, mock_uuid):
         superuser = User.objects.create_superuser(username="clark")
         self.client.force_login(superuser)
         modified_post_data = dict(**post_data)
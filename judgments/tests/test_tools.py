@@ -53,3 +53,21 @@ class TestToolsViews(TestCase):
         assert "Published documents missing FCLID" in decoded_response
         assert "ewhc/kb/2025/1" in decoded_response
         mock_api_client.get_missing_fclid.assert_called_once_with(maximum_records=200)
+
+    def test_missing_fclid_export_forbidden_for_non_developer(self):
+        self.client.force_login(self.standard_user)
+
+        response = self.client.get(reverse("tools_missing_fclid_export"))
+
+        assert response.status_code == 403
+
+    @patch("judgments.views.tools.api_client")
+    def test_missing_fclid_export(self, mock_api_client):
+        self.client.force_login(self.developer_user)
+        mock_api_client.get_missing_fclid.return_value = ["/ewhc/kb/2025/1.xml"]
+
+        response = self.client.get(reverse("tools_missing_fclid_export"))
+
+        assert response["Content-Disposition"] == 'attachment; filename="missing-fclid.csv"'
+        assert response.getvalue().decode() == ("marklogic_uri,document_uri\r\n/ewhc/kb/2025/1.xml,ewhc/kb/2025/1\r\n")
+        mock_api_client.get_missing_fclid.assert_called_once_with(maximum_records=1000)
@@ -76,6 +76,8 @@ class TestJudgmentViewsRequireAuthentication(TestCase):
             reverse("home"),
             reverse("components"),
             reverse("results"),
+            reverse("document-list-export"),
+            reverse("ncn-typeahead"),
             reverse("signed-asset", kwargs={"key": "path/to/asset.xml"}),
             reverse("upload"),
             reverse("publish"),
@@ -89,12 +91,17 @@ class TestJudgmentViewsRequireAuthentication(TestCase):
             reverse("stub"),
             reverse("reports"),
             reverse("report_awaiting_parse"),
+            reverse("report_awaiting_parse_export"),
             reverse("report_bulk_reparse_run_logs"),
+            reverse("report_bulk_reparse_run_logs_export"),
             reverse("report_bulk_reparse_run_log_detail", kwargs={"pk": 1}),
             reverse("report_awaiting_enrichment"),
+            reverse("report_awaiting_enrichment_export"),
             reverse("report_locked_documents"),
+            reverse("report_locked_documents_export"),
             reverse("tools"),
             reverse("tools_missing_fclid"),
+            reverse("tools_missing_fclid_export"),
             reverse("create-stub-document"),
         ]
 
@@ -137,3 +137,44 @@ class TestDocumentView(TestCase):
         view.setup(request, document_uri="eat/2023/1")
 
         assert view.get_context_data()["page_title"] == "Untitled document"
+
+    @patch("judgments.utils.view_helpers.build_jira_create_link")
+    @patch("judgments.utils.view_helpers.get_linked_document_uri")
+    @patch("judgments.utils.view_helpers.get_document_by_uri_or_404")
+    def test_document_view_reports_context_timings(
+        self,
+        mock_get_document_by_uri,
+        mock_get_linked_document_uri,
+        mock_build_jira_create_link,
+    ):
+        self.client.force_login(User.objects.get_or_create(username="testuser")[0])
+        mock_get_document_by_uri.return_value = JudgmentFactory.build(uri=DocumentURIString("eat/2023/1"))
+        mock_get_linked_document_uri.return_value = "eat/2023/1/press-summary/1"
+        mock_build_jira_create_link.return_value = "https://jira.example/create"
+
+        response = self.client.get("/eat/2023/1?no-redirect=1")
+
+        assert response.status_code == 200
+        assert b"https://jira.example/create" in response.content
+        for name in ("document_html", "jira_create_link", "linked_document_uri"):
+            assert f"{name};dur=" in response["Server-Timing"]
+        assert "editors;dur=" not in response["Server-Timing"]
+
+    @patch("judgments.utils.view_helpers.get_document_html")
+    @patch("judgments.utils.view_helpers.get_linked_document_uri")
+    @patch("judgments.utils.view_helpers.get_document_by_uri_or_404")
+    def test_document_view_only_renders_html_when_template_uses_it(
+        self,
+        mock_get_document_by_uri,
+        mock_get_linked_document_uri,
+        mock_get_document_html,
+    ):
+        self.client.force_login(User.objects.get_or_create(username="testuser")[0])
+        mock_get_document_by_uri.return_value = JudgmentFactory.build(uri=DocumentURIString("eat/2023/1"))
+        mock_get_linked_document_uri.return_value = None
+
+        response = self.client.get("/eat/2023/1/identifiers")
+
+        assert response.status_code == 200
+        mock_get_document_html.assert_not_called()
+        assert "document_html;dur=" not in response["Server-Timing"]
@@ -0,0 +1,44 @@
+import gzip
+from unittest.mock import patch
+
+from caselawclient.errors import MarklogicNotPermittedError
+from django.contrib.auth.models import User
+from django.test import TestCase
+
+from judgments.views.document_full_text import _chunks
+
+SAMPLE_XML = b'<akomaNtoso xmlns="http://docs.oasis-open.org/legaldocml/ns/akn/3.0"><judgment/></akomaNtoso>'
+
+
+@patch("judgments.views.document_full_text.api_client.get_judgment_xml_bytestring", return_value=SAMPLE_XML)
+class TestXMLDownload(TestCase):
+    def setUp(self):
+        self.client.force_login(User.objects.get_or_create(username="testuser")[0])
+
+    def test_streams_xml(self, mock_get_xml):
+        response = self.client.get("/eat/2023/1/xml")
+
+        assert response.status_code == 200
+        assert response.streaming
+        assert response.getvalue() == SAMPLE_XML
+        assert response["Content-Type"] == "application/xml"
+        assert response["Content-Length"] == str(len(SAMPLE_XML))
+        assert response["Content-Disposition"] == "attachment; filename=eat/2023/1.xml"
+        mock_get_xml.assert_called_once_with("eat/2023/1", show_unpublished=True)
+
+    def test_gzips_xml_when_accepted(self, mock_get_xml):
+        response = self.client.get("/eat/2023/1/xml", headers={"Accept-Encoding": "gzip, deflate"})
+
+        assert response["Content-Encoding"] == "gzip"
+        assert "Accept-Encoding" in response["Vary"]
+        assert gzip.decompress(response.getvalue()) == SAMPLE_XML
+
+    def test_missing_document_is_not_found(self, mock_get_xml):
+        mock_get_xml.side_effect = MarklogicNotPermittedError
+
+        assert self.client.get("/eat/2023/1/xml").status_code == 404
+
+
+class TestChunks:
+    def test_splits_content_into_chunks(self):
+        assert list(_chunks(b"abcdefg", chunk_size=3)) == [b"abc", b"def", b"g"]
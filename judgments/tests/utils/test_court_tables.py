@@ -0,0 +1,42 @@
+import pytest
+from django.core.exceptions import ValidationError
+from django.forms import ChoiceField
+from ds_caselaw_utils import courts
+
+from judgments.utils.court_tables import COURT_TABLES
+from judgments.views.stub import StubForm, is_valid_court
+
+
+class TestCourtTables:
+    def test_all_courts_match_registry(self):
+        assert [court.code for court in COURT_TABLES.all_courts] == [
+            court.code for court in courts.get_all(with_jurisdictions=True)
+        ]
+
+    def test_choices(self):
+        assert ("UKSC", "United Kingdom Supreme Court") in COURT_TABLES.choices
+        assert len(COURT_TABLES.choices) == len(COURT_TABLES.all_courts)
+
+    def test_lookups(self):
+        assert COURT_TABLES.by_code["UKSC"].name == "United Kingdom Supreme Court"
+        assert COURT_TABLES.by_param["uksc"].code == "UKSC"
+        assert COURT_TABLES.all_by_code["UKFTT-GRC/Charity"].name.endswith("Charity")
+        assert "UKFTT-GRC/Charity" not in COURT_TABLES.by_code
+
+    def test_tables_cannot_be_changed(self):
+        with pytest.raises(TypeError):
+            COURT_TABLES.by_code["NEW"] = COURT_TABLES.by_code["UKSC"]  # type: ignore[index]
+
+
+class TestStubFormCourts:
+    def test_court_choices_come_from_tables(self):
+        court_field = StubForm().fields["court_code"]
+
+        assert isinstance(court_field, ChoiceField)
+        assert court_field.choices == [("", "Select a court"), *COURT_TABLES.choices]
+
+    def test_is_valid_court(self):
+        is_valid_court("uksc")
+
+        with pytest.raises(ValidationError):
+            is_valid_court("not_a_court_code")
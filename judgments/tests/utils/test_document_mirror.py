@@ -0,0 +1,263 @@
+from datetime import UTC, date, datetime
+from unittest.mock import MagicMock, Mock, patch
+
+from caselawclient.errors import DocumentNotFoundError
+from caselawclient.factories import SearchResultFactory
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from judgments.models import DocumentListEntry
+from judgments.utils.court_tables import COURT_TABLES
+from judgments.utils.document_cache import document_cache, invalidate_document_caches
+from judgments.utils.document_list import DocumentListFilters
+from judgments.utils.document_mirror import (
+    can_list_from_mirror,
+    encode_cursor,
+    list_from_mirror,
+    mirror_document,
+    reconcile_document_list_mirror,
+)
+from judgments.utils.search_facets import SearchFacets
+
+PROPERTIES = """<property-results>
+  <property-result uri="/test/2023/1.xml">
+    <assigned-to>editor</assigned-to>
+    <editor-hold>true</editor-hold>
+    <source-name>Uploader</source-name>
+    <transfer-consignment-reference>TDR-1</transfer-consignment-reference>
+    <transfer-received-at>2023-02-03T09:12:34Z</transfer-received-at>
+  </property-result>
+  <property-result uri="/test/2023/2.xml">
+    <published>true</published>
+  </property-result>
+</property-results>"""
+
+
+def mock_document():
+    document = Mock()
+    document.identifiers.preferred.return_value = Mock(value="[2023] UKSC 1")
+    document.body.name = "A v B"
+    document.body.court_and_jurisdiction_identifier_string = "UKSC"
+    document.body.document_date_as_date = date(2023, 1, 2)
+    document.body.transformation_datetime = datetime(2023, 1, 3, tzinfo=UTC)
+    return document
+
+
+def entry(uri, **fields):
+    return DocumentListEntry.objects.create(uri=uri, **fields)
+
+
+@override_settings(DOCUMENT_LIST_MIRROR=True)
+@patch("judgments.utils.document_mirror.api_client")
+class TestMirrorDocument(TestCase):
+    def test_copies_document(self, mock_api_client):
+        document = mock_document()
+        mock_api_client.get_document_by_uri.return_value = document
+        mock_api_client.get_properties_for_search_results.return_value = PROPERTIES
+        mock_api_client.get_last_modified.return_value = "2023-01-04T10:00:00.123Z"
+
+        assert mirror_document("/test/2023/1") is document
+
+        entry = DocumentListEntry.objects.get(uri="test/2023/1")
+        assert entry.name == "A v B"
+        assert entry.neutral_citation == "[2023] UKSC 1"
+        assert entry.court.name == "United Kingdom Supreme Court"
+        assert entry.date == date(2023, 1, 2)
+        assert entry.last_modified == datetime(2023, 1, 4, 10, 0, 0, 123000, tzinfo=UTC)
+        assert entry.submission_datetime == datetime(2023, 2, 3, 9, 12, 34, tzinfo=UTC)
+        assert entry.author == "Uploader"
+        assert entry.consignment_reference == "TDR-1"
+        assert entry.held is True
+        assert entry.published is False
+        assert entry.editor_status == "hold"
+
+    def test_deleted_documents_are_removed(self, mock_api_client):
+        entry("test/2023/1")
+        mock_api_client.get_document_by_uri.side_effect = DocumentNotFoundError()
+
+        assert mirror_document("test/2023/1") is None
+        assert not DocumentListEntry.objects.exists()
+
+    def test_versions_are_not_mirrored(self, mock_api_client):
+        assert mirror_document("test/2023/1/xml_versions/3-1") is None
+
+        mock_api_client.get_document_by_uri.assert_not_called()
+
+    @override_settings(DOCUMENT_LIST_MIRROR=False)
+    def test_does_nothing_when_off(self, mock_api_client):
+        assert mirror_document("test/2023/1") is None
+
+        mock_api_client.get_document_by_uri.assert_not_called()
+
+    @override_settings(DOCUMENT_CACHE_TIMEOUT=10)
+    @patch("judgments.utils.document_cache.close_old_connections")
+    @patch("judgments.utils.document_cache.submit")
+    def test_changing_a_document_mirrors_it_off_the_request(self, mock_submit, mock_close_connections, mock_api_client):
+        document = mock_document()
+        mock_api_client.get_document_by_uri.return_value = document
+        mock_api_client.get_properties_for_search_results.return_value = PROPERTIES
+        mock_api_client.get_last_modified.return_value = ""
+
+        invalidate_document_caches("test/2023/1")
+
+        # The pool thread would have its own database connection, outside the test's transaction, so the submitted call
+        # is run here instead, without closing the test's connection.
+        assert not DocumentListEntry.objects.exists()
+        mock_submit.call_args.args[0]()
+        assert mock_close_connections.called
+
+        assert DocumentListEntry.objects.filter(uri="test/2023/1").exists()
+        cached = document_cache.get("test/2023/1")
+        assert cached is not None
+        assert cached.body.name == "A v B"
+        document_cache.clear()
+
+
+@patch("judgments.utils.document_mirror.api_client")
+class TestReconcileDocumentListMirror(TestCase):
+    def test_copies_every_result_and_removes_the_rest(self, mock_api_client):
+        entry("test/2023/1", name="Old name")
+        entry("test/2023/3")
+        mock_api_client.get_properties_for_search_results.return_value = PROPERTIES
+        mock_api_client.get_last_modified.return_value = "2023-01-04T10:00:00Z"
+        results = [
+            SearchResultFactory.build(uri="test/2023/1", name="A v B", court=COURT_TABLES.by_code["UKSC"]),
+            SearchResultFactory.build(uri="test/2023/2", name="C v D", court=None, transformation_date=""),
+        ]
+
+        assert reconcile_document_list_mirror(results) == (2, 1)
+
+        assert DocumentListEntry.objects.get(uri="test/2023/1").name == "A v B"
+        assert DocumentListEntry.objects.get(uri="test/2023/2").published is True
+        assert not DocumentListEntry.objects.filter(uri="test/2023/3").exists()
+        mock_api_client.get_properties_for_search_results.assert_called_once_with(["test/2023/1", "test/2023/2"])
+
+    @patch("judgments.management.commands.reconcile_document_list_mirror.iter_search_results")
+    def test_command_walks_every_document(self, mock_iter_search_results, mock_api_client):
+        mock_iter_search_results.return_value = []
+
+        call_command("reconcile_document_list_mirror")
+
+        assert mock_iter_search_results.call_args.args[0].publication_status == "all"
+
+
+@override_settings(DOCUMENT_LIST_MIRROR=True)
+class TestListFromMirror(TestCase):
+    def setUp(self):
+        entry("uksc/2023/1", court_code="UKSC", date=date(2023, 5, 1))
+        entry("uksc/2022/1", court_code="UKSC", date=date(2022, 5, 1), published=True)
+        entry("grc/2023/1", court_code="UKFTT-GRC/Charity", date=date(2023, 6, 1))
+        entry("nodate", court_code="UKSC")
+
+    def uris(self, **filters):
+        return [document.uri for document in list_from_mirror(DocumentListFilters(**filters)).documents]
+
+    def test_filters_by_publication_status(self):
+        assert self.uris() == ["grc/2023/1", "uksc/2023/1", "nodate"]
+        assert self.uris(publication_status="published") == ["uksc/2022/1"]
+
+    def test_filters_by_court_including_jurisdictions(self):
+        assert self.uris(courts=["uksc"], publication_status="all") == ["uksc/2023/1", "uksc/2022/1", "nodate"]
+        court_param = COURT_TABLES.by_code["UKFTT-GRC"].canonical_param
+        assert self.uris(courts=[court_param]) == ["grc/2023/1"]
+
+    def test_filters_by_year(self):
+        assert self.uris(from_year=2022, to_year=2022, publication_status="all") == ["uksc/2022/1"]
+
+    def test_orders(self):
+        assert self.uris(order="date", publication_status="all") == [
+            "uksc/2022/1",
+            "uksc/2023/1",
+            "grc/2023/1",
+            "nodate",
+        ]
+
+    @patch("judgments.utils.document_mirror.RESULTS_PER_PAGE", 2)
+    def test_pages(self):
+        page = list_from_mirror(DocumentListFilters(page=2))
+
+        assert [document.uri for document in page.documents] == ["nodate"]
+        assert page.total == 3
+
+    @patch("judgments.utils.document_mirror.RESULTS_PER_PAGE", 2)
+    def test_pages_near_the_end_are_found_from_the_end(self):
+        assert self.uris(page=2, publication_status="all") == ["uksc/2022/1", "nodate"]
+        assert self.uris(page=3, publication_status="all") == []
+
+    def test_pages_by_cursor(self):
+        self.walk_by_cursor(order="-date")
+        self.walk_by_cursor(order="date")
+        self.walk_by_cursor(order="-updated")
+
+    @patch("judgments.utils.document_mirror.RESULTS_PER_PAGE", 1)
+    def walk_by_cursor(self, order):
+        expected = self.uris(order=order, publication_status="all", page=1)
+        expected += [self.uris(order=order, publication_status="all", page=page)[0] for page in (2, 3, 4)]
+
+        forwards = [list_from_mirror(DocumentListFilters(order=order, publication_status="all"))]
+        for _ in range(3):
+            forwards.append(
+                list_from_mirror(
+                    DocumentListFilters(order=order, publication_status="all", after=forwards[-1].next_cursor),
+                ),
+            )
+        assert [page.documents[0].uri for page in forwards] == expected
+
+        backwards = [forwards[-1]]
+        for _ in range(3):
+            backwards.append(
+                list_from_mirror(
+                    DocumentListFilters(order=order, publication_status="all", before=backwards[-1].previous_cursor),
+                ),
+            )
+        assert [page.documents[0].uri for page in backwards] == expected[::-1]
+
+    def test_bad_cursors_are_ignored(self):
+        assert self.uris(after="not a cursor") == self.uris()
+
+    def test_counts_facets_without_court_and_year_filters(self):
+        page = list_from_mirror(DocumentListFilters(courts=["uksc"], from_year=2023))
+
+        assert page.facets == SearchFacets(courts={"UKSC": 2, "UKFTT-GRC": 1}, years={2023: 2})
+
+    def test_only_lists_which_are_not_searches(self):
+        assert can_list_from_mirror(DocumentListFilters(order="-updated"))
+        assert not can_list_from_mirror(DocumentListFilters(query="foo"))
+        assert not can_list_from_mirror(DocumentListFilters(order="relevance"))
+
+        with self.settings(DOCUMENT_LIST_MIRROR=False):
+            assert not can_list_from_mirror(DocumentListFilters())
+
+
+@override_settings(DOCUMENT_LIST_MIRROR=True)
+@patch("judgments.utils.view_helpers.search_and_parse_response")
+class TestDocumentListFromMirror(TestCase):
+    def setUp(self):
+        entry("uksc/2023/1", name="A v B", court_code="UKSC", date=date(2023, 5, 1))
+        self.client.force_login(User.objects.get_or_create(username="testuser")[0])
+
+    def test_list_comes_from_mirror(self, mock_search):
+        content = self.client.get(reverse("home")).content.decode()
+
+        mock_search.assert_not_called()
+        assert "A v B" in content
+        assert "1 unpublished documents" in content
+
+    @patch("judgments.utils.paginator.RESULTS_PER_PAGE", 1)
+    @patch("judgments.utils.document_mirror.RESULTS_PER_PAGE", 1)
+    def test_next_page_link_has_a_cursor(self, mock_search):
+        entry("uksc/2022/1", court_code="UKSC", date=date(2022, 5, 1))
+
+        response = self.client.get(reverse("home") + "?page=1")
+        cursor = encode_cursor(DocumentListEntry.objects.get(uri="uksc/2023/1"), "-date")
+
+        assert f"/?page=2&amp;after={cursor}" in response.content.decode()
+
+    def test_searches_go_to_marklogic(self, mock_search):
+        mock_search.return_value = MagicMock(total=0, results=[], facets={})
+
+        self.client.get(reverse("results") + "?query=foo")
+
+        mock_search.assert_called_once()
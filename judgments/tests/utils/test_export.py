@@ -0,0 +1,13 @@
+from judgments.utils.export import csv_lines, ndjson_lines
+
+
+class TestCsvLines:
+    def test_writes_header_then_rows(self):
+        lines = csv_lines(["a", "b"], iter([{"a": 1, "b": "x,y"}, {"a": 2, "b": ""}]))
+
+        assert list(lines) == ["a,b\r\n", '1,"x,y"\r\n', "2,\r\n"]
+
+
+class TestNdjsonLines:
+    def test_writes_one_object_per_line(self):
+        assert list(ndjson_lines([{"a": 1}, {"a": 2}])) == ['{"a": 1}\n', '{"a": 2}\n']
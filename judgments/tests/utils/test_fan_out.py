@@ -0,0 +1,68 @@
+import threading
+
+import pytest
+
+from judgments.utils.fan_out import fan_out, server_timing_header, submit
+
+
+class TestFanOut:
+    def test_returns_results_and_timings_by_name(self):
+        results, timings = fan_out(
+            {
+                "one": lambda: 1,
+                "two": lambda: 2,
+            },
+        )
+
+        assert results == {"one": 1, "two": 2}
+        assert set(timings) == {"one", "two"}
+        assert all(duration >= 0 for duration in timings.values())
+
+    def test_calls_run_concurrently(self):
+        # Each call waits for the other to start, so this only finishes if they run side by side.
+        barrier = threading.Barrier(2, timeout=5)
+
+        results, _ = fan_out(
+            {
+                "one": lambda: barrier.wait() is not None,
+                "two": lambda: barrier.wait() is not None,
+            },
+        )
+
+        assert results == {"one": True, "two": True}
+
+    def test_inline_calls_run_on_calling_thread(self):
+        results, _ = fan_out(
+            {
+                "inline": threading.get_ident,
+                "pooled": threading.get_ident,
+            },
+            inline=["inline"],
+        )
+
+        assert results["inline"] == threading.get_ident()
+        assert results["pooled"] != threading.get_ident()
+
+    def test_calls_run_inline_on_the_pool(self):
+        def nested():
+            results, _ = fan_out({"one": threading.get_ident, "two": threading.get_ident})
+            return results, threading.get_ident()
+
+        (results, pool_thread), _ = submit(nested).result(timeout=5)
+
+        assert results == {"one": pool_thread, "two": pool_thread}
+
+    def test_exceptions_are_reraised(self):
+        def fail():
+            msg = "MarkLogic is down"
+            raise RuntimeError(msg)
+
+        with pytest.raises(RuntimeError, match="MarkLogic is down"):
+            fan_out({"fine": lambda: 1, "broken": fail})
+
+
+class TestServerTimingHeader:
+    def test_formats_durations_in_milliseconds(self):
+        assert server_timing_header({"document_html": 0.1234, "editors": 0.002}) == (
+            "document_html;dur=123.4, editors;dur=2.0"
+        )
@@ -0,0 +1,134 @@
+from unittest.mock import Mock
+
+from django.core.cache import caches
+from django.test import TestCase, override_settings
+
+from judgments.utils.document_cache import invalidate_document_caches
+from judgments.utils.html_cache import (
+    get_document_html,
+    get_or_render_version_html,
+    invalidate_document_html,
+    latest_version_number,
+    version_html_cache_key,
+)
+
+HTML_CACHES = {
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+    "document_html": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "test_document_html",
+        "TIMEOUT": None,
+        "OPTIONS": {"MAX_ENTRIES": 2, "CULL_FREQUENCY": 2},
+    },
+}
+
+
+@override_settings(CACHES=HTML_CACHES)
+class HtmlCacheTestCase(TestCase):
+    pass
+
+
+class TestVersionHtmlCacheKey(TestCase):
+    def test_key_uses_document_uri_and_version_number(self):
+        assert version_html_cache_key("eat/2023/1_xml_versions/3-1234") == "version_html:eat/2023/1:3"
+        assert version_html_cache_key("/eat/2023/1_xml_versions/3-TDR") == "version_html:eat/2023/1:3"
+
+    def test_non_version_uri_has_no_key(self):
+        assert version_html_cache_key("eat/2023/1") is None
+
+
+class TestGetOrRenderVersionHtml(HtmlCacheTestCase):
+    def setUp(self):
+        caches["document_html"].clear()
+
+    def test_version_is_only_rendered_once(self):
+        render = Mock(return_value="<p>Version 3</p>")
+
+        assert get_or_render_version_html("eat/2023/1_xml_versions/3-1234", render) == "<p>Version 3</p>"
+        assert get_or_render_version_html("eat/2023/1_xml_versions/3-1234", render) == "<p>Version 3</p>"
+
+        render.assert_called_once()
+
+    def test_least_recently_used_version_is_evicted(self):
+        get_or_render_version_html("eat/2023/1_xml_versions/1-1", Mock(return_value="v1"))
+        get_or_render_version_html("eat/2023/1_xml_versions/2-1", Mock(return_value="v2"))
+        get_or_render_version_html("eat/2023/1_xml_versions/1-1", Mock())
+        get_or_render_version_html("eat/2023/1_xml_versions/3-1", Mock(return_value="v3"))
+
+        assert caches["document_html"].get("version_html:eat/2023/1:1") == "v1"
+        assert caches["document_html"].get("version_html:eat/2023/1:2") is None
+        assert caches["document_html"].get("version_html:eat/2023/1:3") == "v3"
+
+    def test_versions_are_cached_separately(self):
+        get_or_render_version_html("eat/2023/1_xml_versions/3-1234", Mock(return_value="<p>Version 3</p>"))
+
+        assert (
+            get_or_render_version_html("eat/2023/1_xml_versions/4-1234", Mock(return_value="<p>Version 4</p>"))
+            == "<p>Version 4</p>"
+        )
+
+    def test_non_version_uri_is_always_rendered(self):
+        render = Mock(return_value="<p>Latest</p>")
+
+        get_or_render_version_html("eat/2023/1", render)
+        get_or_render_version_html("eat/2023/1", render)
+
+        assert render.call_count == 2
+
+
+def build_document(uri="eat/2023/1", versions=None, html="<p>Judgment</p>"):
+    document = Mock()
+    document.uri = uri
+    document.versions = versions if versions is not None else [{"uri": f"{uri}_xml_versions/2-1", "version": 2}]
+    document.content_as_html.return_value = html
+    return document
+
+
+class TestLatestVersionNumber(TestCase):
+    def test_latest_version_number(self):
+        document = build_document(
+            versions=[
+                {"uri": "eat/2023/1_xml_versions/3-1", "version": 3},
+                {"uri": "eat/2023/1_xml_versions/2-1", "version": 2},
+            ],
+        )
+
+        assert latest_version_number(document) == 3
+
+    def test_unversioned_document(self):
+        assert latest_version_number(build_document(versions=[])) == 0
+
+
+class TestGetDocumentHtml(HtmlCacheTestCase):
+    def setUp(self):
+        caches["document_html"].clear()
+
+    def test_document_is_only_rendered_once_per_version(self):
+        document = build_document()
+
+        assert get_document_html(document) == "<p>Judgment</p>"
+        assert get_document_html(build_document(html="<p>Unused</p>")) == "<p>Judgment</p>"
+
+        document.content_as_html.assert_called_once()
+
+    def test_new_version_is_rerendered(self):
+        get_document_html(build_document())
+
+        new_version = build_document(
+            versions=[{"uri": "eat/2023/1_xml_versions/3-1", "version": 3}],
+            html="<p>Edited judgment</p>",
+        )
+
+        assert get_document_html(new_version) == "<p>Edited judgment</p>"
+
+    def test_invalidation_forces_rerender(self):
+        get_document_html(build_document())
+        invalidate_document_html("eat/2023/1")
+
+        assert get_document_html(build_document(html="<p>Edited judgment</p>")) == "<p>Edited judgment</p>"
+
+    def test_invalidating_document_caches_drops_html(self):
+        get_document_html(build_document())
+        invalidate_document_caches("/eat/2023/1")
+
+        assert get_document_html(build_document(html="<p>Published judgment</p>")) == "<p>Published judgment</p>"
@@ -0,0 +1,57 @@
+import threading
+from unittest.mock import Mock
+
+from jinja2 import DictLoader, Environment
+
+from judgments.utils.lazy_context import LazyContext, LazyContextValue
+
+
+class TestLazyContextValue:
+    def test_computes_value_once(self):
+        compute = Mock(return_value="value")
+        value = LazyContextValue(compute)
+
+        assert value.resolve() == "value"
+        assert value.resolve() == "value"
+        compute.assert_called_once()
+        assert value.duration is not None
+
+    def test_does_not_compute_until_resolved(self):
+        compute = Mock()
+        value = LazyContextValue(compute)
+
+        compute.assert_not_called()
+        assert not value.resolved
+        assert value.duration is None
+
+    def test_start_computes_on_another_thread(self):
+        value = LazyContextValue(threading.current_thread)
+        value.start()
+
+        assert value.resolve() is not threading.current_thread()
+
+
+class TestLazyContext:
+    environment = Environment(autoescape=True)
+    environment.context_class = LazyContext
+
+    def test_template_resolves_lazy_values(self):
+        template = self.environment.from_string("{{ greeting }}, {{ name }}")
+
+        assert template.render(greeting=LazyContextValue(lambda: "Hello"), name="world") == "Hello, world"
+
+    def test_template_only_computes_values_it_uses(self):
+        unused = Mock()
+        template = self.environment.from_string("{{ used }}")
+
+        assert template.render(used="done", unused=LazyContextValue(unused)) == "done"
+        unused.assert_not_called()
+
+    def test_included_templates_resolve_lazy_values(self):
+        environment = Environment(
+            autoescape=True,
+            loader=DictLoader({"inner": "{{ value }}", "outer": "{% include 'inner' %}"}),
+        )
+        environment.context_class = LazyContext
+
+        assert environment.get_template("outer").render(value=LazyContextValue(lambda: "included")) == "included"
@@ -0,0 +1,184 @@
+from unittest.mock import Mock, patch
+
+from caselawclient.factories import JudgmentFactory, SearchResultFactory
+from caselawclient.models.identifiers.collection import IdentifiersCollection
+from caselawclient.models.identifiers.neutral_citation import NeutralCitationNumber
+from caselawclient.types import DocumentURIString
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from judgments.models import NeutralCitationIndexEntry
+from judgments.utils.ncn_index import (
+    citations_starting_with,
+    document_uri_for_citation,
+    index_document_citations,
+    normalise_citation,
+    rebuild_ncn_index,
+    remove_document_citations,
+)
+from judgments.views.judgment_edit import update_ncn_of_document
+
+
+def entry(uri, citation):
+    return NeutralCitationIndexEntry.objects.create(
+        uri=uri,
+        neutral_citation=citation,
+        normalised_citation=normalise_citation(citation),
+    )
+
+
+def identifiers(*values):
+    return IdentifiersCollection({identifier.uuid: identifier for identifier in values})
+
+
+def indexed_citations():
+    return sorted(NeutralCitationIndexEntry.objects.values_list("uri", "neutral_citation"))
+
+
+def test_normalise_citation():
+    assert normalise_citation("  [2023]  uksc\t1 ") == "[2023] UKSC 1"
+
+
+@override_settings(NCN_INDEX=True)
+class TestIndexDocumentCitations(TestCase):
+    def test_replaces_the_documents_citations(self):
+        entry("uksc/2023/1", "[2023] UKSC 99")
+        entry("uksc/2023/2", "[2023] UKSC 2")
+        document = JudgmentFactory.build(uri=DocumentURIString("uksc/2023/1"))
+        document.identifiers.add(NeutralCitationNumber("[2023] UKSC 1"))
+        document.identifiers.add(NeutralCitationNumber("[2022] UKSC 5", deprecated=True))
+
+        index_document_citations(document)
+
+        assert indexed_citations() == [("uksc/2023/1", "[2023] UKSC 1"), ("uksc/2023/2", "[2023] UKSC 2")]
+
+    def test_remove_document_citations(self):
+        entry("uksc/2023/1", "[2023] UKSC 1")
+
+        remove_document_citations("/uksc/2023/1")
+
+        assert indexed_citations() == []
+
+    @override_settings(NCN_INDEX=False)
+    def test_does_nothing_when_off(self):
+        document = JudgmentFactory.build(uri=DocumentURIString("uksc/2023/1"))
+        document.identifiers.add(NeutralCitationNumber("[2023] UKSC 1"))
+
+        index_document_citations(document)
+
+        assert indexed_citations() == []
+
+    @patch("judgments.views.judgment_edit.api_client")
+    def test_updating_an_ncn_indexes_it(self, mock_api_client):
+        entry("uksc/2023/1", "[2023] UKSC 99")
+        document = JudgmentFactory.build(uri=DocumentURIString("uksc/2023/1"))
+        document.save_identifiers = Mock()  # type:ignore[method-assign]
+
+        update_ncn_of_document(document, "[2023] UKSC 1")
+
+        assert indexed_citations() == [("uksc/2023/1", "[2023] UKSC 1")]
+
+
+@override_settings(NCN_INDEX=True)
+class TestRebuildNCNIndex(TestCase):
+    def test_replaces_the_index(self):
+        entry("uksc/2023/3", "[2023] UKSC 3")
+        results = [
+            SearchResultFactory.build(
+                uri="uksc/2023/1",
+                identifiers=identifiers(NeutralCitationNumber(value="[2023] UKSC 1")),
+            ),
+            SearchResultFactory.build(uri="uksc/2023/2", identifiers=identifiers()),
+        ]
+
+        assert rebuild_ncn_index(results) == 1
+
+        assert indexed_citations() == [("uksc/2023/1", "[2023] UKSC 1")]
+
+    def test_indexes_every_current_citation(self):
+        results = [
+            SearchResultFactory.build(
+                uri="ewhc/2023/1",
+                identifiers=identifiers(
+                    NeutralCitationNumber(value="[2023] EWHC 1 (Ch)"),
+                    NeutralCitationNumber(value="[2023] EWHC 2 (Ch)"),
+                    NeutralCitationNumber(value="[2023] EWHC 3 (Ch)", deprecated=True),
+                ),
+            ),
+        ]
+
+        assert rebuild_ncn_index(results) == 2
+
+        assert indexed_citations() == [("ewhc/2023/1", "[2023] EWHC 1 (Ch)"), ("ewhc/2023/1", "[2023] EWHC 2 (Ch)")]
+
+    @patch("judgments.management.commands.rebuild_ncn_index.iter_search_results")
+    def test_command_walks_every_document(self, mock_iter_search_results):
+        mock_iter_search_results.return_value = []
+
+        call_command("rebuild_ncn_index")
+
+        assert mock_iter_search_results.call_args.args[0].publication_status == "all"
+
+
+@override_settings(NCN_INDEX=True)
+class TestLookups(TestCase):
+    def setUp(self):
+        entry("uksc/2023/1", "[2023] UKSC 1")
+        entry("uksc/2023/10", "[2023] UKSC 10")
+        entry("ewhc/2023/1", "[2023] EWHC 1 (Ch)")
+        entry("ewhc/2023/2", "[2023] EWHC 1 (Ch)")
+
+    def test_citations_starting_with(self):
+        assert [e.uri for e in citations_starting_with("[2023] uksc 1")] == ["uksc/2023/1", "uksc/2023/10"]
+        assert [e.uri for e in citations_starting_with("[2023] UKSC 1", limit=1)] == ["uksc/2023/1"]
+        assert citations_starting_with("  ") == []
+
+    def test_document_uri_for_citation(self):
+        assert document_uri_for_citation("[2023]  uksc 1") == "uksc/2023/1"
+        assert document_uri_for_citation("[2023] UKSC") is None
+        assert document_uri_for_citation("[2023] EWHC 1 (Ch)") is None
+
+    @override_settings(NCN_INDEX=False)
+    def test_no_lookups_when_off(self):
+        assert citations_starting_with("[2023]") == []
+        assert document_uri_for_citation("[2023] UKSC 1") is None
+
+
+@override_settings(NCN_INDEX=True)
+class TestNCNSearchViews(TestCase):
+    def setUp(self):
+        entry("uksc/2023/1", "[2023] UKSC 1")
+        self.client.force_login(User.objects.get_or_create(username="testuser")[0])
+
+    def test_typeahead(self):
+        response = self.client.get(reverse("ncn-typeahead") + "?q=[2023] uk")
+
+        assert response.json() == {
+            "results": [
+                {
+                    "neutral_citation": "[2023] UKSC 1",
+                    "uri": "uksc/2023/1",
+                    "url": reverse("full-text-html", kwargs={"document_uri": "uksc/2023/1"}),
+                },
+            ],
+        }
+
+    def test_typeahead_needs_a_few_characters(self):
+        assert self.client.get(reverse("ncn-typeahead") + "?q=[2").json() == {"results": []}
+
+    @patch("judgments.utils.view_helpers.search_and_parse_response")
+    def test_exact_ncn_search_goes_to_the_document(self, mock_search):
+        response = self.client.get(reverse("results") + "?search_filter=ncn&query=[2023] uksc 1")
+
+        assert response.status_code == 302
+        assert response["Location"] == reverse("full-text-html", kwargs={"document_uri": "uksc/2023/1"})
+        mock_search.assert_not_called()
+
+    @patch("judgments.utils.view_helpers.search_and_parse_response")
+    def test_other_searches_are_listed(self, mock_search):
+        mock_search.return_value = Mock(total=0, results=[], facets={})
+
+        assert self.client.get(reverse("results") + "?search_filter=ncn&query=[2023] UKSC 2").status_code == 200
+        assert self.client.get(reverse("results") + "?query=[2023] UKSC 1").status_code == 200
@@ -0,0 +1,96 @@
+from datetime import UTC, datetime, timedelta
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from judgments.jinja import duration
+from judgments.models import QueueDepthSnapshot
+from judgments.utils.queue_depths import QUEUE_COUNT_LIMIT, QueueTrend, queue_trends
+
+LATEST = datetime(2026, 4, 2, 12, 0, 0, tzinfo=UTC)
+
+
+def snapshot(recorded_at, pending_parse=0, pending_enrichment=0, target_parser_version="1.2", **counts):
+    return QueueDepthSnapshot.objects.create(
+        recorded_at=recorded_at,
+        target_parser_version=target_parser_version,
+        target_enrichment_version="3.4",
+        pending_parse=pending_parse,
+        pending_enrichment=pending_enrichment,
+        locked_documents=counts.get("locked_documents", 0),
+        missing_fclid=counts.get("missing_fclid", 0),
+    )
+
+
+@patch("judgments.utils.target_versions.api_client")
+@patch("judgments.utils.queue_depths.api_client")
+class TestRecordQueueDepths(TestCase):
+    def test_command_records_every_queue(self, mock_api_client, mock_versions_api_client):
+        mock_versions_api_client.get_highest_parser_version.return_value = (1, 2)
+        mock_versions_api_client.get_highest_enrichment_version.return_value = (3, 4)
+        mock_api_client.get_count_pending_parse_for_version.return_value = 40
+        mock_api_client.get_pending_enrichment_for_version.return_value = [["uri"], ["/a"], ["/b"]]
+        mock_api_client.get_locked_documents.return_value = ["lock"]
+        mock_api_client.get_missing_fclid.return_value = []
+
+        call_command("record_queue_depths")
+
+        recorded = QueueDepthSnapshot.objects.get()
+        assert recorded.target_parser_version == "1.2"
+        assert recorded.target_enrichment_version == "3.4"
+        assert (recorded.pending_parse, recorded.pending_enrichment) == (40, 2)
+        assert (recorded.locked_documents, recorded.missing_fclid) == (1, 0)
+        assert (
+            mock_api_client.get_pending_enrichment_for_version.call_args.kwargs["maximum_records"] == QUEUE_COUNT_LIMIT
+        )
+        mock_api_client.get_missing_fclid.assert_called_once_with(maximum_records=QUEUE_COUNT_LIMIT)
+
+    def test_empty_enrichment_queue(self, mock_api_client, mock_versions_api_client):
+        mock_versions_api_client.get_highest_parser_version.return_value = (1, 2)
+        mock_versions_api_client.get_highest_enrichment_version.return_value = (3, 4)
+        mock_api_client.get_count_pending_parse_for_version.return_value = 0
+        mock_api_client.get_pending_enrichment_for_version.return_value = ["uri", "enrich_version_string"]
+        mock_api_client.get_locked_documents.return_value = []
+        mock_api_client.get_missing_fclid.return_value = []
+
+        call_command("record_queue_depths")
+
+        assert QueueDepthSnapshot.objects.get().pending_enrichment == 0
+
+
+class TestQueueTrends(TestCase):
+    def test_rates_and_time_to_drain(self):
+        snapshot(LATEST - timedelta(days=2), pending_parse=1000)
+        snapshot(LATEST - timedelta(hours=10), pending_parse=300, pending_enrichment=10, locked_documents=2)
+        snapshot(LATEST - timedelta(hours=5), pending_parse=250)
+        latest = snapshot(LATEST, pending_parse=200, pending_enrichment=20, locked_documents=0)
+
+        trends = queue_trends(latest)
+
+        assert trends[0] == QueueTrend("Awaiting reparsing", 200, 10.0, timedelta(hours=20))
+        assert trends[1] == QueueTrend("Awaiting enrichment", 20, -1.0, None)
+        assert trends[2] == QueueTrend("Locked", 0, 0.2, timedelta(0))
+
+    def test_rates_ignore_snapshots_for_other_versions(self):
+        snapshot(LATEST - timedelta(hours=10), pending_parse=0, target_parser_version="1.1")
+        latest = snapshot(LATEST, pending_parse=200)
+
+        assert queue_trends(latest)[0] == QueueTrend("Awaiting reparsing", 200, None, None)
+
+    def test_queues_too_deep_to_count_have_no_rate(self):
+        snapshot(LATEST - timedelta(hours=10), pending_enrichment=QUEUE_COUNT_LIMIT, missing_fclid=10)
+        latest = snapshot(LATEST, pending_enrichment=500, missing_fclid=QUEUE_COUNT_LIMIT)
+
+        trends = queue_trends(latest)
+
+        assert trends[1] == QueueTrend("Awaiting enrichment", 500, None, None)
+        assert trends[3] == QueueTrend("Published without an FCLID", QUEUE_COUNT_LIMIT, None, None, capped=True)
+
+
+def test_duration():
+    assert duration(timedelta(seconds=50)) == "1 minute"
+    assert duration(timedelta(minutes=45)) == "45 minutes"
+    assert duration(timedelta(hours=1, minutes=10)) == "1 hour"
+    assert duration(timedelta(days=3, hours=2)) == "3 days, 2 hours"
+    assert duration(timedelta(days=1)) == "1 day"
@@ -0,0 +1,113 @@
+from unittest.mock import MagicMock, patch
+
+from django.contrib.auth.models import User
+from django.http import QueryDict
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+
+from judgments.utils.document_cache import invalidate_document_caches
+from judgments.utils.document_list import DocumentListFilters
+from judgments.utils.search_cache import search_results_cache
+from judgments.utils.view_helpers import prefetch_search_with_filters, search_with_filters
+
+
+class TestFiltersCacheKey:
+    def test_equivalent_filters_share_a_key(self):
+        assert (
+            DocumentListFilters.from_query_params(QueryDict("court=uksc&court=ewhc/ch&from_year=2020")).cache_key()
+            == DocumentListFilters.from_query_params(QueryDict("from_year=2020&court=ewhc/ch&court=uksc")).cache_key()
+        )
+
+    def test_search_filter_is_ignored_without_a_query(self):
+        assert DocumentListFilters(search_filter="ncn").cache_key() == DocumentListFilters().cache_key()
+        assert (
+            DocumentListFilters(query="UKSC", search_filter="ncn").cache_key()
+            != DocumentListFilters(query="UKSC").cache_key()
+        )
+
+    def test_pages_have_different_keys(self):
+        assert DocumentListFilters(page=1).cache_key() != DocumentListFilters(page=2).cache_key()
+
+
+@override_settings(SEARCH_RESULTS_CACHE_TIMEOUT=30)
+@patch("judgments.utils.view_helpers.search_and_parse_response")
+class TestSearchWithFilters(SimpleTestCase):
+    def setUp(self):
+        search_results_cache.clear()
+
+    def tearDown(self):
+        search_results_cache.clear()
+
+    def test_identical_searches_are_only_run_once(self, mock_search):
+        mock_search.return_value = MagicMock()
+
+        assert search_with_filters(DocumentListFilters()) is mock_search.return_value
+        assert search_with_filters(DocumentListFilters()) is mock_search.return_value
+        mock_search.assert_called_once()
+
+    def test_different_searches_are_run_separately(self, mock_search):
+        search_with_filters(DocumentListFilters(page=1))
+        search_with_filters(DocumentListFilters(page=2))
+
+        assert mock_search.call_count == 2
+
+    def test_changing_a_document_clears_results(self, mock_search):
+        search_with_filters(DocumentListFilters())
+        with patch("judgments.utils.document_cache.invalidate_document_html"):
+            invalidate_document_caches("test/2023/1")
+        search_with_filters(DocumentListFilters())
+
+        assert mock_search.call_count == 2
+
+
+@override_settings(SEARCH_RESULTS_CACHE_TIMEOUT=30)
+@patch("judgments.utils.view_helpers.search_and_parse_response")
+class TestPrefetchSearchWithFilters(SimpleTestCase):
+    def setUp(self):
+        search_results_cache.clear()
+
+    def tearDown(self):
+        search_results_cache.clear()
+
+    def test_prefetched_results_are_cached(self, mock_search):
+        future = prefetch_search_with_filters(DocumentListFilters(page=2))
+        assert future is not None
+        future.result(timeout=5)
+
+        assert search_with_filters(DocumentListFilters(page=2)) is mock_search.return_value
+        mock_search.assert_called_once()
+
+    def test_cached_results_are_not_prefetched(self, mock_search):
+        search_with_filters(DocumentListFilters(page=2))
+
+        assert prefetch_search_with_filters(DocumentListFilters(page=2)) is None
+
+    @override_settings(SEARCH_RESULTS_CACHE_TIMEOUT=0)
+    def test_nothing_is_prefetched_when_cache_is_off(self, mock_search):
+        assert prefetch_search_with_filters(DocumentListFilters(page=2)) is None
+        mock_search.assert_not_called()
+
+
+@patch("judgments.views.document_list.prefetch_search_with_filters")
+@patch("judgments.utils.view_helpers.search_and_parse_response")
+class TestDocumentListPrefetch(TestCase):
+    def setUp(self):
+        self.client.force_login(User.objects.get_or_create(username="testuser")[0])
+
+    def test_next_page_is_prefetched(self, mock_search, mock_prefetch):
+        mock_search.return_value.results = []
+        mock_search.return_value.total = 100
+
+        self.client.get(reverse("home") + "?order=-updated&page=2")
+
+        prefetched_filters = mock_prefetch.call_args.args[0]
+        assert prefetched_filters.page == 3
+        assert prefetched_filters.order == "-updated"
+
+    def test_last_page_prefetches_nothing(self, mock_search, mock_prefetch):
+        mock_search.return_value.results = []
+        mock_search.return_value.total = 5
+
+        self.client.get(reverse("home"))
+
+        mock_prefetch.assert_not_called()
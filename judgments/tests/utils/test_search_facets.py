@@ -0,0 +1,118 @@
+from unittest.mock import MagicMock, patch
+
+from caselawclient.search_parameters import SearchParameters
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+
+from judgments.utils import api_client
+from judgments.utils.document_list import DocumentListFilters
+from judgments.utils.search_facets import SearchFacets, facet_filters, search_facets_from_response
+from judgments.utils.view_helpers import get_search_results_from_filters
+
+
+def search_response(facets):
+    response = MagicMock()
+    response.total = 0
+    response.results = []
+    response.facets = facets
+    return response
+
+
+class TestSearchFacetsFromResponse:
+    def test_splits_courts_from_years(self):
+        facets = search_facets_from_response(
+            search_response({"UKSC": "12", "EWCA-Civil": "3", "2023": "10", "2024": "5", "not-a-court": "1"}),
+        )
+
+        assert facets == SearchFacets(courts={"UKSC": 12, "EWCA-Civil": 3}, years={2023: 10, 2024: 5})
+
+
+class TestFacetFilters:
+    def test_ignores_page_order_courts_and_years(self):
+        filters = DocumentListFilters(
+            query="foo",
+            page=3,
+            order="-updated",
+            publication_status="all",
+            courts=["uksc"],
+            from_year=2020,
+            to_year=2021,
+        )
+
+        assert facet_filters(filters) == DocumentListFilters(query="foo", publication_status="all")
+
+
+@override_settings(
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "test_facets"}},
+)
+class TestGetSearchResultsFacets(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+
+    @patch("judgments.utils.view_helpers.search_and_parse_response")
+    def test_unfiltered_lists_count_facets_from_their_own_search(self, mock_search):
+        mock_search.return_value = search_response({"UKSC": "2", "2023": "2"})
+
+        context = get_search_results_from_filters(DocumentListFilters())
+
+        assert context["facets"] == SearchFacets(courts={"UKSC": 2}, years={2023: 2})
+        mock_search.assert_called_once()
+
+    @patch("judgments.utils.view_helpers.search_and_parse_response")
+    def test_filtered_lists_count_facets_without_their_filters(self, mock_search):
+        mock_search.side_effect = lambda _, params: search_response(
+            {"UKSC": "2", "EWCA-Civil": "5"} if params.court is None else {"UKSC": "2"},
+        )
+
+        context = get_search_results_from_filters(DocumentListFilters(courts=["uksc"], from_year=2020))
+
+        assert context["facets"] == SearchFacets(courts={"UKSC": 2, "EWCA-Civil": 5})
+        mock_search.assert_any_call(
+            api_client,
+            SearchParameters(order="-date", only_unpublished=True, show_unpublished=True, page=1, page_size=1),
+        )
+
+    @patch("judgments.utils.view_helpers.search_and_parse_response")
+    def test_facets_are_cached_per_filter_set(self, mock_search):
+        mock_search.return_value = search_response({"UKSC": "2"})
+        get_search_results_from_filters(DocumentListFilters())
+
+        mock_search.reset_mock()
+        mock_search.return_value = search_response({})
+        context = get_search_results_from_filters(DocumentListFilters(courts=["uksc"], page=2))
+
+        assert context["facets"] == SearchFacets(courts={"UKSC": 2})
+        mock_search.assert_called_once()
+
+        mock_search.reset_mock()
+        get_search_results_from_filters(DocumentListFilters(publication_status="all", courts=["uksc"]))
+
+        assert mock_search.call_count == 2
+
+
+class TestDocumentListFacets(TestCase):
+    def setUp(self):
+        self.client.force_login(User.objects.get_or_create(username="testuser")[0])
+
+    @patch("judgments.utils.view_helpers.search_and_parse_response")
+    def test_list_links_to_each_facet(self, mock_search):
+        mock_search.return_value = search_response({"UKSC": "1234", "2023": "7"})
+
+        content = self.client.get(reverse("home") + "?query=foo&page=2").content.decode()
+
+        assert '<a href="/?query=foo&amp;court=uksc"' in content
+        assert ">United Kingdom Supreme Court</a>" in content
+        assert "1,234" in content
+        assert '<a href="/?query=foo&amp;from_year=2023&amp;to_year=2023"' in content
+
+    @patch("judgments.utils.view_helpers.search_and_parse_response")
+    def test_selected_facets_link_to_the_list_without_them(self, mock_search):
+        mock_search.return_value = search_response({"UKSC": "1", "2023": "1"})
+
+        content = self.client.get(reverse("home") + "?court=uksc&from_year=2023&to_year=2023").content.decode()
+
+        assert '<a href="/?from_year=2023&amp;to_year=2023"' in content
+        assert '<a href="/?court=uksc"' in content
+        assert content.count('aria-current="true"') == 2
@@ -0,0 +1,87 @@
+from unittest.mock import Mock, patch
+
+from caselawclient.responses.search_result import SearchResult
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+from lxml import etree
+
+from judgments.utils.search_snippets import render_snippets
+
+
+def search_result(uri, snippet):
+    node = etree.fromstring(
+        f"""<search:result xmlns:search="http://marklogic.com/appservices/search" uri="/{uri}.xml">
+          <search:snippet>{snippet}</search:snippet>
+        </search:result>""",
+    )
+    return SearchResult(node, Mock())
+
+
+RESULTS = [
+    search_result(
+        "test/2023/1",
+        '<search:match path="/doc/p[1]">The <search:highlight>appeal</search:highlight> is allowed</search:match>',
+    ),
+    search_result(
+        "test/2023/2",
+        '<search:match path="/doc/p[2]">One &amp; <search:highlight>two</search:highlight></search:match>'
+        '<search:match path="/doc/p[3]">three</search:match>',
+    ),
+]
+
+
+@override_settings(
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "test_snippets"}},
+)
+class TestRenderSnippets(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_renders_each_result(self):
+        assert render_snippets(RESULTS, "appeal") == {
+            "test/2023/1": '<p data-path="/doc/p[1]">The <mark>appeal</mark> is allowed</p>',
+            "test/2023/2": '<p data-path="/doc/p[2]">One &amp; <mark>two</mark></p><p data-path="/doc/p[3]">three</p>',
+        }
+
+    def test_results_without_matches_have_empty_snippets(self):
+        assert render_snippets([search_result("test/2023/3", "")], "appeal") == {"test/2023/3": ""}
+
+    @patch("judgments.utils.search_snippets._batch_transform")
+    def test_snippets_are_cached_per_document_and_query(self, mock_transform):
+        mock_transform.side_effect = lambda batch: etree.ElementTree(
+            etree.fromstring("<batch>" + "<snippet><p>x</p></snippet>" * len(batch) + "</batch>"),
+        )
+
+        render_snippets(RESULTS, "appeal")
+        render_snippets(RESULTS[:1], "appeal")
+        assert mock_transform.call_count == 1
+
+        render_snippets(RESULTS, "allowed")
+        assert mock_transform.call_count == 2
+
+    @patch("judgments.utils.search_snippets._batch_transform")
+    def test_only_uncached_results_are_rendered(self, mock_transform):
+        mock_transform.return_value = etree.ElementTree(etree.fromstring("<batch><snippet><p>y</p></snippet></batch>"))
+        render_snippets(RESULTS[:1], "appeal")
+        mock_transform.reset_mock()
+
+        snippets = render_snippets(RESULTS, "appeal")
+
+        assert len(mock_transform.call_args.args[0]) == 1
+        assert snippets["test/2023/2"] == "<p>y</p>"
+
+
+class TestDocumentListSnippets(TestCase):
+    @patch("judgments.utils.view_helpers.search_and_parse_response")
+    def test_search_results_show_snippets(self, mock_search):
+        mock_search.return_value.total = 1
+        mock_search.return_value.results = RESULTS[:1]
+        mock_search.return_value.facets = {}
+        self.client.force_login(User.objects.get_or_create(username="testuser")[0])
+
+        with patch.object(SearchResult, "metadata"):
+            content = self.client.get(reverse("results") + "?query=appeal").content.decode()
+
+        assert "The <mark>appeal</mark> is allowed" in content
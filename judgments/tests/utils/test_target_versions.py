@@ -0,0 +1,77 @@
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from judgments.models import TargetVersion
+from judgments.utils.target_versions import (
+    PARSER_VERSION,
+    clear_target_versions,
+    get_target_enrichment_version,
+    get_target_parser_version,
+)
+
+
+@override_settings(TARGET_VERSION_CACHE_TIMEOUT=60)
+@patch("judgments.utils.target_versions.api_client")
+class TestTargetVersions(TestCase):
+    def test_versions_are_only_looked_up_once(self, mock_api_client):
+        mock_api_client.get_highest_parser_version.return_value = (1, 2)
+        mock_api_client.get_highest_enrichment_version.return_value = (3, 4)
+
+        assert get_target_parser_version() == (1, 2)
+        assert get_target_parser_version() == (1, 2)
+        assert get_target_enrichment_version() == (3, 4)
+
+        mock_api_client.get_highest_parser_version.assert_called_once()
+        mock_api_client.get_highest_enrichment_version.assert_called_once()
+
+    def test_versions_are_shared_through_the_database(self, mock_api_client):
+        TargetVersion.objects.create(name=PARSER_VERSION, major=5, minor=6, found_at=timezone.now())
+
+        assert get_target_parser_version() == (5, 6)
+        mock_api_client.get_highest_parser_version.assert_not_called()
+
+    def test_old_versions_are_looked_up_again(self, mock_api_client):
+        TargetVersion.objects.create(
+            name=PARSER_VERSION,
+            major=5,
+            minor=6,
+            found_at=timezone.now() - timedelta(minutes=5),
+        )
+        mock_api_client.get_highest_parser_version.return_value = (7, 0)
+
+        assert get_target_parser_version() == (7, 0)
+        found = TargetVersion.objects.get(name=PARSER_VERSION)
+        assert (found.major, found.minor) == (7, 0)
+
+    def test_command_clears_versions(self, mock_api_client):
+        mock_api_client.get_highest_parser_version.side_effect = [(1, 2), (1, 3)]
+        get_target_parser_version()
+
+        call_command("clear_target_versions")
+
+        assert not TargetVersion.objects.exists()
+        assert get_target_parser_version() == (1, 3)
+
+    def test_clearing_is_seen_by_every_process(self, mock_api_client):
+        TargetVersion.objects.create(name=PARSER_VERSION, major=5, minor=6, found_at=timezone.now())
+        assert get_target_parser_version() == (5, 6)
+        mock_api_client.get_highest_parser_version.return_value = (7, 0)
+
+        # As if from another process: nothing but the database is shared.
+        clear_target_versions()
+
+        assert get_target_parser_version() == (7, 0)
+
+    @override_settings(TARGET_VERSION_CACHE_TIMEOUT=0)
+    def test_not_kept_when_timeout_is_zero(self, mock_api_client):
+        mock_api_client.get_highest_parser_version.return_value = (1, 2)
+
+        get_target_parser_version()
+        get_target_parser_version()
+
+        assert mock_api_client.get_highest_parser_version.call_count == 2
+        assert not TargetVersion.objects.exists()
@@ -3,16 +3,19 @@ from unittest.mock import patch
 
 import pytest
 from django.contrib.auth.models import Group
-from django.test import TestCase
+from django.core.cache import cache
+from django.test import TestCase, override_settings
 from factories import UserFactory
 
 from judgments.utils import api_client as api_client_real
 from judgments.utils import (
+    document_exists,
     editors_dict,
     ensure_local_referer_url,
     extract_version_number_from_filename,
 )
 from judgments.utils.aws import invalidate_caches
+from judgments.utils.document_cache import invalidate_document_caches
 from judgments.utils.paginator import paginator
 
 
@@ -217,6 +220,99 @@ class TestEditorsDict:
         ]
 
 
+@override_settings(
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "test_editors"}},
+    EDITORS_GROUP_ID=None,
+)
+class TestEditorsDictCaching(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_roster_is_cached(self):
+        UserFactory.create(username="editor", first_name="", last_name="")
+        editors_dict()
+
+        with self.assertNumQueries(0):
+            assert editors_dict() == [{"name": "editor", "print_name": "editor"}]
+
+    def test_saving_a_user_invalidates_roster(self):
+        editor = UserFactory.create(username="editor", first_name="", last_name="")
+        editors_dict()
+
+        editor.first_name = "Ann"
+        editor.save()
+
+        assert editors_dict() == [{"name": "editor", "print_name": "Ann"}]
+
+    def test_logging_in_keeps_roster(self):
+        editor = UserFactory.create(username="editor", first_name="", last_name="")
+        editors_dict()
+
+        self.client.force_login(editor)
+        editor.first_name = "Ann"
+        editor.save(update_fields=["last_login"])
+
+        assert editors_dict() == [{"name": "editor", "print_name": "editor"}]
+
+    def test_deleting_a_user_invalidates_roster(self):
+        editor = UserFactory.create(username="editor", first_name="", last_name="")
+        editors_dict()
+
+        editor.delete()
+
+        assert editors_dict() == []
+
+    def test_changing_group_membership_invalidates_roster(self):
+        group = Group.objects.create(name="Editors")
+        editor = UserFactory.create(username="editor", first_name="", last_name="")
+
+        with self.settings(EDITORS_GROUP_ID=group.id):
+            assert editors_dict() == []
+
+            editor.groups.add(group)
+            assert editors_dict() == [{"name": "editor", "print_name": "editor"}]
+
+            group.user_set.remove(editor)
+            assert editors_dict() == []
+
+
+@override_settings(
+    CACHES={
+        "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "test_exists"},
+        "document_html": {"BACKEND": "django.core.cache.backends.dummy.DummyCache"},
+    },
+)
+class TestDocumentExistsCaching(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    @patch("judgments.utils.api_client.document_exists")
+    def test_missing_documents_are_cached(self, mock_document_exists):
+        mock_document_exists.return_value = False
+
+        assert document_exists("test/2023/1/press-summary/1") is False
+        assert document_exists("test/2023/1/press-summary/1") is False
+        mock_document_exists.assert_called_once_with("test/2023/1/press-summary/1")
+
+    @patch("judgments.utils.api_client.document_exists")
+    def test_existing_documents_are_cached(self, mock_document_exists):
+        mock_document_exists.return_value = True
+
+        assert document_exists("test/2023/1") is True
+        assert document_exists("/test/2023/1") is True
+        mock_document_exists.assert_called_once()
+
+    @patch("judgments.utils.api_client.document_exists")
+    def test_invalidating_document_caches_forgets_existence(self, mock_document_exists):
+        mock_document_exists.return_value = False
+        document_exists("test/2023/1/press-summary/1")
+
+        invalidate_document_caches("test/2023/1/press-summary/1")
+        mock_document_exists.return_value = True
+
+        assert document_exists("test/2023/1/press-summary/1") is True
+
+
 class TestApiClient:
     def test_user_agent(self):
         assert "ds-caselaw-editor" in api_client_real.session.headers["User-Agent"]
@@ -16,7 +16,7 @@ from .views.document_full_text import (
 )
 from .views.document_history import DocumentHistoryView
 from .views.document_identifiers import AddDocumentIdentifierView, DeleteDocumentIdentifierView, DocumentIdentifiersView
-from .views.document_list import HomeView, ResultsView
+from .views.document_list import HomeView, ResultsView, document_list_export
 from .views.document_metadata import DocumentMetadataView
 from .views.document_reparse import reparse
 from .views.errors import NotFoundView, PermissionDeniedView, ServerErrorView
@@ -37,6 +37,7 @@ from .views.judgment_publish import (
     publish,
     unpublish,
 )
+from .views.ncn_typeahead import ncn_typeahead
 from .views.signed_asset import redirect_to_signed_asset
 from .views.stub import CreateStubView, create_stub
 from .views.unlock import unlock
@@ -58,6 +59,8 @@ urlpatterns = [
     ),
     # Search
     path("results", ResultsView.as_view(), name="results"),
+    path("results/export", document_list_export, name="document-list-export"),
+    path("results/ncn", ncn_typeahead, name="ncn-typeahead"),
     # redirect to signed asset URLs
     path("signed-asset/<path:key>", redirect_to_signed_asset, name="signed-asset"),
     # Judgment verbs
@@ -83,11 +86,21 @@ urlpatterns = [
         reports.AwaitingParse.as_view(),
         name="report_awaiting_parse",
     ),
+    path(
+        "reports/awaiting-parse/export",
+        reports.AwaitingParseExport.as_view(),
+        name="report_awaiting_parse_export",
+    ),
     path(
         "reports/bulk-reparse-run-logs",
         reports.BulkReparseRunLogListView.as_view(),
         name="report_bulk_reparse_run_logs",
     ),
+    path(
+        "reports/bulk-reparse-run-logs/export",
+        reports.BulkReparseRunLogExport.as_view(),
+        name="report_bulk_reparse_run_logs_export",
+    ),
     path(
         "reports/bulk-reparse-run-logs/<int:pk>",
         reports.BulkReparseRunLogDetailView.as_view(),
@@ -98,11 +111,21 @@ urlpatterns = [
         reports.AwaitingEnrichment.as_view(),
         name="report_awaiting_enrichment",
     ),
+    path(
+        "reports/awaiting-enrichment/export",
+        reports.AwaitingEnrichmentExport.as_view(),
+        name="report_awaiting_enrichment_export",
+    ),
     path(
         "reports/locked-documents",
         reports.LockedDocuments.as_view(),
         name="report_locked_documents",
     ),
+    path(
+        "reports/locked-documents/export",
+        reports.LockedDocumentsExport.as_view(),
+        name="report_locked_documents_export",
+    ),
     # Tools (Developers group only)
     path("tools", tools.ToolsIndex.as_view(), name="tools"),
     path(
@@ -110,6 +133,11 @@ urlpatterns = [
         tools.MissingFclid.as_view(),
         name="tools_missing_fclid",
     ),
+    path(
+        "tools/missing-fclid/export",
+        tools.MissingFclidExport.as_view(),
+        name="tools_missing_fclid_export",
+    ),
     # Different views on judgments
     path("<path:document_uri>/associated-documents", AssociatedDocumentsView.as_view(), name="associated-documents"),
     path("<path:document_uri>/edit", EditJudgmentView.as_view(), name="edit-document"),
@@ -11,6 +11,7 @@ from caselawclient.models.documents import DocumentURIString
 from caselawclient.models.press_summaries import PressSummary
 from django.conf import settings
 from django.contrib.auth.models import Group, User
+from django.core.cache import cache
 
 api_client = MarklogicApiClient(
     host=settings.MARKLOGIC_HOST,
@@ -26,6 +27,8 @@ VERSION_REGEX = r"xml_versions/(\d{1,10})-(\d{1,10}|TDR)"
 # Here we limit the number of digits in the version and document reference to 10 on purpose, see
 # https://owasp.org/www-community/attacks/Regular_expression_Denial_of_Service_-_ReDoS for an explanation of why.
 
+PRESS_SUMMARY_SUFFIX = "/press-summary/1"
+
 akn_namespace = {"akn": "http://docs.oasis-open.org/legaldocml/ns/akn/3.0"}
 uk_namespace = {"uk": "https://caselaw.nationalarchives.gov.uk/akn"}
 
@@ -93,7 +96,24 @@ def extract_version_number_from_filename(version_string: str) -> int:
     return int(result.group(1)) if result else 0
 
 
+def _editors_cache_key() -> str:
+    return f"editors:{settings.EDITORS_GROUP_ID or 'all'}"
+
+
 def editors_dict():
+    """The active editors, sorted by name. The roster rarely changes, so it's cached until a user or group is changed."""
+    editors = cache.get(_editors_cache_key())
+    if editors is None:
+        editors = _build_editors_dict()
+        cache.set(_editors_cache_key(), editors, settings.EDITORS_CACHE_TIMEOUT)
+    return editors
+
+
+def invalidate_editors_dict() -> None:
+    cache.delete(_editors_cache_key())
+
+
+def _build_editors_dict():
     if settings.EDITORS_GROUP_ID:
         editors_group = Group.objects.get(id=settings.EDITORS_GROUP_ID)
         editors = editors_group.user_set.filter(is_active=True)
@@ -112,13 +132,38 @@ def editors_dict():
     )
 
 
+def _document_exists_cache_key(uri: str) -> str:
+    return f"document_exists:{uri.strip('/')}"
+
+
+def document_exists(uri: str) -> bool:
+    """Whether there's a document at `uri`. Both answers are cached: most documents don't have a linked document, so
+    a cached "no" saves as many MarkLogic round trips as a cached "yes"."""
+    exists = cache.get(_document_exists_cache_key(uri))
+    if exists is None:
+        exists = api_client.document_exists(DocumentURIString(uri))
+        cache.set(_document_exists_cache_key(uri), exists, settings.DOCUMENT_EXISTS_CACHE_TIMEOUT)
+    return exists
+
+
+def invalidate_document_exists(uri: str) -> None:
+    cache.delete(_document_exists_cache_key(uri))
+
+
 def get_linked_document_uri(document: Document) -> str | None:
     related_uri = _build_related_document_uri(document)
-    return related_uri if api_client.document_exists(DocumentURIString(related_uri)) else None
+    return related_uri if document_exists(related_uri) else None
 
 
 def _build_related_document_uri(document: Document) -> str:
-    press_summary_suffix = "/press-summary/1"
     if isinstance(document, PressSummary):
-        return document.uri.removesuffix(press_summary_suffix)
-    return document.uri + press_summary_suffix
+        return document.uri.removesuffix(PRESS_SUMMARY_SUFFIX)
+    return document.uri + PRESS_SUMMARY_SUFFIX
+
+
+def related_document_uri(uri: str) -> str:
+    """The URI of the press summary of the judgment at `uri`, or of the judgment if `uri` is a press summary, for when
+    the document itself hasn't been fetched."""
+    if uri.endswith(PRESS_SUMMARY_SUFFIX):
+        return uri.removesuffix(PRESS_SUMMARY_SUFFIX)
+    return uri + PRESS_SUMMARY_SUFFIX
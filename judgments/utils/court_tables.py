@@ -0,0 +1,48 @@
+"""Lookup tables of courts, built once from the ds-caselaw-utils court registry."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import TYPE_CHECKING
+
+from ds_caselaw_utils import courts
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from ds_caselaw_utils.courts import Court
+
+
+@dataclass(frozen=True)
+class CourtTables:
+    all_courts: tuple[Court, ...]
+    """Every court, with a separate entry for each of a court's jurisdictions."""
+
+    choices: tuple[tuple[str, str], ...]
+    """(code, name) pairs for `all_courts`, for form choices."""
+
+    by_code: Mapping[str, Court]
+    """Courts by their code. Jurisdiction codes aren't included."""
+
+    all_by_code: Mapping[str, Court]
+    """`all_courts` by their code, where a court with a jurisdiction has a code like `UKFTT-GRC/InformationRights`."""
+
+    by_param: Mapping[str, Court]
+    """Listable courts and tribunals by their canonical URL parameter."""
+
+
+def build_court_tables() -> CourtTables:
+    all_courts = tuple(courts.get_all(with_jurisdictions=True))
+    listable = list(courts.get_listable_courts()) + list(courts.get_listable_tribunals())
+
+    return CourtTables(
+        all_courts=all_courts,
+        choices=tuple((court.code, court.name) for court in all_courts),
+        by_code=MappingProxyType({court.code: court for court in courts.get_all()}),
+        all_by_code=MappingProxyType({court.code: court for court in all_courts}),
+        by_param=MappingProxyType({court.canonical_param: court for court in listable if court.canonical_param}),
+    )
+
+
+COURT_TABLES = build_court_tables()
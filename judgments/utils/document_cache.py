@@ -0,0 +1,89 @@
+"""A short-lived, in-process cache of documents fetched from MarkLogic."""
+
+from __future__ import annotations
+
+import copy
+from typing import TYPE_CHECKING
+
+from caselawclient.models.documents import Document
+from django.conf import settings
+from django.db import close_old_connections
+
+from judgments.utils import invalidate_document_exists
+from judgments.utils.document_mirror import mirror_document
+from judgments.utils.fan_out import submit
+from judgments.utils.html_cache import invalidate_document_html
+from judgments.utils.local_cache import LocalCache
+from judgments.utils.search_cache import invalidate_search_results
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+
+DOCUMENT_CACHE_MAX_ENTRIES = 64
+
+
+def copy_document(document: Document) -> Document:
+    """A copy of `document` whose identifiers and metadata fields can be changed without changing `document`'s.
+
+    `Document` can't be copied with the `copy` module, since it forwards unknown attributes to its body."""
+    document_class = type(document)
+    copied = document_class.__new__(document_class)
+    copied.__dict__.update(document.__dict__)
+    copied.identifiers = copy.deepcopy(document.identifiers)
+    copied.metadata_fields = copy.deepcopy(document.metadata_fields)
+    # The metadata objects read from the document they were made for, so the copy needs its own. There's no public way
+    # to make them without fetching the document from MarkLogic again, which is what this cache is for avoiding.
+    copied._initialise_metadata()  # noqa: SLF001
+    return copied
+
+
+class DocumentCache(LocalCache[Document]):
+    """A map of document URI to `Document`, where entries expire after `DOCUMENT_CACHE_TIMEOUT` seconds. Documents are
+    copied going in and coming out, so that a request which changes its document without saving it (eg adding an
+    identifier which then fails validation) doesn't change the document seen by later requests."""
+
+    def __init__(self, max_entries: int = DOCUMENT_CACHE_MAX_ENTRIES) -> None:
+        super().__init__("DOCUMENT_CACHE_TIMEOUT", max_entries)
+
+    def get(self, key: str) -> Document | None:
+        document = super().get(key)
+        return copy_document(document) if document is not None else None
+
+    def set(self, key: str, value: Document) -> None:
+        if self.timeout > 0:
+            super().set(key, copy_document(value))
+
+    def _cache_key(self, key: str) -> str:
+        # Version URIs (`.../xml_versions/3-1234`) are distinct keys, so each version of a document is cached separately.
+        return key.strip("/")
+
+
+document_cache = DocumentCache()
+
+
+def _mirror_document(uri: str) -> None:
+    # This runs on a pool thread, which has its own database connection.
+    close_old_connections()
+    try:
+        document = mirror_document(uri)
+        if document is not None:
+            document_cache.set(uri, document)
+    finally:
+        close_old_connections()
+
+
+def invalidate_document_caches(uri: str) -> Future | None:
+    """Forget everything cached locally about the document at `uri`. Call this after any write to the document, and after
+    creating or deleting one.
+
+    When the document list mirror is on, this also starts re-reading the document into the mirror on the fan-out pool,
+    which takes three MarkLogic calls, and returns a future of it. The copy it reads is kept for the page which follows
+    the change."""
+    document_cache.invalidate(uri)
+    invalidate_document_html(uri)
+    invalidate_document_exists(uri)
+    invalidate_search_results()
+
+    if not settings.DOCUMENT_LIST_MIRROR:
+        return None
+    return submit(lambda: _mirror_document(uri))
@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
+import json
 from dataclasses import dataclass, field
 from typing import Any
 
-from ds_caselaw_utils import courts as all_courts
+from judgments.utils.court_tables import COURT_TABLES
 
 ORDER_VALUES = frozenset(
     {
@@ -32,11 +33,10 @@ PUBLICATION_STATUSES = frozenset(
 
 DEFAULT_ORDER = "-date"
 
-COURTS_BY_PARAM = {
-    court.canonical_param: court
-    for court in list(all_courts.get_listable_courts()) + list(all_courts.get_listable_tribunals())
-    if court.canonical_param
-}
+# Parameters which say where in a list a page starts, rather than what's in the list.
+PAGE_PARAMS = ("page", "after", "before")
+
+COURTS_BY_PARAM = COURT_TABLES.by_param
 
 
 @dataclass
@@ -49,6 +49,10 @@ class DocumentListFilters:
     courts: list[str] = field(default_factory=list)
     from_year: int | None = None
     to_year: int | None = None
+    after: str | None = None
+    """A cursor for the last document of the previous page, when paging forwards through a list from the mirror."""
+    before: str | None = None
+    """A cursor for the first document of the next page, when paging backwards through a list from the mirror."""
 
     @classmethod
     def from_query_params(cls, params, *, default_publication_status: str | None = None) -> DocumentListFilters:
@@ -95,6 +99,8 @@ class DocumentListFilters:
             courts=courts,
             from_year=from_year,
             to_year=to_year,
+            after=params.get("after") or None,
+            before=params.get("before") or None,
         )
 
     @property
@@ -132,6 +138,23 @@ class DocumentListFilters:
             return "published documents"
         return "documents"
 
+    def cache_key(self) -> str:
+        """A string which is the same for any two sets of filters that return the same results."""
+        return json.dumps(
+            [
+                self.query,
+                self.search_filter if self.query else None,
+                self.page,
+                self.order,
+                self.publication_status,
+                sorted(set(self.courts)),
+                self.from_year,
+                self.to_year,
+                self.after,
+                self.before,
+            ],
+        )
+
     def context_dict(self) -> dict[str, Any]:
         return {
             "query": self.query,
@@ -143,6 +166,15 @@ class DocumentListFilters:
         }
 
 
+def without_page_params(params):
+    """A mutable copy of request GET params without any which say where a page starts, for building links to other
+    pages or views of the same list."""
+    params = params.copy()
+    for param in PAGE_PARAMS:
+        params.pop(param, None)
+    return params
+
+
 def _parse_year(value: str | None) -> int | None:
     if value is None or value == "":
         return None
@@ -0,0 +1,361 @@
+"""A local copy of every document's list-level metadata, so the document list can be served from the database."""
+
+from __future__ import annotations
+
+import json
+import logging
+import re
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from dataclasses import dataclass
+from datetime import UTC, date, datetime
+from functools import partial
+from itertools import batched
+from typing import TYPE_CHECKING, Any
+
+from caselawclient.errors import DocumentNotFoundError, MarklogicAPIError
+from caselawclient.models.identifiers.neutral_citation import NeutralCitationNumber
+from caselawclient.models.identifiers.press_summary_ncn import PressSummaryRelatedNCNIdentifier
+from caselawclient.responses.search_result import SearchResultMetadata
+from caselawclient.search_parameters import RESULTS_PER_PAGE
+from caselawclient.types import DocumentURIString, MarkLogicDocumentURIString
+from django.conf import settings
+from django.db.models import Count, F, Q
+from django.db.models.functions import ExtractYear
+from django.utils import timezone
+from lxml import etree
+
+from judgments.models import DocumentListEntry
+from judgments.utils import VERSION_REGEX, api_client
+from judgments.utils.court_tables import COURT_TABLES
+from judgments.utils.document_list import PUBLICATION_STATUS_PUBLISHED, PUBLICATION_STATUS_UNPUBLISHED
+from judgments.utils.fan_out import fan_out
+from judgments.utils.search_facets import SearchFacets, facet_filters
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from caselawclient.models.documents import Document
+    from caselawclient.responses.search_result import SearchResult
+    from django.db.models import QuerySet
+
+    from judgments.utils.document_list import DocumentListFilters
+
+logger = logging.getLogger(__name__)
+
+# List orders the mirror can serve, and the field each sorts on.
+MIRROR_ORDER_FIELDS = {
+    "date": "date",
+    "updated": "last_modified",
+    "transformation": "transformation_datetime",
+}
+
+# The fields of an entry which are updated when it is copied again.
+MIRRORED_FIELDS = [
+    "name",
+    "neutral_citation",
+    "court_code",
+    "date",
+    "transformation_datetime",
+    "last_modified",
+    "submission_datetime",
+    "author",
+    "consignment_reference",
+    "assigned_to",
+    "published",
+    "held",
+    "mirrored_at",
+]
+
+RECONCILE_BATCH_SIZE = 100
+
+
+@dataclass
+class MirrorPage:
+    documents: list[DocumentListEntry]
+    total: int
+    facets: SearchFacets
+    next_cursor: str | None
+    """The position of the last document on the page, for a link to the next page."""
+    previous_cursor: str | None
+    """The position of the first document on the page, for a link to the previous page."""
+
+
+# What `SearchResultMetadata` gives as the submission datetime of a document whose properties don't have one.
+_NO_SUBMISSION_DATETIME = datetime.min.replace(tzinfo=UTC)
+
+
+def _parse_datetime(value: str | None) -> datetime | None:
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=UTC)
+
+
+def properties_by_uri(uris: list[DocumentURIString]) -> dict[str, SearchResultMetadata]:
+    """The editor properties of each of `uris`, fetched in one MarkLogic call rather than the two each
+    `SearchResult.metadata` makes."""
+    root = etree.fromstring(api_client.get_properties_for_search_results(uris).encode())
+
+    properties: dict[str, SearchResultMetadata] = {}
+    for node in root.iterchildren("property-result"):
+        uri = MarkLogicDocumentURIString(node.get("uri")).as_document_uri()
+        # `SearchResultMetadata` looks for properties anywhere in the tree it's given, so give it a tree of its own.
+        properties[uri] = SearchResultMetadata(etree.fromstring(etree.tostring(node)), "")
+    return properties
+
+
+def submission_datetime(metadata: SearchResultMetadata) -> datetime | None:
+    """When a document was submitted, or `None` if its properties don't say."""
+    value = metadata.submission_datetime
+    return None if value == _NO_SUBMISSION_DATETIME else value
+
+
+def _metadata_fields(metadata: SearchResultMetadata | None, last_modified: str) -> dict[str, Any]:
+    fields: dict[str, Any] = {"last_modified": _parse_datetime(last_modified)}
+    if metadata is None:
+        return fields
+
+    return {
+        **fields,
+        "author": metadata.author,
+        "consignment_reference": metadata.consignment_reference,
+        "assigned_to": metadata.assigned_to,
+        "published": metadata.is_published,
+        "held": metadata.editor_hold == "true",
+        "submission_datetime": submission_datetime(metadata),
+    }
+
+
+def _document_fields(document: Document) -> dict[str, Any]:
+    neutral_citation = document.identifiers.preferred(type=NeutralCitationNumber) or document.identifiers.preferred(
+        type=PressSummaryRelatedNCNIdentifier,
+    )
+    return {
+        "name": document.body.name,
+        "neutral_citation": neutral_citation.value if neutral_citation else "",
+        "court_code": document.body.court_and_jurisdiction_identifier_string,
+        "date": document.body.document_date_as_date,
+        "transformation_datetime": document.body.transformation_datetime,
+    }
+
+
+def _search_result_fields(result: SearchResult) -> dict[str, Any]:
+    court = result.court
+    return {
+        "name": result.name,
+        "neutral_citation": result.neutral_citation or "",
+        "court_code": court.code if court else "",
+        "date": result.date.date() if result.date else None,
+        "transformation_datetime": _parse_datetime(result.transformation_date),
+    }
+
+
+def mirror_document(uri: str) -> Document | None:
+    """Bring the mirror's entry for the document at `uri` up to date, or remove it if the document has been deleted.
+
+    Returns the document as it now is, so the caller can reuse it. Returns `None` if the document doesn't exist, if the
+    mirror is off, or if MarkLogic couldn't be read; a failure here never stops a write, since the next reconcile will
+    catch up."""
+    if not settings.DOCUMENT_LIST_MIRROR:
+        return None
+
+    uri = DocumentURIString(uri.strip("/"))
+    if re.search(VERSION_REGEX, uri):
+        return None
+
+    try:
+        results, _ = fan_out(
+            {
+                "document": lambda: api_client.get_document_by_uri(uri),
+                "properties": lambda: properties_by_uri([uri]),
+                "last_modified": lambda: api_client.get_last_modified(uri),
+            },
+        )
+    except DocumentNotFoundError:
+        DocumentListEntry.objects.filter(uri=uri).delete()
+        return None
+    except MarklogicAPIError:
+        logger.warning("Couldn't update the document list mirror for %s", uri, exc_info=True)
+        return None
+
+    document = results["document"]
+    DocumentListEntry.objects.update_or_create(
+        uri=uri,
+        defaults={
+            **_document_fields(document),
+            **_metadata_fields(results["properties"].get(uri), results["last_modified"]),
+        },
+    )
+    return document
+
+
+def reconcile_document_list_mirror(results: Iterable[SearchResult]) -> tuple[int, int]:
+    """Copy every one of `results` (which should be every document) into the mirror, then remove entries for any
+    documents which weren't among them. Returns how many entries were copied and how many were removed."""
+    started = timezone.now()
+    mirrored = 0
+
+    for batch in batched(results, RECONCILE_BATCH_SIZE):
+        uris = [result.uri for result in batch]
+        properties = properties_by_uri(uris)
+        last_modified, _ = fan_out({uri: partial(api_client.get_last_modified, uri) for uri in uris})
+
+        entries = [
+            DocumentListEntry(
+                uri=result.uri,
+                **_search_result_fields(result),
+                **_metadata_fields(properties.get(result.uri), last_modified[result.uri]),
+            )
+            for result in batch
+        ]
+        DocumentListEntry.objects.bulk_create(
+            entries,
+            update_conflicts=True,
+            unique_fields=["uri"],
+            update_fields=MIRRORED_FIELDS,
+        )
+        mirrored += len(entries)
+
+    removed, _ = DocumentListEntry.objects.filter(mirrored_at__lt=started).delete()
+    return mirrored, removed
+
+
+def can_list_from_mirror(filters: DocumentListFilters) -> bool:
+    """Whether the list for `filters` can come from the mirror: it's on, and the list isn't a search."""
+    return settings.DOCUMENT_LIST_MIRROR and filters.query is None and filters.order.lstrip("-") in MIRROR_ORDER_FIELDS
+
+
+def _filter_entries(filters: DocumentListFilters) -> QuerySet[DocumentListEntry]:
+    entries = DocumentListEntry.objects.all()
+
+    if filters.publication_status == PUBLICATION_STATUS_UNPUBLISHED:
+        entries = entries.filter(published=False)
+    elif filters.publication_status == PUBLICATION_STATUS_PUBLISHED:
+        entries = entries.filter(published=True)
+
+    if filters.courts:
+        courts = Q()
+        for param in filters.courts:
+            code = COURT_TABLES.by_param[param].code
+            courts |= Q(court_code=code) | Q(court_code__startswith=f"{code}/")
+        entries = entries.filter(courts)
+
+    if filters.from_year is not None:
+        entries = entries.filter(date__year__gte=filters.from_year)
+    if filters.to_year is not None:
+        entries = entries.filter(date__year__lte=filters.to_year)
+
+    return entries
+
+
+def _ordered_entries(
+    entries: QuerySet[DocumentListEntry],
+    field_name: str,
+    *,
+    descending: bool,
+    reverse: bool = False,
+) -> QuerySet[DocumentListEntry]:
+    """`entries` in list order, or in exactly the opposite order if `reverse`. Documents missing the field go last in
+    list order, as they do in MarkLogic, and the URI makes the order stable."""
+    field = F(field_name)
+    if reverse:
+        return entries.order_by(
+            field.asc(nulls_first=True) if descending else field.desc(nulls_first=True),
+            "uri" if descending else "-uri",
+        )
+    return entries.order_by(
+        field.desc(nulls_last=True) if descending else field.asc(nulls_last=True),
+        "-uri" if descending else "uri",
+    )
+
+
+def _beyond_cursor(field_name: str, value: Any, uri: str, *, descending: bool, nulls_last: bool) -> Q:
+    """The entries which come after the one with `value` and `uri`, in an order which sorts on `field_name` then the
+    URI, in the given direction and with nulls at the given end."""
+    beyond = "lt" if descending else "gt"
+    nulls = Q(**{f"{field_name}__isnull": True})
+    if value is None:
+        after_nulls = Q(**{f"{field_name}__isnull": True, f"uri__{beyond}": uri})
+        return after_nulls if nulls_last else after_nulls | ~nulls
+
+    after_value = Q(**{f"{field_name}__{beyond}": value}) | Q(**{field_name: value, f"uri__{beyond}": uri})
+    return after_value | nulls if nulls_last else after_value
+
+
+def encode_cursor(entry: DocumentListEntry, order: str) -> str:
+    """A token for the position of `entry` in a list in `order`, for `DocumentListFilters.after` and `.before`."""
+    value = getattr(entry, MIRROR_ORDER_FIELDS[order.lstrip("-")])
+    position = [value.isoformat() if value is not None else None, entry.uri]
+    return urlsafe_b64encode(json.dumps(position).encode()).decode()
+
+
+def _decode_cursor(cursor: str, field_name: str) -> tuple[Any, str] | None:
+    """The sort value and URI from a cursor made by `encode_cursor`, or `None` if it's not a cursor for `field_name`."""
+    try:
+        value, uri = json.loads(urlsafe_b64decode(cursor.encode()))
+        if value is not None:
+            value = date.fromisoformat(value) if field_name == "date" else datetime.fromisoformat(value)
+    except (ValueError, TypeError):
+        return None
+    return value, str(uri)
+
+
+def _mirror_facets(filters: DocumentListFilters) -> SearchFacets:
+    entries = _filter_entries(facet_filters(filters))
+
+    courts: dict[str, int] = {}
+    for row in entries.values("court_code").annotate(count=Count("id")):
+        # Count a court with a jurisdiction towards the court.
+        code = row["court_code"].split("/")[0]
+        if code in COURT_TABLES.by_code:
+            courts[code] = courts.get(code, 0) + row["count"]
+
+    years = {
+        row["year"]: row["count"]
+        for row in entries.filter(date__isnull=False).values(year=ExtractYear("date")).annotate(count=Count("id"))
+    }
+
+    return SearchFacets(courts=courts, years=years)
+
+
+def list_from_mirror(filters: DocumentListFilters) -> MirrorPage:
+    """The page of documents `filters` ask for, with the number of documents in the list and its facet counts.
+
+    A page after or before a cursor is found by seeking to the cursor's position in the list's index, so it costs the
+    same however deep in the list it is. Pages asked for by number seek from whichever end of the list is nearer, so the
+    last page is as quick as the first."""
+    entries = _filter_entries(filters)
+    total = entries.count()
+    field_name = MIRROR_ORDER_FIELDS[filters.order.lstrip("-")]
+    descending = filters.order.startswith("-")
+
+    after = _decode_cursor(filters.after, field_name) if filters.after else None
+    before = _decode_cursor(filters.before, field_name) if filters.before else None
+    start = (filters.page - 1) * RESULTS_PER_PAGE
+
+    if after is not None:
+        beyond = _beyond_cursor(field_name, *after, descending=descending, nulls_last=True)
+        documents = list(_ordered_entries(entries.filter(beyond), field_name, descending=descending)[:RESULTS_PER_PAGE])
+    elif before is not None:
+        beyond = _beyond_cursor(field_name, *before, descending=not descending, nulls_last=False)
+        reversed_entries = _ordered_entries(entries.filter(beyond), field_name, descending=descending, reverse=True)
+        documents = list(reversed_entries[:RESULTS_PER_PAGE])[::-1]
+    elif start >= total:
+        documents = []
+    elif start > total / 2:
+        end = min(start + RESULTS_PER_PAGE, total)
+        reversed_entries = _ordered_entries(entries, field_name, descending=descending, reverse=True)
+        documents = list(reversed_entries[total - end : total - start])[::-1]
+    else:
+        documents = list(_ordered_entries(entries, field_name, descending=descending)[start : start + RESULTS_PER_PAGE])
+
+    return MirrorPage(
+        documents=documents,
+        total=total,
+        facets=_mirror_facets(filters),
+        next_cursor=encode_cursor(documents[-1], filters.order) if documents else None,
+        previous_cursor=encode_cursor(documents[0], filters.order) if documents else None,
+    )
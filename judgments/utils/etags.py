@@ -0,0 +1,115 @@
+"""ETags for document pages and downloads, so browsers can revalidate a copy they already have."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+from typing import TYPE_CHECKING, Any
+
+from caselawclient.errors import MarklogicAPIError
+from caselawclient.models.utilities import render_versions
+from caselawclient.types import DocumentURIString
+from django.conf import settings
+from django.contrib import messages
+from requests_toolbelt.multipart import decoder
+from waffle import get_waffle_flag_model
+
+from judgments.utils import VERSION_REGEX, api_client, document_exists, related_document_uri
+from judgments.utils.fan_out import fan_out
+
+if TYPE_CHECKING:
+    import requests
+    from django.http import HttpRequest
+
+# Cookies which change what a page renders.
+ETAG_COOKIES = (settings.CSRF_COOKIE_NAME, "cookies_policy", "dontShowCookieNotice")
+
+
+def _latest_version_number(versions_response: requests.Response) -> int:
+    try:
+        versions = render_versions(decoder.MultipartDecoder.from_response(versions_response).parts)
+    except AttributeError:
+        return 0
+    return versions[0]["version"] if versions else 0
+
+
+def document_state(document_uri: str) -> list[Any] | None:
+    """A fingerprint of the stored state of a document: when it was last written, its latest version number, its lock,
+    the properties editors change without writing the document (eg whether it's published or held, and who it's
+    assigned to), and whether it has a linked press summary or judgment. Returns `None` if the document can't be probed,
+    eg because it doesn't exist."""
+    uri = DocumentURIString(document_uri.strip("/"))
+    if re.search(VERSION_REGEX, uri):
+        # A version is never changed once it's written.
+        return [uri]
+
+    linked_uri = related_document_uri(uri)
+    try:
+        results, _ = fan_out(
+            {
+                "last_modified": lambda: api_client.get_last_modified(uri),
+                "versions": lambda: api_client.list_judgment_versions(uri),
+                "lock": lambda: api_client.get_judgment_checkout_status_message(uri),
+                "properties": lambda: api_client.get_properties_for_search_results([uri]),
+                # The same (cached) check the page makes before linking to it.
+                "linked_document": lambda: document_exists(linked_uri),
+            },
+        )
+    except MarklogicAPIError:
+        return None
+
+    return [
+        uri,
+        results["last_modified"],
+        _latest_version_number(results["versions"]),
+        results["lock"],
+        results["properties"],
+        linked_uri if results["linked_document"] else None,
+    ]
+
+
+def _viewer_state(request: HttpRequest) -> list[Any]:
+    user = request.user
+    flags = sorted((flag.name, bool(flag.is_active(request))) for flag in get_waffle_flag_model().get_all())
+    return [
+        user.pk,
+        user.is_superuser,
+        sorted(user.groups.values_list("name", flat=True)),
+        flags,
+        [request.COOKIES.get(name) for name in ETAG_COOKIES],
+    ]
+
+
+def _hash(*parts: Any) -> str:
+    return hashlib.sha256(json.dumps([settings.DOCUMENT_ETAG_SALT, *parts], default=str).encode()).hexdigest()
+
+
+def document_page_etag(request: HttpRequest, document_uri: str, **kwargs: Any) -> str | None:
+    """The ETag of a document page, for use with `django.views.decorators.http.condition`.
+
+    Returns `None` (so the page is rendered as normal) for anything but a GET, and when there are flash messages waiting
+    to be shown, since a cached page wouldn't show them."""
+    if not settings.DOCUMENT_ETAGS or request.method not in ("GET", "HEAD"):
+        return None
+    if len(messages.get_messages(request)):
+        return None
+
+    state = document_state(document_uri)
+    if state is None:
+        return None
+
+    return _hash(request.get_full_path(), state, _viewer_state(request))
+
+
+def document_download_etag(request: HttpRequest, document_uri: str, **kwargs: Any) -> str | None:
+    """The ETag of a file download of a document, which is the same whoever asks for it. Downloads may be compressed,
+    so the ETag depends on which encodings the client accepts."""
+    if not settings.DOCUMENT_ETAGS or request.method not in ("GET", "HEAD"):
+        return None
+
+    state = document_state(document_uri)
+    if state is None:
+        return None
+
+    return _hash(request.get_full_path(), state, request.headers.get("Accept-Encoding", ""))
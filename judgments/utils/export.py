@@ -0,0 +1,57 @@
+"""Streaming CSV and newline-delimited JSON exports."""
+
+from __future__ import annotations
+
+import csv
+import json
+from typing import TYPE_CHECKING, Any
+
+from django.http import StreamingHttpResponse
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+EXPORT_CONTENT_TYPES = {
+    "csv": "text/csv",
+    "ndjson": "application/x-ndjson",
+}
+DEFAULT_EXPORT_FORMAT = "csv"
+
+
+class _Echo:
+    """A file-like object which hands back whatever is written to it, so `csv.writer` can produce one line at a time."""
+
+    def write(self, value: str) -> str:
+        return value
+
+
+def csv_lines(fieldnames: list[str], rows: Iterable[dict[str, Any]]) -> Iterator[str]:
+    writer = csv.DictWriter(_Echo(), fieldnames=fieldnames)
+    yield writer.writeheader()
+    for row in rows:
+        yield writer.writerow(row)
+
+
+def ndjson_lines(rows: Iterable[dict[str, Any]]) -> Iterator[str]:
+    for row in rows:
+        yield json.dumps(row, default=str) + "\n"
+
+
+def export_format_from_request(request) -> str:
+    export_format = request.GET.get("format")
+    return export_format if export_format in EXPORT_CONTENT_TYPES else DEFAULT_EXPORT_FORMAT
+
+
+def export_response(
+    rows: Iterable[dict[str, Any]],
+    *,
+    fieldnames: list[str],
+    filename: str,
+    export_format: str = DEFAULT_EXPORT_FORMAT,
+) -> StreamingHttpResponse:
+    """A download of `rows` as CSV or NDJSON, named `filename` plus the extension for the format."""
+    lines = ndjson_lines(rows) if export_format == "ndjson" else csv_lines(fieldnames, rows)
+
+    response = StreamingHttpResponse(lines, content_type=EXPORT_CONTENT_TYPES[export_format])
+    response["Content-Disposition"] = f'attachment; filename="{filename}.{export_format}"'
+    return response
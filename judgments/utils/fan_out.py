@@ -0,0 +1,79 @@
+"""Run independent slow calls concurrently, timing each one."""
+
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any
+
+from django.conf import settings
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+_pool_thread = threading.local()
+
+
+def _mark_pool_thread() -> None:
+    _pool_thread.on_pool = True
+
+
+_executor = ThreadPoolExecutor(
+    max_workers=settings.FAN_OUT_MAX_WORKERS,
+    thread_name_prefix="fan-out",
+    initializer=_mark_pool_thread,
+)
+
+
+def on_pool() -> bool:
+    """Whether this is one of the pool's threads."""
+    return getattr(_pool_thread, "on_pool", False)
+
+
+def timed(call: Callable[[], Any]) -> tuple[Any, float]:
+    """Call `call`, returning its result and how long it took, in seconds."""
+    start = time.perf_counter()
+    result = call()
+    return result, time.perf_counter() - start
+
+
+def submit(call: Callable[[], Any]) -> Future[tuple[Any, float]]:
+    """Start `call` on the pool, returning a future of its result and how long it took, in seconds."""
+    return _executor.submit(timed, call)
+
+
+def fan_out(
+    calls: dict[str, Callable[[], Any]],
+    *,
+    inline: Iterable[str] = (),
+) -> tuple[dict[str, Any], dict[str, float]]:
+    """Run each of `calls` and return a dict of their results and a dict of how long each took, in seconds.
+
+    Calls named in `inline` run on the calling thread while the others run on the pool. Use this for anything which has
+    to stay on the request's thread, such as database queries (Django connections are per-thread).
+
+    Called from a pool thread, every call runs inline: waiting there for more pool work could leave every worker waiting
+    on calls which none of them is free to run.
+
+    If any call raises, the exception is re-raised here once the calls before it have finished.
+    """
+    inline = set(calls) if on_pool() else set(inline)
+    futures = {name: submit(call) for name, call in calls.items() if name not in inline}
+
+    results: dict[str, Any] = {}
+    timings: dict[str, float] = {}
+
+    for name, call in calls.items():
+        if name in inline:
+            results[name], timings[name] = timed(call)
+
+    for name, future in futures.items():
+        results[name], timings[name] = future.result()
+
+    return results, timings
+
+
+def server_timing_header(timings: dict[str, float]) -> str:
+    """Format call timings as a `Server-Timing` header value, so they show up in the browser's developer tools."""
+    return ", ".join(f"{name};dur={duration * 1000:.1f}" for name, duration in timings.items())
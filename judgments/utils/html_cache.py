@@ -0,0 +1,82 @@
+"""Caches of document HTML rendered from the XML by `Document.content_as_html()`."""
+
+from __future__ import annotations
+
+import re
+from typing import TYPE_CHECKING
+
+from django.core.cache import caches
+
+from judgments.utils import VERSION_REGEX
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from caselawclient.models.documents import Document
+
+
+def _html_cache():
+    return caches["document_html"]
+
+
+def version_html_cache_key(version_uri: str) -> str | None:
+    """The cache key for a historic version of a document, or `None` if `version_uri` isn't a version URI.
+
+    Versions are keyed by the URI of the document they belong to and their version number, so that the same version
+    reached through a differently-formatted URI is still found."""
+    match = re.search(VERSION_REGEX, version_uri)
+    if not match:
+        return None
+
+    document_uri = version_uri[: match.start()].strip("/").removesuffix("_")
+    return f"version_html:{document_uri}:{int(match.group(1))}"
+
+
+def get_or_render_version_html(version_uri: str, render: Callable[[], str | None]) -> str | None:
+    """Return the HTML of a historic version of a document, calling `render` to produce it only if it isn't cached.
+
+    The content of a MarkLogic version never changes once written, so the cached HTML is good forever."""
+    key = version_html_cache_key(version_uri)
+    if key is None:
+        return render()
+
+    html = _html_cache().get(key)
+    if html is None:
+        html = render()
+        if html is not None:
+            _html_cache().set(key, html)
+
+    return html
+
+
+def latest_version_number(document: Document) -> int:
+    """The number of the most recent MarkLogic version of `document`, or 0 if it isn't versioned."""
+    versions = document.versions
+    return versions[0]["version"] if versions else 0
+
+
+def _document_html_cache_key(document_uri: str) -> str:
+    return f"document_html:{document_uri.strip('/')}"
+
+
+def get_document_html(document: Document) -> str | None:
+    """Return the HTML of the current version of `document`, only rendering it if the cached copy is missing or was
+    rendered from an older version."""
+    key = _document_html_cache_key(document.uri)
+    version_number = latest_version_number(document)
+
+    cached = _html_cache().get(key)
+    if cached is not None:
+        cached_version_number, html = cached
+        if cached_version_number == version_number:
+            return html
+
+    html = document.content_as_html()
+    if html is not None:
+        _html_cache().set(key, (version_number, html))
+
+    return html
+
+
+def invalidate_document_html(document_uri: str) -> None:
+    _html_cache().delete(_document_html_cache_key(document_uri))
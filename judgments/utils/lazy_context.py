@@ -0,0 +1,57 @@
+"""Template context values which are only computed if the template uses them."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from jinja2.runtime import Context
+
+from judgments.utils.fan_out import submit, timed
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from concurrent.futures import Future
+
+
+class LazyContextValue:
+    """A value which is computed by calling `compute` the first time it's needed, then remembered.
+
+    `start` begins computing it on the fan-out pool straight away, for values which are certain to be needed and can be
+    computed off the request's thread. Otherwise it's computed on whichever thread first resolves it."""
+
+    def __init__(self, compute: Callable[[], Any]) -> None:
+        self._compute = compute
+        self._future: Future[tuple[Any, float]] | None = None
+        self._resolved = False
+        self._value: Any = None
+        self.duration: float | None = None
+
+    def start(self) -> None:
+        if self._future is None and not self._resolved:
+            self._future = submit(self._compute)
+
+    def resolve(self) -> Any:
+        if not self._resolved:
+            if self._future is not None:
+                self._value, self.duration = self._future.result()
+            else:
+                self._value, self.duration = timed(self._compute)
+            self._resolved = True
+
+        return self._value
+
+    @property
+    def resolved(self) -> bool:
+        return self._resolved
+
+
+class LazyContext(Context):
+    """A Jinja template context which resolves any `LazyContextValue` when the template looks it up. Jinja looks up every
+    name a block refers to as the block starts, so a value is computed for any template which mentions it, even inside a
+    branch which doesn't run."""
+
+    def resolve_or_missing(self, key: str) -> Any:
+        value = super().resolve_or_missing(key)
+        if isinstance(value, LazyContextValue):
+            return value.resolve()
+        return value
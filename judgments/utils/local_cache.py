@@ -0,0 +1,61 @@
+"""A short-lived, in-process cache for objects which can't go through Django's cache framework."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+
+
+class LocalCache[V]:
+    """A thread-safe, size-bounded map where entries expire after a number of seconds given by the `timeout_setting`
+    setting. A timeout of 0 turns the cache off. Once full, the least recently used entry is evicted."""
+
+    def __init__(self, timeout_setting: str, max_entries: int) -> None:
+        self.timeout_setting = timeout_setting
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[float, V]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def timeout(self) -> float:
+        return getattr(settings, self.timeout_setting)
+
+    def _cache_key(self, key: str) -> str:
+        return key
+
+    def get(self, key: str) -> V | None:
+        key = self._cache_key(key)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: V) -> None:
+        if self.timeout <= 0:
+            return
+
+        key = self._cache_key(key)
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.timeout, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(self._cache_key(key), None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,101 @@
+"""A local index of neutral citation numbers, so that an NCN can be found without searching MarkLogic."""
+
+from __future__ import annotations
+
+import re
+from typing import TYPE_CHECKING
+
+from caselawclient.models.identifiers.neutral_citation import NeutralCitationNumber
+from django.conf import settings
+from django.db import transaction
+
+from judgments.models import NeutralCitationIndexEntry
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from caselawclient.models.documents import Document
+    from caselawclient.models.identifiers.collection import IdentifiersCollection
+    from caselawclient.responses.search_result import SearchResult
+
+REBUILD_BATCH_SIZE = 500
+
+# The most citations suggested for what's been typed so far.
+TYPEAHEAD_LIMIT = 10
+
+
+def normalise_citation(value: str) -> str:
+    """`value` as citations are matched against, so eg `[2023]  uksc 1` matches `[2023] UKSC 1`."""
+    return re.sub(r"\s+", " ", value).strip().upper()
+
+
+def _entries(uri: str, citations: Iterable[str]) -> list[NeutralCitationIndexEntry]:
+    by_normalised = {normalise_citation(citation): citation for citation in citations if citation.strip()}
+    return [
+        NeutralCitationIndexEntry(neutral_citation=citation.strip(), normalised_citation=normalised, uri=uri)
+        for normalised, citation in by_normalised.items()
+    ]
+
+
+def _current_citations(identifiers: IdentifiersCollection) -> list[str]:
+    return [identifier.value for identifier in identifiers.of_type(NeutralCitationNumber) if not identifier.deprecated]
+
+
+def index_document_citations(document: Document) -> None:
+    """Replace the index's entries for `document` with its current NCNs. Call this after any write to its identifiers."""
+    if not settings.NCN_INDEX:
+        return
+
+    uri = document.uri.strip("/")
+    with transaction.atomic():
+        NeutralCitationIndexEntry.objects.filter(uri=uri).delete()
+        NeutralCitationIndexEntry.objects.bulk_create(_entries(uri, _current_citations(document.identifiers)))
+
+
+def remove_document_citations(uri: str) -> None:
+    """Remove the index's entries for the document at `uri`, which has been deleted."""
+    if not settings.NCN_INDEX:
+        return
+
+    NeutralCitationIndexEntry.objects.filter(uri=uri.strip("/")).delete()
+
+
+def rebuild_ncn_index(results: Iterable[SearchResult]) -> int:
+    """Replace the whole index with the current NCNs of `results`, which should be every document. Returns how many
+    citations were indexed."""
+    # Walking every document takes a while, so the index is only locked while it's replaced.
+    entries = [entry for result in results for entry in _entries(result.uri, _current_citations(result.identifiers))]
+
+    with transaction.atomic():
+        NeutralCitationIndexEntry.objects.all().delete()
+        NeutralCitationIndexEntry.objects.bulk_create(entries, batch_size=REBUILD_BATCH_SIZE, ignore_conflicts=True)
+
+    return len(entries)
+
+
+def citations_starting_with(prefix: str, limit: int = TYPEAHEAD_LIMIT) -> list[NeutralCitationIndexEntry]:
+    """Up to `limit` indexed citations which start with `prefix`, in order."""
+    prefix = normalise_citation(prefix)
+    if not settings.NCN_INDEX or not prefix:
+        return []
+
+    return list(
+        NeutralCitationIndexEntry.objects.filter(normalised_citation__startswith=prefix).order_by(
+            "normalised_citation",
+            "uri",
+        )[:limit],
+    )
+
+
+def document_uri_for_citation(citation: str) -> str | None:
+    """The URI of the one document with the NCN `citation`, or `None` if there isn't exactly one."""
+    if not settings.NCN_INDEX:
+        return None
+
+    uris = list(
+        NeutralCitationIndexEntry.objects.filter(normalised_citation=normalise_citation(citation)).values_list(
+            "uri",
+            flat=True,
+        )[:2],
+    )
+    return uris[0] if len(uris) == 1 else None
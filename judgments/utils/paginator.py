@@ -3,9 +3,9 @@ import math
 from caselawclient.search_parameters import RESULTS_PER_PAGE
 
 
-def paginator(current_page, total):
+def paginator(current_page, total, size_per_page=None):
     number_of_pagination_links = 5
-    size_per_page = RESULTS_PER_PAGE
+    size_per_page = size_per_page or RESULTS_PER_PAGE
     number_of_pages = math.ceil(int(total) / size_per_page)
 
     half_range = number_of_pagination_links // 2
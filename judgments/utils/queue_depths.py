@@ -0,0 +1,129 @@
+"""How many documents are waiting in each work queue over time, so we can tell whether the queues are keeping up."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+from django.utils import timezone
+
+from judgments.models import QueueDepthSnapshot
+from judgments.utils import api_client
+from judgments.utils.fan_out import fan_out
+from judgments.utils.target_versions import get_target_enrichment_version, get_target_parser_version
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+# MarkLogic can count the documents awaiting reparsing, but the enrichment and missing FCLID queues can only be listed, so
+# they're counted by listing no more than this many documents. A queue this deep is shown as at least this deep.
+QUEUE_COUNT_LIMIT = 1_000
+
+# How far back the latest snapshot is compared to.
+TREND_WINDOW = timedelta(days=1)
+
+# Each queue's field on `QueueDepthSnapshot`, its label, the field of the target version it's measured against, and
+# whether it's only counted up to `QUEUE_COUNT_LIMIT`.
+QUEUES: Sequence[tuple[str, str, str | None, bool]] = [
+    ("pending_parse", "Awaiting reparsing", "target_parser_version", False),
+    ("pending_enrichment", "Awaiting enrichment", "target_enrichment_version", True),
+    ("locked_documents", "Locked", None, False),
+    ("missing_fclid", "Published without an FCLID", None, True),
+]
+
+
+@dataclass(frozen=True)
+class QueueTrend:
+    label: str
+    depth: int
+    """How many documents were waiting at the latest snapshot."""
+
+    per_hour: float | None
+    """How many fewer documents were waiting each hour over the trend window, or `None` if there's nothing to compare."""
+
+    time_to_drain: timedelta | None
+    """How long the queue will take to empty at `per_hour`, or `None` if it isn't getting shorter."""
+
+    capped: bool = False
+    """Whether the queue was too deep to count, so `depth` is only how many documents were counted."""
+
+
+def _format_version(version: tuple[int, int]) -> str:
+    return f"{version[0]}.{version[1]}"
+
+
+def _count_rows(result: list) -> int:
+    # Like `get_rows_from_result`: the first row is column names, and with no results it's the only (unnested) row.
+    return len(result) - 1 if result and isinstance(result[0], list) else 0
+
+
+def record_queue_depths() -> QueueDepthSnapshot:
+    """Count every queue and record the counts."""
+    target_parser_version = get_target_parser_version()
+    target_enrichment_version = get_target_enrichment_version()
+
+    counts, _ = fan_out(
+        {
+            "pending_parse": lambda: api_client.get_count_pending_parse_for_version(target_parser_version),
+            "pending_enrichment": lambda: _count_rows(
+                api_client.get_pending_enrichment_for_version(
+                    target_enrichment_version=target_enrichment_version,
+                    target_parser_version=target_parser_version,
+                    maximum_records=QUEUE_COUNT_LIMIT,
+                ),
+            ),
+            "locked_documents": lambda: len(api_client.get_locked_documents()),
+            "missing_fclid": lambda: len(api_client.get_missing_fclid(maximum_records=QUEUE_COUNT_LIMIT)),
+        },
+    )
+
+    return QueueDepthSnapshot.objects.create(
+        recorded_at=timezone.now(),
+        target_parser_version=_format_version(target_parser_version),
+        target_enrichment_version=_format_version(target_enrichment_version),
+        **counts,
+    )
+
+
+def _queue_trend(
+    label: str,
+    field: str,
+    earliest: QueueDepthSnapshot | None,
+    latest: QueueDepthSnapshot,
+    *,
+    limited: bool,
+) -> QueueTrend:
+    depth = getattr(latest, field)
+    capped = limited and depth >= QUEUE_COUNT_LIMIT
+    if earliest is None or capped or (limited and getattr(earliest, field) >= QUEUE_COUNT_LIMIT):
+        # There's no telling how fast a queue is draining while it's too deep to count.
+        return QueueTrend(label=label, depth=depth, per_hour=None, time_to_drain=None, capped=capped)
+
+    hours = (latest.recorded_at - earliest.recorded_at).total_seconds() / 3600
+    per_hour = (getattr(earliest, field) - depth) / hours
+
+    if depth == 0:
+        time_to_drain: timedelta | None = timedelta(0)
+    elif per_hour > 0:
+        time_to_drain = timedelta(hours=depth / per_hour)
+    else:
+        time_to_drain = None
+
+    return QueueTrend(label=label, depth=depth, per_hour=per_hour, time_to_drain=time_to_drain)
+
+
+def queue_trends(latest: QueueDepthSnapshot) -> list[QueueTrend]:
+    """How each queue has changed over the trend window up to the `latest` snapshot."""
+    window = QueueDepthSnapshot.objects.filter(
+        recorded_at__gte=latest.recorded_at - TREND_WINDOW,
+        recorded_at__lt=latest.recorded_at,
+    )
+
+    trends = []
+    for field, label, version_field, limited in QUEUES:
+        snapshots = window
+        if version_field is not None:
+            snapshots = snapshots.filter(**{version_field: getattr(latest, version_field)})
+        trends.append(_queue_trend(label, field, snapshots.order_by("recorded_at").first(), latest, limited=limited))
+    return trends
@@ -0,0 +1,61 @@
+"""Report results computed ahead of time, so that reports load without waiting for MarkLogic."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import TYPE_CHECKING, Any
+
+from django.db.models import Q
+from django.utils import timezone
+
+from judgments.models import ReportSnapshot
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+# A refresh which hasn't finished in this long is assumed to have died, and no longer stops another one starting.
+REFRESH_TIMEOUT = timedelta(minutes=10)
+
+
+def _claim_refresh(name: str) -> bool:
+    """Mark the report `name` as being refreshed, unless another refresh is already under way. Returns whether it was
+    marked."""
+    ReportSnapshot.objects.get_or_create(name=name)
+
+    now = timezone.now()
+    claimed = (
+        ReportSnapshot.objects.filter(name=name)
+        .filter(Q(refreshing_since=None) | Q(refreshing_since__lt=now - REFRESH_TIMEOUT))
+        .update(refreshing_since=now)
+    )
+    return claimed == 1
+
+
+def refresh_report(name: str, compute: Callable[[], dict[str, Any]]) -> ReportSnapshot | None:
+    """Compute the report `name` and keep its results. Returns the new snapshot, or `None` without computing anything if
+    the report is already being refreshed."""
+    if not _claim_refresh(name):
+        return None
+
+    try:
+        data = compute()
+    except Exception:
+        ReportSnapshot.objects.filter(name=name).update(refreshing_since=None)
+        raise
+
+    snapshot = ReportSnapshot.objects.get(name=name)
+    snapshot.data = data
+    snapshot.as_of = timezone.now()
+    snapshot.refreshing_since = None
+    snapshot.save()
+    return snapshot
+
+
+def get_report(name: str, compute: Callable[[], dict[str, Any]]) -> ReportSnapshot:
+    """The last snapshot of the report `name`. If there isn't one yet, the report is computed now."""
+    snapshot = ReportSnapshot.objects.filter(name=name).exclude(as_of=None).first()
+    if snapshot is not None:
+        return snapshot
+
+    # If another refresh is computing the first snapshot, computing it here too is the only way to show anything.
+    return refresh_report(name, compute) or ReportSnapshot(name=name, data=compute(), as_of=timezone.now())
@@ -0,0 +1,21 @@
+"""A short-lived, in-process cache of search results."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from judgments.utils.local_cache import LocalCache
+
+if TYPE_CHECKING:
+    from caselawclient.responses.search_response import SearchResponse
+
+SEARCH_RESULTS_CACHE_MAX_ENTRIES = 256
+
+search_results_cache: LocalCache[SearchResponse] = LocalCache(
+    "SEARCH_RESULTS_CACHE_TIMEOUT",
+    SEARCH_RESULTS_CACHE_MAX_ENTRIES,
+)
+
+
+def invalidate_search_results() -> None:
+    search_results_cache.clear()
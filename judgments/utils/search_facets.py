@@ -0,0 +1,74 @@
+"""Counts of how many documents in a list come from each court and each year."""
+
+from __future__ import annotations
+
+import hashlib
+from dataclasses import dataclass, field, replace
+from typing import TYPE_CHECKING
+
+from django.conf import settings
+from django.core.cache import cache
+
+from judgments.utils.court_tables import COURT_TABLES
+from judgments.utils.document_list import DEFAULT_ORDER
+
+if TYPE_CHECKING:
+    from caselawclient.responses.search_response import SearchResponse
+
+    from judgments.utils.document_list import DocumentListFilters
+
+
+@dataclass(frozen=True)
+class SearchFacets:
+    courts: dict[str, int] = field(default_factory=dict)
+    """Number of documents by court code."""
+
+    years: dict[int, int] = field(default_factory=dict)
+    """Number of documents by year."""
+
+
+def facet_filters(filters: DocumentListFilters) -> DocumentListFilters:
+    """The filters which facet counts for `filters` depend on: everything but the page, order, courts and years."""
+    return replace(
+        filters,
+        page=1,
+        after=None,
+        before=None,
+        order=DEFAULT_ORDER,
+        courts=[],
+        from_year=None,
+        to_year=None,
+    )
+
+
+def has_facet_filters(filters: DocumentListFilters) -> bool:
+    """Whether `filters` narrow a list by court or year, so that its own search can't be used to count facets."""
+    return bool(filters.courts) or filters.from_year is not None or filters.to_year is not None
+
+
+def search_facets_from_response(search_response: SearchResponse) -> SearchFacets:
+    """The court and year counts from a search. MarkLogic returns both as one list of names, so tell them apart by shape:
+    years are four digits, and anything else we count only if it's the code of a court we know about."""
+    courts: dict[str, int] = {}
+    years: dict[int, int] = {}
+
+    for name, count in search_response.facets.items():
+        if len(name) == 4 and name.isdigit():
+            years[int(name)] = int(count)
+        elif name in COURT_TABLES.by_code:
+            courts[name] = int(count)
+
+    return SearchFacets(courts=courts, years=years)
+
+
+def _search_facets_cache_key(filters: DocumentListFilters) -> str:
+    facets_key = facet_filters(filters).cache_key()
+    return f"search_facets:{hashlib.sha256(facets_key.encode()).hexdigest()}"
+
+
+def get_cached_search_facets(filters: DocumentListFilters) -> SearchFacets | None:
+    return cache.get(_search_facets_cache_key(filters))
+
+
+def cache_search_facets(filters: DocumentListFilters, facets: SearchFacets) -> None:
+    cache.set(_search_facets_cache_key(filters), facets, settings.SEARCH_FACETS_CACHE_TIMEOUT)
@@ -0,0 +1,76 @@
+"""Highlighted snippets of the text which matched a search, rendered by `judgments/search_match.xsl`."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from django.conf import settings
+from django.core.cache import cache
+from lxml import etree
+from markupsafe import Markup
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from caselawclient.responses.search_result import SearchResult
+
+SEARCH_NAMESPACE = "http://marklogic.com/appservices/search"
+
+SEARCH_MATCH_XSL = Path(__file__).resolve().parent.parent / "search_match.xsl"
+
+# Renders each result in a batch as search_match.xsl would, wrapped in an element of its own so they can be told apart.
+_BATCH_XSL = f"""<xsl:stylesheet xmlns:xsl="http://www.w3.org/1999/XSL/Transform"
+                xmlns:search="{SEARCH_NAMESPACE}"
+                exclude-result-prefixes="search"
+                version="1.0">
+    <xsl:import href="{SEARCH_MATCH_XSL.name}"/>
+
+    <xsl:template match="/batch">
+        <batch>
+            <xsl:for-each select="search:result">
+                <snippet><xsl:apply-templates select="."/></snippet>
+            </xsl:for-each>
+        </batch>
+    </xsl:template>
+</xsl:stylesheet>"""
+
+# The base URL is only used to find search_match.xsl, so needn't be a file which exists.
+_batch_transform = etree.XSLT(
+    etree.fromstring(_BATCH_XSL.encode(), base_url=SEARCH_MATCH_XSL.with_name("search_match_batch.xsl").as_uri()),
+)
+
+
+def _snippet_cache_key(uri: str, query: str) -> str:
+    return f"search_snippet:{hashlib.sha256(json.dumps([uri, query]).encode()).hexdigest()}"
+
+
+def _render(results: list[SearchResult]) -> list[str]:
+    batch = etree.Element("batch")
+    for result in results:
+        batch.append(etree.fromstring(etree.tostring(result.node)))
+
+    rendered = _batch_transform(batch).getroot()
+    return [
+        "".join(etree.tostring(child, method="html", encoding="unicode", with_tail=False) for child in snippet)
+        for snippet in rendered
+    ]
+
+
+def render_snippets(results: Iterable[SearchResult], query: str) -> dict[str, Markup]:
+    """The highlighted snippets of each of `results` for `query`, by document URI. Only results which aren't cached are
+    rendered, all in one transform."""
+    results = list(results)
+    keys = {result.uri: _snippet_cache_key(result.uri, query) for result in results}
+    cached = cache.get_many(keys.values())
+
+    snippets = {uri: cached[key] for uri, key in keys.items() if key in cached}
+    uncached = [result for result in results if result.uri not in snippets]
+    if uncached:
+        rendered = dict(zip((result.uri for result in uncached), _render(uncached), strict=True))
+        cache.set_many({keys[uri]: html for uri, html in rendered.items()}, settings.SEARCH_SNIPPETS_CACHE_TIMEOUT)
+        snippets.update(rendered)
+
+    return {uri: Markup(html) for uri, html in snippets.items()}  # noqa: S704
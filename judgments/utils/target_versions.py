@@ -0,0 +1,49 @@
+"""The highest parser and enrichment versions, which documents are reparsed and re-enriched up to."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+from django.conf import settings
+from django.utils import timezone
+
+from judgments.models import TargetVersion
+from judgments.utils import api_client
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+PARSER_VERSION = "parser"
+ENRICHMENT_VERSION = "enrichment"
+
+
+def _target_version(name: str, find: Callable[[], tuple[int, int]]) -> tuple[int, int]:
+    # Kept only in the database, so that every process (eg each run of a queue management command) shares it, and sees it
+    # cleared as soon as `clear_target_versions` is called.
+    timeout = timedelta(seconds=settings.TARGET_VERSION_CACHE_TIMEOUT)
+    found = TargetVersion.objects.filter(name=name, found_at__gt=timezone.now() - timeout).first()
+    if found is not None:
+        return (found.major, found.minor)
+
+    version = find()
+    if timeout:
+        TargetVersion.objects.update_or_create(
+            name=name,
+            defaults={"major": version[0], "minor": version[1], "found_at": timezone.now()},
+        )
+    return version
+
+
+def get_target_parser_version() -> tuple[int, int]:
+    return _target_version(PARSER_VERSION, api_client.get_highest_parser_version)
+
+
+def get_target_enrichment_version() -> tuple[int, int]:
+    return _target_version(ENRICHMENT_VERSION, api_client.get_highest_enrichment_version)
+
+
+def clear_target_versions() -> None:
+    """Forget the target versions, so that they're looked up again. Call this when a new parser or enrichment engine has
+    been released."""
+    TargetVersion.objects.all().delete()
@@ -1,22 +1,49 @@
+from collections.abc import Iterator
+from concurrent.futures import Future
+from dataclasses import replace
 from typing import TYPE_CHECKING, Any, cast
 
-import ds_caselaw_utils as caselawutils
 from caselawclient.client_helpers.search_helpers import search_and_parse_response
 from caselawclient.errors import DocumentNotFoundError
 from caselawclient.models.documents import Document, DocumentURIString
 from caselawclient.models.identifiers.neutral_citation import NeutralCitationNumber
-from caselawclient.search_parameters import SearchParameters
+from caselawclient.responses.search_response import SearchResponse
+from caselawclient.responses.search_result import SearchResult
+from caselawclient.search_parameters import RESULTS_PER_PAGE, SearchParameters
 from django.http import Http404
+from django.views.decorators.cache import cache_control
+from django.views.decorators.http import condition
 from django.views.generic import TemplateView
 
 from judgments.templatetags.document_utils import display_datetime
 from judgments.utils import api_client, editors_dict, extract_version_number_from_filename, get_linked_document_uri
+from judgments.utils.court_tables import COURT_TABLES
+from judgments.utils.document_cache import document_cache
 from judgments.utils.document_list import DocumentListFilters
+from judgments.utils.document_mirror import can_list_from_mirror, list_from_mirror
+from judgments.utils.etags import document_page_etag
+from judgments.utils.fan_out import server_timing_header, submit
+from judgments.utils.html_cache import get_document_html, get_or_render_version_html
+from judgments.utils.lazy_context import LazyContextValue
 from judgments.utils.link_generators import build_jira_create_link
 from judgments.utils.paginator import paginator
+from judgments.utils.search_cache import search_results_cache
+from judgments.utils.search_facets import (
+    SearchFacets,
+    cache_search_facets,
+    facet_filters,
+    get_cached_search_facets,
+    has_facet_filters,
+    search_facets_from_response,
+)
 
 if TYPE_CHECKING:
     from caselawclient.models.documents.metadata.types.name import NameMetadata
+    from django.template.response import TemplateResponse
+
+
+# Results fetched per MarkLogic search when walking every page of a list, eg for an export.
+EXPORT_PAGE_SIZE = 100
 
 
 def user_is_superuser(user):
@@ -51,6 +78,7 @@ def _search_parameters_from_filters(
     filters: DocumentListFilters,
     *,
     neutral_citation: bool = False,
+    page_size: int = RESULTS_PER_PAGE,
 ) -> SearchParameters:
     common: dict[str, Any] = {
         "order": filters.order,
@@ -58,6 +86,8 @@ def _search_parameters_from_filters(
         "show_unpublished": filters.show_unpublished,
         "page": filters.page,
     }
+    if page_size != RESULTS_PER_PAGE:
+        common["page_size"] = page_size
     if filters.court_param:
         common["court"] = filters.court_param
     if filters.date_from:
@@ -70,33 +100,163 @@ def _search_parameters_from_filters(
     return SearchParameters(query=filters.query, **common)
 
 
-def get_search_results_from_filters(filters: DocumentListFilters) -> dict[str, Any]:
+def search_with_filters(filters: DocumentListFilters) -> SearchResponse:
+    """Run the search for `filters`, reusing the results of an identical search made moments ago if there is one."""
+    search_response = search_results_cache.get(filters.cache_key())
+    if search_response is not None:
+        return search_response
+
     neutral_citation = filters.search_filter == "ncn"
     search_parameters = _search_parameters_from_filters(filters, neutral_citation=neutral_citation)
     search_response = search_and_parse_response(api_client, search_parameters)
 
+    search_results_cache.set(filters.cache_key(), search_response)
+    return search_response
+
+
+def prefetch_search_with_filters(filters: DocumentListFilters) -> Future | None:
+    """Start the search for `filters` on the fan-out pool, so that its results are cached by the time they're asked for.
+    If the search fails, it's simply run again when the results are needed."""
+    if search_results_cache.timeout <= 0 or can_list_from_mirror(filters):
+        return None
+    if search_results_cache.get(filters.cache_key()) is not None:
+        return None
+
+    return submit(lambda: search_with_filters(filters))
+
+
+def iter_search_result_pages(
+    filters: DocumentListFilters,
+    *,
+    page_size: int = EXPORT_PAGE_SIZE,
+) -> Iterator[list[SearchResult]]:
+    """Every page of results for `filters`, whatever page they ask for. Pages are fetched one at a time as they're
+    consumed, and bypass the search results cache."""
+    neutral_citation = filters.search_filter == "ncn"
+    page = 1
+    while True:
+        search_parameters = _search_parameters_from_filters(
+            replace(filters, page=page),
+            neutral_citation=neutral_citation,
+            page_size=page_size,
+        )
+        search_response = search_and_parse_response(api_client, search_parameters)
+        results = search_response.results
+        if results:
+            yield results
+
+        if not results or page * page_size >= search_response.total:
+            return
+        page += 1
+
+
+def iter_search_results(filters: DocumentListFilters, *, page_size: int = EXPORT_PAGE_SIZE) -> Iterator[SearchResult]:
+    """Every result for `filters`, fetched a page at a time as they're consumed (see `iter_search_result_pages`)."""
+    for results in iter_search_result_pages(filters, page_size=page_size):
+        yield from results
+
+
+def _search_facets(filters: DocumentListFilters) -> SearchFacets:
+    # Only the counts are wanted, so fetch as few results as possible.
+    search_parameters = _search_parameters_from_filters(
+        facet_filters(filters),
+        neutral_citation=filters.search_filter == "ncn",
+        page_size=1,
+    )
+    return search_facets_from_response(search_and_parse_response(api_client, search_parameters))
+
+
+def get_search_results_from_filters(filters: DocumentListFilters) -> dict[str, Any]:
+    if can_list_from_mirror(filters):
+        page = list_from_mirror(filters)
+        context = _search_results_context(
+            filters,
+            page.documents,
+            page.total,
+            facets=page.facets,
+        )
+        context["paginator"].update(next_cursor=page.next_cursor, previous_cursor=page.previous_cursor)
+        return context
+
+    facets = get_cached_search_facets(filters)
+    facets_future = None
+    if facets is None and has_facet_filters(filters):
+        facets_future = submit(lambda: _search_facets(filters))
+
+    search_response = search_with_filters(filters)
+
+    if facets is None:
+        facets = facets_future.result()[0] if facets_future else search_facets_from_response(search_response)
+        cache_search_facets(filters, facets)
+
+    return _search_results_context(
+        filters,
+        search_response.results,
+        search_response.total,
+        facets=facets,
+    )
+
+
+def _search_results_context(
+    filters: DocumentListFilters,
+    documents: list[Any],
+    total: int,
+    *,
+    facets: SearchFacets,
+) -> dict[str, Any]:
     return {
         **filters.context_dict(),
-        "total": search_response.total,
-        "judgments": search_response.results,
-        "documents": search_response.results,
-        "paginator": paginator(filters.page, search_response.total),
+        "total": total,
+        "judgments": documents,
+        "documents": documents,
+        "paginator": paginator(filters.page, total),
+        "facets": facets,
     }
 
 
 def get_document_by_uri_or_404(uri: str) -> Document:
+    """Fetch a document, reusing a copy fetched moments ago (eg by the POST handler which redirected here) if there is one."""
+    document = document_cache.get(uri)
+    if document is not None:
+        return document
+
     try:
-        return api_client.get_document_by_uri(DocumentURIString(uri))
+        document = api_client.get_document_by_uri(DocumentURIString(uri))
     except DocumentNotFoundError as e:
         msg = f"Document not found at {uri}"
         raise Http404(msg) from e
 
+    document_cache.set(uri, document)
+    return document
+
 
 class DocumentViewMixin(TemplateView):
+    # The expensive parts of the context are lazy, so they're only computed for pages whose templates use them. Those
+    # named here are used by every document page, so they're started on the fan-out pool as soon as the context is
+    # built. Only name values which are safe to compute off the request's thread: not the editors (a database query)
+    # or the document HTML (the XSLT transform).
+    prefetched_context: tuple[str, ...] = ("jira_create_link", "linked_document_uri")
+
+    @classmethod
+    def as_view(cls, **initkwargs):
+        # Check the ETag before `setup` fetches the document, so that answering a revalidation doesn't load it. Browsers
+        # must revalidate every time, and the page is specific to the user.
+        view = super().as_view(**initkwargs)
+        return cache_control(private=True, no_cache=True)(condition(etag_func=document_page_etag)(view))
+
     def setup(self, request, *args, **kwargs):
         super().setup(request, *args, **kwargs)
         document_uri = self.kwargs["document_uri"]
         self.document = get_document_by_uri_or_404(document_uri)
+        self.lazy_context: dict[str, LazyContextValue] = {}
+
+    def _get_document_html(self, version_uri: str | None) -> str | None:
+        if version_uri:
+            return get_or_render_version_html(
+                version_uri,
+                lambda: get_document_by_uri_or_404(version_uri).content_as_html(),
+            )
+        return get_document_html(self.document)
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
@@ -107,22 +267,26 @@ class DocumentViewMixin(TemplateView):
 
         if version_uri:
             context["current_version_number"] = extract_version_number_from_filename(version_uri)
-            context["document_html"] = get_document_by_uri_or_404(version_uri).content_as_html()
-        else:
-            context["document_html"] = self.document.content_as_html()
+
+        self.lazy_context = {
+            "document_html": LazyContextValue(lambda: self._get_document_html(version_uri)),
+            "editors": LazyContextValue(editors_dict),
+            "jira_create_link": LazyContextValue(
+                lambda: build_jira_create_link(
+                    document=self.document,
+                    request=self.request,
+                ),
+            ),
+            "linked_document_uri": LazyContextValue(lambda: get_linked_document_uri(self.document)),
+        }
+        for name in self.prefetched_context:
+            self.lazy_context[name].start()
+        context.update(self.lazy_context)
 
         title = cast("NameMetadata | None", self.document.metadata.get("title"))
         context["page_title"] = title.value if title else "Untitled document"
-        context["courts"] = caselawutils.courts.get_all(with_jurisdictions=True)
+        context["courts"] = COURT_TABLES.all_courts
 
-        context["editors"] = editors_dict()
-
-        context["jira_create_link"] = build_jira_create_link(
-            document=self.document,
-            request=self.request,
-        )
-
-        context["linked_document_uri"] = get_linked_document_uri(self.document)
         context["document_type"] = self.document.document_noun.replace(" ", "_")
 
         context["preferred_ncn"] = self.document.identifiers.preferred(type=NeutralCitationNumber)
@@ -139,6 +303,17 @@ class DocumentViewMixin(TemplateView):
 
         return context
 
+    def _add_server_timing_header(self, response):
+        timings = {name: value.duration for name, value in self.lazy_context.items() if value.duration is not None}
+        if timings:
+            response["Server-Timing"] = server_timing_header(timings)
+
+    def render_to_response(self, context, **response_kwargs):
+        response = cast("TemplateResponse", super().render_to_response(context, **response_kwargs))
+        # Lazy values are computed while the template renders, so their timings are only known afterwards.
+        response.add_post_render_callback(self._add_server_timing_header)
+        return response
+
 
 class DocumentView(DocumentViewMixin, TemplateView):
     def get_context_data(self, **kwargs):
@@ -4,6 +4,8 @@ from django.http import HttpResponseRedirect
 from django.urls import reverse
 
 from judgments.utils.aws import invalidate_caches
+from judgments.utils.document_cache import invalidate_document_caches
+from judgments.utils.ncn_index import remove_document_citations
 from judgments.utils.view_helpers import (
     DocumentView,
     get_document_by_uri_or_404,
@@ -37,6 +39,8 @@ def delete(request):
 
     document.delete()
     invalidate_caches(document.uri)
+    invalidate_document_caches(document.uri)
+    remove_document_citations(document.uri)
 
     messages.success(
         request,
@@ -1,9 +1,23 @@
+import re
 from urllib.parse import urlencode
 
-from django.http import HttpResponse, HttpResponseRedirect
+from caselawclient.errors import MarklogicNotPermittedError, MarklogicResourceNotFoundError
+from caselawclient.types import DocumentURIString
+from django.http import Http404, HttpResponseRedirect, StreamingHttpResponse
 from django.urls import reverse
+from django.utils.cache import patch_vary_headers
+from django.utils.text import compress_sequence
+from django.views.decorators.cache import cache_control
+from django.views.decorators.http import condition
 
-from judgments.utils.view_helpers import DocumentView, get_document_by_uri_or_404
+from judgments.utils import api_client
+from judgments.utils.etags import document_download_etag
+from judgments.utils.html_cache import get_document_html
+from judgments.utils.view_helpers import DocumentView
+
+XML_DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+ACCEPTS_GZIP_RE = re.compile(r"\bgzip\b")
 
 
 class DocumentReviewHTMLView(DocumentView):
@@ -14,7 +28,7 @@ class DocumentReviewHTMLView(DocumentView):
         if self.document.failed_to_parse:
             return super().dispatch(request, args, kwargs)
 
-        if not self.document.content_as_html() and not request.GET.get("no-redirect", False):
+        if not get_document_html(self.document) and not request.GET.get("no-redirect", False):
             redirect_path = reverse("full-text-pdf", kwargs={"document_uri": self.document.uri})
             return HttpResponseRedirect(redirect_path)
 
@@ -47,12 +61,34 @@ class DocumentReviewPDFView(DocumentView):
         return context
 
 
-def xml_view(request, document_uri):
-    document = get_document_by_uri_or_404(document_uri)
-    document_xml = document.body.content_as_xml
+def _chunks(content: bytes, chunk_size: int = XML_DOWNLOAD_CHUNK_SIZE):
+    for start in range(0, len(content), chunk_size):
+        yield content[start : start + chunk_size]
 
-    response = HttpResponse(document_xml, content_type="application/xml")
-    response["Content-Disposition"] = f"attachment; filename={document.uri}.xml"
+
+@cache_control(private=True, no_cache=True)
+@condition(etag_func=document_download_etag)
+def xml_view(request, document_uri):
+    """Download the XML of a document, exactly as it's stored in MarkLogic.
+
+    This fetches the raw XML rather than loading the document, so we never parse it or serialise it again, and streams it
+    out in chunks (gzipped, if the client accepts that) instead of building the response body in one piece."""
+    document_uri = DocumentURIString(document_uri.strip("/"))
+    try:
+        document_xml = api_client.get_judgment_xml_bytestring(document_uri, show_unpublished=True)
+    except (MarklogicNotPermittedError, MarklogicResourceNotFoundError) as e:
+        msg = f"Document not found at {document_uri}"
+        raise Http404(msg) from e
+
+    if ACCEPTS_GZIP_RE.search(request.headers.get("Accept-Encoding", "")):
+        response = StreamingHttpResponse(compress_sequence(_chunks(document_xml)), content_type="application/xml")
+        response["Content-Encoding"] = "gzip"
+    else:
+        response = StreamingHttpResponse(_chunks(document_xml), content_type="application/xml")
+        response["Content-Length"] = str(len(document_xml))
+
+    patch_vary_headers(response, ("Accept-Encoding",))
+    response["Content-Disposition"] = f"attachment; filename={document_uri}.xml"
     return response
 
 
@@ -11,6 +11,8 @@ from django.http import Http404
 from django.urls import reverse
 from django.views.generic import FormView
 
+from judgments.utils.document_cache import invalidate_document_caches
+from judgments.utils.ncn_index import index_document_citations
 from judgments.utils.view_helpers import DocumentView, DocumentViewMixin
 
 if TYPE_CHECKING:
@@ -125,6 +127,8 @@ class AddDocumentIdentifierView(DocumentViewMixin, FormView):
 
         # Everything checks out - save the identifiers to the database.
         self.document.save_identifiers()
+        index_document_citations(self.document)
+        invalidate_document_caches(self.document.uri)
 
         messages.success(
             self.request,
@@ -184,6 +188,8 @@ class DeleteDocumentIdentifierView(DocumentViewMixin, FormView):
 
         # Save the identifiers to the database. This runs validations as part of save operations, so if we've ended up here but the result is invalid it won't be committed.
         self.document.save_identifiers()
+        index_document_citations(self.document)
+        invalidate_document_caches(self.document.uri)
 
         messages.success(self.request, f'{identifier.schema.name} with value "{identifier.value}" has been deleted.')
 
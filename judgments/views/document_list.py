@@ -1,17 +1,48 @@
-from judgments.utils.document_list import PUBLICATION_STATUS_ALL, PUBLICATION_STATUS_UNPUBLISHED
-from judgments.utils.view_helpers import get_document_list_filters, get_search_results_from_filters
+from dataclasses import replace
+
+from django.http import HttpResponseRedirect
+from django.urls import reverse
+from django.utils.cache import patch_vary_headers
+
+from judgments.utils.court_tables import COURT_TABLES
+from judgments.utils.document_list import PUBLICATION_STATUS_ALL, PUBLICATION_STATUS_UNPUBLISHED, without_page_params
+from judgments.utils.document_mirror import properties_by_uri, submission_datetime
+from judgments.utils.export import export_format_from_request, export_response
+from judgments.utils.ncn_index import document_uri_for_citation
+from judgments.utils.search_snippets import render_snippets
+from judgments.utils.view_helpers import (
+    get_document_list_filters,
+    get_search_results_from_filters,
+    iter_search_result_pages,
+    prefetch_search_with_filters,
+)
 
 from .paginated_view import PaginatedView
 
+# Requests with this header set to `FRAGMENT_NAME` get just the list (facets, table and pagination) without the page
+# around it, so the list can be updated in place. See static/js/src/components/document_list.js.
+FRAGMENT_HEADER = "X-Fragment"
+FRAGMENT_NAME = "document-list-results"
+
 
 class DocumentListView(PaginatedView):
     """Shared home / results list view."""
 
     template_engine = "jinja"
     template_name = "pages/document_list.jinja"
+    fragment_template_name = "includes/document_list_results.jinja"
     default_publication_status = PUBLICATION_STATUS_UNPUBLISHED
     is_results_view = False
 
+    def get(self, request, *args, **kwargs):
+        # A search for an NCN is nearly always looking for the one document with it, so go straight there.
+        if request.GET.get("search_filter") == "ncn" and not self.is_fragment_request:
+            document_uri = document_uri_for_citation(request.GET.get("query", ""))
+            if document_uri:
+                return HttpResponseRedirect(reverse("full-text-html", kwargs={"document_uri": document_uri}))
+
+        return super().get(request, *args, **kwargs)
+
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
 
@@ -21,17 +52,88 @@ class DocumentListView(PaginatedView):
         )
         search_context = get_search_results_from_filters(filters)
 
+        # Editors working through a list nearly always go on to the next page, so have it ready for them.
+        if search_context["paginator"].get("has_next_page", False):
+            prefetch_search_with_filters(replace(filters, page=filters.page + 1))
+
         context.update(search_context)
         context["pagination_data"] = self.get_pagination_context(
             request=self.request,
             paginator=search_context["paginator"],
         )
 
+        context["snippets"] = render_snippets(search_context["documents"], filters.query) if filters.query else {}
+        context["court_facets"] = self.get_court_facets(filters, search_context["facets"])
+        context["year_facets"] = self.get_year_facets(filters, search_context["facets"])
+
+        export_params = without_page_params(self.request.GET)
+        export_params["publication_status"] = filters.publication_status
+        context["export_url"] = f"{reverse('document-list-export')}?{export_params.urlencode()}"
+
         if self.is_results_view:
             context["page_title"] = "Search results"
 
         return context
 
+    @property
+    def is_fragment_request(self):
+        return self.request.headers.get(FRAGMENT_HEADER) == FRAGMENT_NAME
+
+    def get_template_names(self):
+        if self.is_fragment_request:
+            return [self.fragment_template_name]
+        return super().get_template_names()
+
+    def render_to_response(self, context, **response_kwargs):
+        response = super().render_to_response(context, **response_kwargs)
+        patch_vary_headers(response, [FRAGMENT_HEADER])
+        return response
+
+    def _facet_href(self, **params):
+        """A link to this list with `params` replacing its own, back at the first page. A `None` value removes that
+        parameter."""
+        query_params = without_page_params(self.request.GET)
+        for name, value in params.items():
+            query_params.pop(name, None)
+            if value is not None:
+                query_params[name] = value
+        return f"{self.request.path}?{query_params.urlencode()}"
+
+    def get_court_facets(self, filters, facets):
+        """Each court which the list can be filtered by, with how many documents it has and a link which toggles it as
+        the list's only court."""
+        court_facets = []
+        for code, count in facets.courts.items():
+            court = COURT_TABLES.by_code[code]
+            if court.canonical_param not in COURT_TABLES.by_param:
+                continue
+            selected = filters.courts == [court.canonical_param]
+            court_facets.append(
+                {
+                    "name": court.name,
+                    "count": count,
+                    "selected": selected,
+                    "href": self._facet_href(court=None if selected else court.canonical_param),
+                },
+            )
+        return sorted(court_facets, key=lambda facet: (-facet["count"], facet["name"]))
+
+    def get_year_facets(self, filters, facets):
+        """Each year with documents in the list, newest first, with a link which toggles the list to only that year."""
+        year_facets = []
+        for year, count in sorted(facets.years.items(), reverse=True):
+            selected = filters.from_year == year and filters.to_year == year
+            year_param = None if selected else str(year)
+            year_facets.append(
+                {
+                    "name": str(year),
+                    "count": count,
+                    "selected": selected,
+                    "href": self._facet_href(from_year=year_param, to_year=year_param),
+                },
+            )
+        return year_facets
+
 
 class HomeView(DocumentListView):
     default_publication_status = PUBLICATION_STATUS_UNPUBLISHED
@@ -43,3 +145,51 @@ class ResultsView(DocumentListView):
     template_name = "judgment/results.jinja"
     default_publication_status = PUBLICATION_STATUS_ALL
     is_results_view = True
+
+
+DOCUMENT_LIST_EXPORT_FIELDS = [
+    "uri",
+    "name",
+    "neutral_citation",
+    "court",
+    "date",
+    "status",
+    "submitter",
+    "submitted",
+    "consignment_reference",
+]
+
+
+def _document_list_export_row(result, metadata):
+    submitted = submission_datetime(metadata) if metadata else None
+    return {
+        "uri": result.uri,
+        "name": result.name,
+        "neutral_citation": result.neutral_citation or "",
+        "court": result.court.name if result.court else "",
+        "date": result.date.date().isoformat() if result.date else "",
+        "status": metadata.editor_status if metadata else "",
+        "submitter": metadata.author if metadata else "",
+        "submitted": submitted.isoformat() if submitted else "",
+        "consignment_reference": metadata.consignment_reference if metadata else "",
+    }
+
+
+def _document_list_export_rows(filters):
+    # Each result's own `metadata` costs two MarkLogic calls, so fetch the properties of a whole page in one.
+    for results in iter_search_result_pages(filters):
+        properties = properties_by_uri([result.uri for result in results])
+        for result in results:
+            yield _document_list_export_row(result, properties.get(result.uri))
+
+
+def document_list_export(request):
+    """Download every document matching the document list's filters, as CSV or (with `format=ndjson`) NDJSON."""
+    filters = get_document_list_filters(request.GET, default_publication_status=PUBLICATION_STATUS_ALL)
+
+    return export_response(
+        _document_list_export_rows(filters),
+        fieldnames=DOCUMENT_LIST_EXPORT_FIELDS,
+        filename="documents",
+        export_format=export_format_from_request(request),
+    )
@@ -9,6 +9,7 @@ from django.contrib import messages
 from django.http import HttpResponseRedirect
 from django.urls import reverse
 
+from judgments.utils.document_cache import invalidate_document_caches
 from judgments.utils.view_helpers import DocumentView
 
 if TYPE_CHECKING:
@@ -238,6 +239,7 @@ class DocumentMetadataView(DocumentView):
 
         if changed:
             self.document.save_metadata_fields()
+            invalidate_document_caches(self.document.uri)
             messages.success(request, "Metadata claims updated successfully.")
         else:
             messages.info(request, "No metadata claim changes submitted.")
@@ -2,6 +2,7 @@ from django.contrib import messages
 from django.http import HttpResponseRedirect
 from django.urls import reverse
 
+from judgments.utils.html_cache import invalidate_document_html
 from judgments.utils.view_helpers import get_document_by_uri_or_404
 
 
@@ -9,6 +10,7 @@ def enrich(request):
     document_uri = request.POST.get("document_uri", None)
     document = get_document_by_uri_or_404(document_uri)
     enrichment_triggered = document.enrich(accept_failures=True, even_if_recent=True)
+    invalidate_document_html(document.uri)
     if not enrichment_triggered:
         messages.error(
             request,
@@ -11,6 +11,8 @@ from django.views.generic import View
 
 from judgments.utils import api_client
 from judgments.utils.aws import invalidate_caches
+from judgments.utils.document_cache import invalidate_document_caches
+from judgments.utils.ncn_index import index_document_citations
 from judgments.utils.view_helpers import get_document_by_uri_or_404
 
 
@@ -33,6 +35,7 @@ def update_ncn_of_document(document: Document, new_neutral_citation_number_strin
     document.identifiers.delete_type(NeutralCitationNumber)
     document.identifiers.add(new_neutral_citation)
     document.save_identifiers()
+    index_document_citations(document)
 
     # Set neutral citation in the document XML
     api_client.set_judgment_citation(document.uri, new_neutral_citation.value)
@@ -110,6 +113,7 @@ class EditJudgmentView(View):
         except MarklogicAPIError as e:
             messages.error(request, f"There was an error saving the Document: {e}")
 
+        invalidate_document_caches(judgment.uri)
         if not settings.DEBUG:
             invalidate_caches(judgment.uri)
 
@@ -3,6 +3,7 @@ from django.http import HttpResponseRedirect
 from django.urls import reverse
 
 from judgments.utils.aws import invalidate_caches
+from judgments.utils.document_cache import invalidate_document_caches
 from judgments.utils.link_generators import build_raise_issue_email_link
 from judgments.utils.view_helpers import DocumentView, get_document_by_uri_or_404
 
@@ -36,6 +37,7 @@ def hold(request):
     judgment = get_document_by_uri_or_404(judgment_uri)
     judgment.hold()
     invalidate_caches(judgment.uri)
+    invalidate_document_caches(judgment.uri)
     messages.success(request, "Document successfully put on hold")
     return HttpResponseRedirect(
         reverse("hold-document-success", kwargs={"document_uri": judgment.uri}),
@@ -69,6 +71,7 @@ def unhold(request):
     judgment = get_document_by_uri_or_404(judgment_uri)
     judgment.unhold()
     invalidate_caches(judgment.uri)
+    invalidate_document_caches(judgment.uri)
     messages.success(request, "Document successfully taken off hold")
     return HttpResponseRedirect(
         reverse("unhold-document-success", kwargs={"document_uri": judgment.uri}),
@@ -3,6 +3,7 @@ from django.http import HttpResponseRedirect
 from django.urls import reverse
 
 from judgments.utils.aws import invalidate_caches
+from judgments.utils.document_cache import invalidate_document_caches
 from judgments.utils.link_generators import build_confirmation_email_link
 from judgments.utils.view_helpers import DocumentView, get_document_by_uri_or_404
 
@@ -38,6 +39,7 @@ def publish(request):
     judgment = get_document_by_uri_or_404(judgment_uri)
     judgment.publish()
     invalidate_caches(judgment.uri)
+    invalidate_document_caches(judgment.uri)
     messages.success(request, "Document successfully published")
     return HttpResponseRedirect(
         reverse("publish-document-success", kwargs={"document_uri": judgment.uri}),
@@ -69,6 +71,7 @@ def unpublish(request):
     judgment = get_document_by_uri_or_404(judgment_uri)
     judgment.unpublish()
     invalidate_caches(judgment.uri)
+    invalidate_document_caches(judgment.uri)
     messages.success(
         request,
         "Document successfully unpublished",
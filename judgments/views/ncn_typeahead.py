@@ -0,0 +1,26 @@
+from django.http import JsonResponse
+from django.urls import reverse
+
+from judgments.utils.ncn_index import citations_starting_with
+
+# Fewer characters than this match too many citations to be worth suggesting.
+TYPEAHEAD_MINIMUM_LENGTH = 3
+
+
+def ncn_typeahead(request):
+    """The neutral citations which start with what's been typed so far (`q`), for suggestions in the search box."""
+    prefix = request.GET.get("q", "").strip()
+    entries = citations_starting_with(prefix) if len(prefix) >= TYPEAHEAD_MINIMUM_LENGTH else []
+
+    return JsonResponse(
+        {
+            "results": [
+                {
+                    "neutral_citation": entry.neutral_citation,
+                    "uri": entry.uri,
+                    "url": reverse("full-text-html", kwargs={"document_uri": entry.uri}),
+                }
+                for entry in entries
+            ],
+        },
+    )
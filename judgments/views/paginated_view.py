@@ -2,17 +2,22 @@ from typing import Any
 
 from django.views.generic import TemplateView
 
+from judgments.utils.document_list import without_page_params
+
+
+def _cursor_query_string(cursors):
+    return "".join(f"&{name}={cursor}" for name, cursor in cursors.items() if cursor)
+
 
 class PaginatedView(TemplateView):
     def get_pagination_context(self, request, paginator):
-        query_params = request.GET.copy()
-        query_params.pop("page", None)
+        query_params = without_page_params(request.GET)
 
         query_string = query_params.urlencode()
         base_qs = f"{request.path}?{query_string}&" if query_string else f"{request.path}?"
 
-        def page_href(page_number):
-            return f"{base_qs}page={page_number}"
+        def page_href(page_number, **cursors):
+            return f"{base_qs}page={page_number}{_cursor_query_string(cursors)}"
 
         items = []
 
@@ -63,16 +68,18 @@ class PaginatedView(TemplateView):
             "items": items,
         }
 
+        # Lists which can be paged by cursor give the positions of their first and last documents, so the previous and
+        # next pages can seek straight to them.
         if paginator.get("has_prev_page", False):
             pagination_context["previous"] = {
                 "html": "Previous",
-                "href": page_href(paginator.get("prev_page")),
+                "href": page_href(paginator.get("prev_page"), before=paginator.get("previous_cursor")),
             }
 
         if paginator.get("has_next_page", False):
             pagination_context["next"] = {
                 "html": "Next",
-                "href": page_href(paginator.get("next_page")),
+                "href": page_href(paginator.get("next_page"), after=paginator.get("next_cursor")),
             }
 
         return pagination_context
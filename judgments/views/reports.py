@@ -1,11 +1,36 @@
+import math
+from collections.abc import Callable, Iterable, Iterator
 from typing import Any
 
-from django.views.generic import TemplateView
+from django.contrib import messages
+from django.http import Http404, HttpResponseRedirect
+from django.views.generic import TemplateView, View
 from django.views.generic.detail import DetailView
 from django.views.generic.list import ListView
 
-from judgments.models import BulkReparseRunLog
+from judgments.models import BulkReparseRunLog, QueueDepthSnapshot
+from judgments.models.telemetry import RunStatus
 from judgments.utils import api_client
+from judgments.utils.export import export_format_from_request, export_response
+from judgments.utils.paginator import paginator
+from judgments.utils.queue_depths import queue_trends
+from judgments.utils.report_snapshots import get_report, refresh_report
+from judgments.utils.target_versions import get_target_enrichment_version, get_target_parser_version
+
+from .paginated_view import PaginatedView
+
+# The most rows of a report shown on one page.
+REPORT_PAGE_SIZE = 100
+
+# The deepest page of a report which can be shown. Finding a page means asking for every row before it, so anything
+# deeper is left to the export.
+REPORT_MAX_PAGE = 100
+
+# The most rows of a report downloaded in one export.
+REPORT_EXPORT_LIMIT = 100_000
+
+# How many rows an export asks MarkLogic for first. Each later query asks for twice as many.
+REPORT_EXPORT_FIRST_FETCH = 1_000
 
 
 class Index(TemplateView):
@@ -17,6 +42,10 @@ class Index(TemplateView):
 
         context["page_title"] = "Reports"
 
+        latest = QueueDepthSnapshot.objects.first()
+        context["queue_depths_recorded_at"] = latest.recorded_at if latest else None
+        context["queue_trends"] = queue_trends(latest) if latest else []
+
         return context
 
 
@@ -32,81 +61,168 @@ def get_rows_from_result(result: list | list[list[Any]]) -> list[list[Any]]:
     return []
 
 
-class AwaitingParse(TemplateView):
+class BulkReparseRunLogListView(ListView):
+    model = BulkReparseRunLog
+    paginate_by = 50
+
     template_engine = "jinja"
-    template_name = "reports/awaiting_parse.jinja"
+    template_name = "reports/bulk_reparse_run_log_list.jinja"
 
-    def get_context_data(self, **kwargs):
-        context = super().get_context_data(**kwargs)
 
-        try:
-            target_parser_version = api_client.get_highest_parser_version()
-        except (TypeError, ValueError):
-            target_parser_version = (0, 0)
+class BulkReparseRunLogDetailView(DetailView):
+    model = BulkReparseRunLog
 
-        context["page_title"] = "Documents awaiting reparsing"
-        context["target_parser_version"] = f"{target_parser_version[0]}.{target_parser_version[1]}"
-        context["report_limit"] = 200
+    template_engine = "jinja"
+    template_name = "reports/bulk_reparse_run_log_detail.jinja"
 
-        context["total"] = api_client.get_count_pending_parse_for_version(
-            target_parser_version,
-        )
 
-        context["documents"] = get_rows_from_result(
-            api_client.get_documents_pending_parse_for_version(
-                target_parser_version,
-                context["report_limit"],
+def _version_or_zero(get_version: Callable[[], tuple[int, int]]) -> tuple[int, int]:
+    try:
+        return get_version()
+    except (TypeError, ValueError):
+        return (0, 0)
+
+
+# Neither query can start part way through its results, so a page is found by asking for every row up to the end of it
+# (and one more, to tell whether there's another page) and keeping only the rows on the page.
+
+
+def _rows_on_page(rows: list[list[Any]], page: int) -> list[list[Any]]:
+    return rows[(page - 1) * REPORT_PAGE_SIZE :]
+
+
+def pending_parse_rows(data: dict[str, Any], page: int) -> list[list[Any]]:
+    """The rows of the awaiting parse report on `page`, and the first row of the next page if there is one."""
+    major, minor = data["parser_version"]
+    return _rows_on_page(
+        get_rows_from_result(
+            api_client.get_documents_pending_parse_for_version((major, minor), page * REPORT_PAGE_SIZE + 1),
+        ),
+        page,
+    )
+
+
+def pending_enrichment_rows(data: dict[str, Any], page: int) -> list[list[Any]]:
+    """The rows of the awaiting enrichment report on `page`, and the first row of the next page if there is one."""
+    enrichment_major, enrichment_minor = data["enrichment_version"]
+    parser_major, parser_minor = data["parser_version"]
+    return _rows_on_page(
+        get_rows_from_result(
+            api_client.get_pending_enrichment_for_version(
+                target_enrichment_version=(enrichment_major, enrichment_minor),
+                target_parser_version=(parser_major, parser_minor),
+                maximum_records=page * REPORT_PAGE_SIZE + 1,
             ),
-        )
+        ),
+        page,
+    )
 
-        return context
 
+def awaiting_parse_report() -> dict[str, Any]:
+    target_parser_version = _version_or_zero(get_target_parser_version)
 
-class BulkReparseRunLogListView(ListView):
-    model = BulkReparseRunLog
-    paginate_by = 50
+    data: dict[str, Any] = {
+        "target_parser_version": f"{target_parser_version[0]}.{target_parser_version[1]}",
+        "parser_version": list(target_parser_version),
+        "total": api_client.get_count_pending_parse_for_version(target_parser_version),
+    }
+    data["documents"] = pending_parse_rows(data, 1)
+    return data
 
-    template_engine = "jinja"
-    template_name = "reports/bulk_reparse_run_log_list.jinja"
 
+def awaiting_enrichment_report() -> dict[str, Any]:
+    target_enrichment_version = _version_or_zero(get_target_enrichment_version)
+    target_parser_version = _version_or_zero(get_target_parser_version)
 
-class BulkReparseRunLogDetailView(DetailView):
-    model = BulkReparseRunLog
+    data: dict[str, Any] = {
+        "target_enrichment_version": f"{target_enrichment_version[0]}.{target_enrichment_version[1]}",
+        "target_parser_version": f"{target_parser_version[0]}.{target_parser_version[1]}",
+        "enrichment_version": list(target_enrichment_version),
+        "parser_version": list(target_parser_version),
+    }
+    data["documents"] = pending_enrichment_rows(data, 1)
+    return data
 
-    template_engine = "jinja"
-    template_name = "reports/bulk_reparse_run_log_detail.jinja"
+
+# Reports which are computed ahead of time by the refresh_reports management command, by name. Each snapshot holds the
+# first page of its report; later pages are queried when they're asked for.
+SNAPSHOT_REPORTS: dict[str, Callable[[], dict[str, Any]]] = {
+    "awaiting_parse": awaiting_parse_report,
+    "awaiting_enrichment": awaiting_enrichment_report,
+}
 
 
-class AwaitingEnrichment(TemplateView):
+class SnapshotReportView(PaginatedView):
+    """A paginated report whose first page is shown from its last snapshot, which editors can refresh by posting to
+    it."""
+
     template_engine = "jinja"
-    template_name = "reports/awaiting_enrichment.jinja"
+    report_name: str
+    page_title: str
+
+    def rows_on_page(self, data: dict[str, Any], page: int) -> list[list[Any]]:
+        raise NotImplementedError
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
 
-        try:
-            target_enrichment_version = api_client.get_highest_enrichment_version()
-        except (TypeError, ValueError):
-            target_enrichment_version = (0, 0)
+        snapshot = get_report(self.report_name, SNAPSHOT_REPORTS[self.report_name])
 
         try:
-            target_parser_version = api_client.get_highest_parser_version()
-        except (TypeError, ValueError):
-            target_parser_version = (0, 0)
-
-        context["page_title"] = "Documents awaiting enrichment"
-        context["target_enrichment_version"] = f"{target_enrichment_version[0]}.{target_enrichment_version[1]}"
-        context["target_parser_version"] = f"{target_parser_version[0]}.{target_parser_version[1]}"
-
-        context["documents"] = get_rows_from_result(
-            api_client.get_pending_enrichment_for_version(
-                target_enrichment_version=target_enrichment_version,
-                target_parser_version=target_parser_version,
-            ),
+            page = max(1, int(self.request.GET.get("page", 1)))
+        except ValueError:
+            page = 1
+
+        if "total" in snapshot.data:
+            page = min(page, max(1, math.ceil(snapshot.data["total"] / REPORT_PAGE_SIZE)))
+        if page > REPORT_MAX_PAGE:
+            msg = f"Only the first {REPORT_MAX_PAGE} pages of this report can be shown; download it to see the rest"
+            raise Http404(msg)
+
+        rows = snapshot.data["documents"] if page == 1 else self.rows_on_page(snapshot.data, page)
+        first_row = (page - 1) * REPORT_PAGE_SIZE
+
+        # Without a count of every row, count those up to the next page, so there's a link to it.
+        total = min(snapshot.data.get("total", first_row + len(rows)), REPORT_MAX_PAGE * REPORT_PAGE_SIZE)
+
+        context["page_title"] = self.page_title
+        context.update(snapshot.data)
+        context["documents"] = rows[:REPORT_PAGE_SIZE]
+        context["first_row_number"] = first_row + 1
+        context["has_more"] = len(rows) > REPORT_PAGE_SIZE
+        context["pagination_data"] = self.get_pagination_context(
+            request=self.request,
+            paginator=paginator(page, total, REPORT_PAGE_SIZE),
         )
+        context["report_as_of"] = snapshot.as_of
+        context["report_is_refreshing"] = snapshot.is_refreshing
 
         return context
 
+    def post(self, request, *args, **kwargs):
+        if refresh_report(self.report_name, SNAPSHOT_REPORTS[self.report_name]) is None:
+            messages.info(request, "This report is already being refreshed. Reload the page in a minute to see it.")
+
+        return HttpResponseRedirect(request.path)
+
+
+class AwaitingParse(SnapshotReportView):
+    template_name = "reports/awaiting_parse.jinja"
+    report_name = "awaiting_parse"
+    page_title = "Documents awaiting reparsing"
+
+    def rows_on_page(self, data, page):
+        return pending_parse_rows(data, page)
+
+
+class AwaitingEnrichment(SnapshotReportView):
+    template_name = "reports/awaiting_enrichment.jinja"
+    report_name = "awaiting_enrichment"
+    page_title = "Documents awaiting enrichment"
+
+    def rows_on_page(self, data, page):
+        return pending_enrichment_rows(data, page)
+
 
 class LockedDocuments(TemplateView):
     template_engine = "jinja"
@@ -122,3 +238,134 @@ class LockedDocuments(TemplateView):
         context["lock_count"] = len(context["locks"])
 
         return context
+
+
+def limit_export(fieldnames: list[str], rows: Iterable[dict[str, Any]]) -> Iterator[dict[str, Any]]:
+    """The first `REPORT_EXPORT_LIMIT` of `rows`, followed by a row saying so if there were more."""
+    for number, row in enumerate(rows):
+        if number == REPORT_EXPORT_LIMIT:
+            yield {fieldnames[0]: f"Export stopped at {REPORT_EXPORT_LIMIT:,} rows; there are more"}
+            return
+        yield row
+
+
+def fetch_in_pages[T](fetch: Callable[[int], list[T]], first: list[T] | None = None) -> Iterator[T]:
+    """Every row `fetch` returns when asked for up to `REPORT_EXPORT_LIMIT` and one more (so `limit_export` can tell
+    whether there are more), starting with `first` if it's already been fetched with `REPORT_EXPORT_FIRST_FETCH`.
+
+    MarkLogic's report queries can't start part way through their results, so each page asks for every row up to the
+    end of it (twice as many as the last) and only the new rows are kept. If the queue changes between queries, a row may
+    be skipped or repeated at the end of a page."""
+    maximum = REPORT_EXPORT_FIRST_FETCH
+    rows = fetch(maximum) if first is None else first
+    fetched = 0
+    while True:
+        yield from rows[fetched:]
+        if len(rows) < maximum or maximum > REPORT_EXPORT_LIMIT:
+            return
+        fetched = len(rows)
+        maximum = min(maximum * 2, REPORT_EXPORT_LIMIT + 1)
+        rows = fetch(maximum)
+
+
+class ReportExportView(View):
+    """A download of every row of a report, as CSV or (with `format=ndjson`) NDJSON. Rows are written out as they're
+    produced, rather than rendered into a table. An export stops at `REPORT_EXPORT_LIMIT` rows, and then ends with a row
+    saying so."""
+
+    filename: str
+
+    def get_export(self) -> tuple[list[str], Iterable[dict[str, Any]]]:
+        """The export's column names, and its rows."""
+        raise NotImplementedError
+
+    def get(self, request, *args, **kwargs):
+        fieldnames, rows = self.get_export()
+        return export_response(
+            limit_export(fieldnames, rows),
+            fieldnames=fieldnames,
+            filename=self.filename,
+            export_format=export_format_from_request(request),
+        )
+
+
+def table_export(fetch: Callable[[int], list | list[list[Any]]]) -> tuple[list[str], Iterable[dict[str, Any]]]:
+    """The column names and rows of a MarkLogic table query (see `get_rows_from_result`), for `ReportExportView`.
+    `fetch` returns the result of the query for up to the given number of rows."""
+    result = fetch(REPORT_EXPORT_FIRST_FETCH)
+    fieldnames = [str(name) for name in (result[0] if isinstance(result[0], list) else result)]
+    rows = fetch_in_pages(
+        lambda maximum: get_rows_from_result(fetch(maximum)),
+        first=get_rows_from_result(result),
+    )
+    return fieldnames, (dict(zip(fieldnames, row, strict=True)) for row in rows)
+
+
+class AwaitingParseExport(ReportExportView):
+    filename = "awaiting-parse"
+
+    def get_export(self):
+        target_parser_version = _version_or_zero(get_target_parser_version)
+        return table_export(
+            lambda maximum: api_client.get_documents_pending_parse_for_version(target_parser_version, maximum),
+        )
+
+
+class AwaitingEnrichmentExport(ReportExportView):
+    filename = "awaiting-enrichment"
+
+    def get_export(self):
+        target_enrichment_version = _version_or_zero(get_target_enrichment_version)
+        target_parser_version = _version_or_zero(get_target_parser_version)
+        return table_export(
+            lambda maximum: api_client.get_pending_enrichment_for_version(
+                target_enrichment_version=target_enrichment_version,
+                target_parser_version=target_parser_version,
+                maximum_records=maximum,
+            ),
+        )
+
+
+class LockedDocumentsExport(ReportExportView):
+    filename = "locked-documents"
+
+    def get_export(self):
+        rows = (
+            {
+                "document_uri": lock.document_uri,
+                "owner": lock.owner,
+                "timestamp": lock.timestamp.isoformat(),
+                "timeout": lock.timeout,
+            }
+            for lock in api_client.get_locked_documents()
+        )
+        return ["document_uri", "owner", "timestamp", "timeout"], rows
+
+
+BULK_REPARSE_RUN_LOG_EXPORT_FIELDS = [
+    "start_time",
+    "end_time",
+    "status",
+    "target_parser_version",
+    "documents_in_queue",
+    "documents_selected",
+    "documents_attempted",
+    "documents_skipped",
+    "documents_failed",
+]
+
+
+class BulkReparseRunLogExport(ReportExportView):
+    filename = "bulk-reparse-run-logs"
+
+    def get_export(self):
+        rows = (
+            {
+                **run_log,
+                "start_time": run_log["start_time"].isoformat(),
+                "end_time": run_log["end_time"].isoformat() if run_log["end_time"] else "",
+                "status": RunStatus(run_log["status"]).label if run_log["status"] else "",
+            }
+            for run_log in BulkReparseRunLog.objects.values(*BULK_REPARSE_RUN_LOG_EXPORT_FIELDS).iterator()
+        )
+        return BULK_REPARSE_RUN_LOG_EXPORT_FIELDS, rows
@@ -13,11 +13,12 @@ from django.core.validators import validate_email
 from django.http import HttpResponseRedirect
 from django.shortcuts import render
 from django.views.generic import TemplateView
-from ds_caselaw_utils.courts import CourtNotFoundException, courts
-from ds_caselaw_utils.types import CourtCode
 from lxml import etree
 
 from judgments.utils import api_client
+from judgments.utils.court_tables import COURT_TABLES
+from judgments.utils.document_cache import invalidate_document_caches
+from judgments.utils.ncn_index import index_document_citations
 from judgments.utils.view_helpers import (
     user_is_editor,
     user_is_superuser,
@@ -31,12 +32,13 @@ ANNOTATION = VersionAnnotation(
 )
 
 
+COURT_CHOICES = (("", "Select a court"), *COURT_TABLES.choices)
+
+
 def is_valid_court(court_code):
-    try:
-        _court = courts.get_court_by_code(CourtCode(court_code.upper()))
-    except CourtNotFoundException as error:
+    if court_code.upper() not in COURT_TABLES.by_code:
         msg = f"Court code {court_code} not recognised"
-        raise ValidationError(msg) from error
+        raise ValidationError(msg)
 
 
 def is_valid_or_empty_ncn(ncn):
@@ -145,6 +147,7 @@ class StubForm(forms.Form):
     )
     court_code = forms.ChoiceField(
         label="Court code",
+        choices=COURT_CHOICES,
         validators=[is_valid_court],
         error_messages={
             "required": "Select the court code",
@@ -202,10 +205,6 @@ class StubForm(forms.Form):
         # Hide colons from field names
         for field in self.fields.values():
             field.label_suffix = ""
-        court_choices = courts.get_all(with_jurisdictions=True)
-        court_field = self.fields["court_code"]
-        if isinstance(court_field, forms.ChoiceField):
-            court_field.choices = [("", "Select a court")] + [(court.code, court.name) for court in court_choices]
 
 
 class CreateStubView(TemplateView):
@@ -290,6 +289,9 @@ def create_stub(request):
         document = api_client.get_document_by_uri(document_uri)
         document.identifiers.add(NeutralCitationNumber(ncn.strip()))
         document.save_identifiers()
+        index_document_citations(document)
+
+    invalidate_document_caches(document_uri)
 
     messages.success(
         request,
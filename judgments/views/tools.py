@@ -5,6 +5,7 @@ from django.views.generic import TemplateView
 
 from judgments.utils import api_client
 from judgments.utils.view_helpers import user_is_developer
+from judgments.views.reports import ReportExportView, fetch_in_pages
 
 MISSING_FCLID_REPORT_LIMIT = 200
 
@@ -48,3 +49,19 @@ class MissingFclid(DeveloperRequiredMixin, TemplateView):
         context["results_capped"] = context["document_count"] >= MISSING_FCLID_REPORT_LIMIT
 
         return context
+
+
+class MissingFclidExport(DeveloperRequiredMixin, ReportExportView):
+    filename = "missing-fclid"
+
+    def get_export(self):
+        rows = (
+            {
+                "marklogic_uri": marklogic_uri,
+                "document_uri": MarkLogicDocumentURIString(marklogic_uri).as_document_uri(),
+            }
+            for marklogic_uri in fetch_in_pages(
+                lambda maximum: api_client.get_missing_fclid(maximum_records=maximum),
+            )
+        )
+        return ["marklogic_uri", "document_uri"], rows
@@ -6,6 +6,7 @@ from django.urls import reverse
 from django.views.decorators.http import require_http_methods
 
 from judgments.utils import api_client
+from judgments.utils.document_cache import invalidate_document_caches
 from judgments.utils.view_helpers import get_document_by_uri_or_404
 
 
@@ -40,6 +41,7 @@ def unlock_post(request):
     try:
         judgment = get_document_by_uri_or_404(judgment_uri)
         api_client.break_checkout(judgment.uri)
+        invalidate_document_caches(judgment.uri)
     except MarklogicResourceUnmanagedError as exc:
         msg = f"Resource Unmanaged: Document '{judgment_uri}' might not exist."
         raise Http404(
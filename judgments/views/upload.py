@@ -6,6 +6,7 @@ from django.http import HttpResponseRedirect
 from django.urls import reverse
 
 from judgments.templatetags.navigation_tags import get_navigation_items_logic
+from judgments.utils.document_cache import invalidate_document_caches
 from judgments.utils.view_helpers import DocumentView, get_document_by_uri_or_404
 
 MAX_UPLOAD_SIZE = 20 * 1024 * 1024  # 20 MB
@@ -86,6 +87,7 @@ def upload(request):
     file = request.FILES["file"]
     upload_data = file.read()  # the bytes of the file
     upload_asset_to_private_bucket(body=upload_data, s3_key=s3_key)
+    invalidate_document_caches(judgment.uri)
     messages.success(request, "Asset successfully uploaded to {s3_key}")
     return HttpResponseRedirect(
         reverse("upload-document-success", kwargs={"document_uri": judgment.uri}),